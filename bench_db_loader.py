@@ -0,0 +1,147 @@
+"""Benchmark of the two JobDatabase.insert_jobs loaders at writer batch sizes.
+
+Builds the schema in its own Postgres schema (``jobs_loader_bench``) and
+loads synthetic insert rows in batches of --batch-rows (JobWriter flushes
+WRITER_BATCH_ROWS, 1000 by default), once through execute_values and once
+through COPY into the staging table plus merge, into an emptied jobs table
+each time. Descriptions are either realistic postings of a few KB or a
+single short sentence.
+
+    BENCH_DATABASE_URL=postgresql://... python bench_db_loader.py --rows 10000
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import time
+from datetime import date, timedelta
+
+import psycopg2
+from psycopg2.extensions import make_dsn
+
+from main import JOB_COLUMNS, LOADER_COPY, LOADER_VALUES, JobDatabase
+
+SCHEMA = "jobs_loader_bench"
+
+WORDS = [
+    "team", "build", "scale", "design", "deliver", "product", "customers",
+    "platform", "services", "data", "pipelines", "reliable", "secure",
+    "python", "java", "aws", "react", "kubernetes", "docker", "postgres",
+    "remote", "hybrid", "office", "growth", "mentor", "engineering",
+    "ownership", "agile", "testing", "review", "deploy", "monitor", "with",
+    "and", "the", "our", "you", "will", "experience", "years", "strong",
+]  # fmt: skip
+
+
+def synthetic_rows(count, long_descriptions, seed=0):
+    """Insert tuples in JOB_COLUMNS order, like _prepare_job_rows returns"""
+    rng = random.Random(seed)
+    today = date.today()
+    rows = []
+    for i in range(count):
+        if long_descriptions:
+            # 500-1500 words, 3-10KB of text over several lines
+            words = rng.choices(WORDS, k=rng.randint(500, 1500))
+            description = "\n".join(
+                " ".join(words[start : start + 40])
+                for start in range(0, len(words), 40)
+            )
+        else:
+            description = f"Build services in python for team {i % 50}."
+        row = (
+            f"bench-{i}",
+            rng.choice(["linkedin", "indeed", "glassdoor"]),
+            f"https://example.com/jobs/{i}",
+            f"https://careers.example.com/{i}" if i % 3 else None,
+            f"Senior Engineer {i}",
+            f"Company {i % 300}",
+            "Berlin, BE, Germany",
+            today - timedelta(days=i % 30),
+            "fulltime",
+            "direct_data" if i % 4 == 0 else None,
+            55000.0 if i % 4 == 0 else None,
+            80000.0 if i % 4 == 0 else None,
+            "EUR" if i % 4 == 0 else None,
+            i % 2 == 0,
+            "mid-senior level",
+            "Engineering",
+            None,
+            "jobs@example.com" if i % 9 == 0 else None,
+            description,
+            "Software",
+            f"https://example.com/company/{i % 300}",
+            None,
+            None,
+            "We build software." if i % 5 == 0 else None,
+            None,
+            "senior",
+            "python",
+            "python,aws,docker",
+            "Berlin",
+            "Germany",
+            "backend",
+            "product",
+        )
+        content_hash = hashlib.blake2b(repr(row).encode(), digest_size=16)
+        rows.append(row + (content_hash.hexdigest(),))
+    assert len(rows[0]) == len(JOB_COLUMNS)
+    return rows
+
+
+def load(db, load_batch, rows, batch_rows):
+    with db.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("TRUNCATE jobs")
+            conn.commit()
+    started = time.perf_counter()
+    written = 0
+    for start in range(0, len(rows), batch_rows):
+        written += len(load_batch(rows[start : start + batch_rows]))
+    assert written == len(rows), (written, len(rows))
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--batch-rows", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    url = os.getenv("BENCH_DATABASE_URL")
+    if not url:
+        raise SystemExit("Set BENCH_DATABASE_URL to a database to benchmark in")
+    with psycopg2.connect(url) as conn:
+        with conn.cursor() as cur:
+            cur.execute(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}")
+    db = JobDatabase(make_dsn(url, options=f"-c search_path={SCHEMA},public"))
+    loaders = {LOADER_VALUES: db._insert_values, LOADER_COPY: db._copy_jobs}
+    try:
+        print(
+            f"{'rows':>7} {'batch':>6} {'description':>11} "
+            f"{'values s':>9} {'copy s':>9} {'copy/values':>12}"
+        )
+        for long_descriptions in (True, False):
+            for count in args.rows:
+                rows = synthetic_rows(count, long_descriptions)
+                for batch_rows in args.batch_rows:
+                    seconds = {
+                        name: min(
+                            load(db, load_batch, rows, batch_rows)
+                            for _ in range(args.repeat)
+                        )
+                        for name, load_batch in loaders.items()
+                    }
+                    values, copy = seconds[LOADER_VALUES], seconds[LOADER_COPY]
+                    print(
+                        f"{count:>7} {batch_rows:>6} "
+                        f"{'long' if long_descriptions else 'short':>11} "
+                        f"{values:>9.2f} {copy:>9.2f} {copy / values:>12.2f}"
+                    )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
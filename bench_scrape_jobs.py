@@ -0,0 +1,136 @@
+"""Benchmark of the DataFrame assembly at the end of scrape_jobs.
+
+Flattens synthetic JobPosts the way scrape_jobs does and times building the
+result DataFrame column-wise (_jobs_dataframe) against the old assembly of
+one DataFrame per job, dropna and concat. Both results are checked to be
+identical, cell types and missing-value markers included.
+
+    python bench_scrape_jobs.py --jobs 100 1000 10000
+"""
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+from jobspy import _flatten_job, _jobs_dataframe
+from jobspy.model import (
+    Compensation,
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobType,
+    Location,
+)
+from jobspy.util import desired_order
+
+SITES = ["linkedin", "indeed", "glassdoor", "google", "naukri"]
+
+
+def synthetic_jobs(count, seed=0):
+    """(site, JobPost) pairs with a realistic mix of missing fields"""
+    rng = random.Random(seed)
+    today = date.today()
+    jobs = []
+    for i in range(count):
+        site = SITES[i % len(SITES)]
+        compensation = None
+        if rng.random() < 0.3:
+            low = rng.choice([40, 55000, 4200.5])
+            compensation = Compensation(
+                interval=rng.choice(list(CompensationInterval)),
+                min_amount=low,
+                max_amount=low * 1.5,
+                currency="USD",
+            )
+        description = "Build services in python. " * rng.randint(5, 40)
+        if rng.random() < 0.2:
+            description += "Salary $90,000 - $120,000 per year."
+        jobs.append(
+            (
+                site,
+                JobPost(
+                    id=f"{site}-{i}",
+                    title=f"Engineer {i}",
+                    company_name=f"Company {i % 300}" if i % 17 else None,
+                    job_url=f"https://example.com/jobs/{i}",
+                    job_url_direct=(
+                        f"https://careers.example.com/{i}" if i % 3 else None
+                    ),
+                    location=Location(city="Berlin", country=Country.GERMANY),
+                    description=description if i % 11 else None,
+                    job_type=[JobType.FULL_TIME] if i % 4 else None,
+                    compensation=compensation,
+                    date_posted=(
+                        today - timedelta(days=rng.randint(0, 30)) if i % 7 else None
+                    ),
+                    emails=["jobs@example.com"] if i % 9 == 0 else None,
+                    is_remote=rng.choice([True, False, None]),
+                    job_level="mid-senior level" if site == "linkedin" else None,
+                    company_industry="Software" if i % 2 else None,
+                    company_num_employees="51-200" if site == "indeed" else None,
+                    skills=["python", "sql"] if site == "naukri" else None,
+                    experience_range="2-5 Yrs" if site == "naukri" else None,
+                ),
+            )
+        )
+    return jobs
+
+
+def per_job_frames(job_rows):
+    """The assembly _jobs_dataframe replaced"""
+    if not job_rows:
+        return pd.DataFrame()
+    jobs_dfs = [pd.DataFrame([job_data]) for job_data in job_rows]
+    filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
+    jobs_df = pd.concat(filtered_dfs, ignore_index=True)
+    for column in desired_order:
+        if column not in jobs_df.columns:
+            jobs_df[column] = None
+    jobs_df = jobs_df[desired_order]
+    return jobs_df.sort_values(
+        by=["site", "date_posted"], ascending=[True, False]
+    ).reset_index(drop=True)
+
+
+def assert_identical(expected, actual):
+    pd.testing.assert_frame_equal(expected, actual, check_exact=True)
+    # assert_frame_equal treats None and NaN alike; the cells must match too
+    for column in expected.columns:
+        for a, b in zip(expected[column].tolist(), actual[column].tolist()):
+            assert type(a) is type(b), (column, a, b)
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - started)
+    return min(samples) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'jobs':>6} {'per-job ms':>11} {'columnar ms':>12} {'speedup':>8}")
+    for count in args.jobs:
+        job_rows = [
+            _flatten_job(job, site, Country.USA, False)
+            for site, job in synthetic_jobs(count)
+        ]
+        before, expected = timed(
+            lambda rows=job_rows: per_job_frames(rows), args.repeat
+        )
+        after, actual = timed(lambda rows=job_rows: _jobs_dataframe(rows), args.repeat)
+        assert_identical(expected, actual)
+        print(f"{count:>6} {before:>11.1f} {after:>12.1f} {before / after:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
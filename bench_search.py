@@ -0,0 +1,212 @@
+"""Latency benchmark for JobDatabase.search_jobs on a synthetic jobs table.
+
+Builds the schema in its own Postgres schema (``jobs_search_bench``), fills
+it with synthetic postings via generate_series and reports p50/p95 latency
+of typical searches, next to the sequential ILIKE scan they replace.
+
+    BENCH_DATABASE_URL=postgresql://... python bench_search.py --rows 1000000
+
+Pass --keep to reuse the generated table on the next run.
+"""
+
+import argparse
+import os
+import time
+from datetime import date, timedelta
+
+import psycopg2
+from psycopg2.extensions import make_dsn
+
+from main import JobDatabase
+
+SCHEMA = "jobs_search_bench"
+
+# Filler is drawn uniformly, so every description contains most of it.
+# Technical terms follow a Zipf distribution: TECH_TERMS[0] appears in most
+# postings, later ones in fewer, and a long tail of "t<rank>" terms (up to
+# rank TAIL_TERMS) in only a handful each.
+FILLER = [
+    "team", "build", "scale", "design", "deliver", "product", "customers",
+    "platform", "services", "data", "pipelines", "reliable", "secure",
+    "remote", "hybrid", "office", "growth", "mentor", "engineering",
+    "ownership", "agile", "testing", "review", "deploy", "monitor", "with",
+    "and", "the", "our", "you", "will", "experience", "years", "strong",
+]  # fmt: skip
+TECH_TERMS = [
+    "python", "java", "aws", "react", "typescript", "kubernetes", "docker",
+    "postgres", "golang", "kafka", "terraform", "spark", "gcp", "azure",
+    "django", "spring", "airflow", "graphql", "rust", "flask", "android",
+    "ios", "scala", "redis", "elixir",
+]  # fmt: skip
+TAIL_TERMS = 30000
+TECH_SHARE = 0.15
+
+FILL_QUERY = """
+INSERT INTO jobs (
+    id, site, title, company, description, tech_tags, position_tag,
+    seniority_level, country_normalized, date_posted
+)
+SELECT
+    'bench-' || g,
+    (ARRAY['linkedin', 'indeed', 'glassdoor'])[1 + g %% 3],
+    (ARRAY['Senior', 'Junior', 'Staff', 'Lead', 'Principal'])[1 + g %% 5] || ' '
+        || (ARRAY['Backend', 'Frontend', 'Data', 'Platform', 'Mobile'])[1 + g %% 7 %% 5]
+        || ' Engineer',
+    'Company ' || (g %% 20000),
+    array_to_string(ARRAY(
+        SELECT CASE
+            WHEN random() >= %(tech_share)s
+                THEN (%(filler)s::text[])[1 + floor(random() * %(filler_count)s)::int]
+            WHEN rank <= %(tech_count)s THEN (%(tech)s::text[])[rank]
+            ELSE 't' || rank
+        END
+        FROM (
+            -- Referencing g makes the subquery run once per row
+            SELECT floor(exp(random() * ln(%(tail)s)))::int AS rank
+            FROM generate_series(1, %(description_words)s + g %% 50)
+        ) tokens
+    ), ' '),
+    (ARRAY['python,aws', 'java,spring', 'react,typescript', 'go,kubernetes'])[1 + g %% 4],
+    (ARRAY['backend', 'frontend', 'data', 'devops', 'mobile'])[1 + g %% 5],
+    (ARRAY['junior', 'mid', 'senior', 'lead'])[1 + g / 3 %% 4],
+    (ARRAY['Germany', 'Netherlands', 'United States', 'Poland'])[1 + g / 11 %% 4],
+    CURRENT_DATE - (g %% 30)
+FROM generate_series(1, %(rows)s) AS g
+"""
+
+
+def build(db, rows, description_words):
+    with db.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT count(*) FROM jobs")
+            if cur.fetchone()[0] == rows:
+                print(f"Reusing {rows} synthetic jobs")
+                return
+            # Bulk load without the search indexes, then let create_tables
+            # build them the way production does
+            cur.execute("TRUNCATE jobs")
+            cur.execute(
+                "DROP INDEX IF EXISTS idx_jobs_search_vector, idx_jobs_search_date, "
+                "idx_jobs_title_trgm, idx_jobs_company_trgm"
+            )
+            conn.commit()
+            started = time.perf_counter()
+            cur.execute(
+                FILL_QUERY,
+                {
+                    "filler": FILLER,
+                    "filler_count": len(FILLER),
+                    "tech": TECH_TERMS,
+                    "tech_count": len(TECH_TERMS),
+                    "tech_share": TECH_SHARE,
+                    "tail": TAIL_TERMS,
+                    "description_words": description_words,
+                    "rows": rows,
+                },
+            )
+            conn.commit()
+            print(f"Inserted {rows} jobs in {time.perf_counter() - started:.1f}s")
+    started = time.perf_counter()
+    db.create_tables()
+    print(f"Built indexes in {time.perf_counter() - started:.1f}s")
+    with db.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("ANALYZE jobs")
+            conn.commit()
+
+
+def timed(fn, repeat):
+    fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2], samples[int(len(samples) * 0.95)], result
+
+
+def ilike_scan(db, word):
+    with db.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT id FROM jobs WHERE description ILIKE %s "
+                "ORDER BY COALESCE(date_posted, created_at::date) DESC, id DESC "
+                "LIMIT 20",
+                (f"%{word}%",),
+            )
+            return cur.fetchall()
+
+
+def deep_page(db, query, pages):
+    page = db.search_jobs(query)
+    for _ in range(pages - 1):
+        page = db.search_jobs(query, after=page.after)
+    return page
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--description-words", type=int, default=250)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--keep", action="store_true")
+    args = parser.parse_args()
+
+    url = os.getenv("BENCH_DATABASE_URL")
+    if not url:
+        raise SystemExit("Set BENCH_DATABASE_URL to a database to benchmark in")
+    with psycopg2.connect(url) as conn:
+        with conn.cursor() as cur:
+            cur.execute(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}")
+    db = JobDatabase(make_dsn(url, options=f"-c search_path={SCHEMA},public"))
+    try:
+        build(db, args.rows, args.description_words)
+        since = date.today() - timedelta(days=7)
+        cases = [
+            ("common term", lambda: db.search_jobs("python")),
+            ("mid-frequency term", lambda: db.search_jobs("kafka")),
+            ("two terms", lambda: db.search_jobs("docker terraform")),
+            ("rare term", lambda: db.search_jobs("t5000")),
+            ("phrase", lambda: db.search_jobs('"data pipelines" -java')),
+            (
+                "term + filters",
+                lambda: db.search_jobs(
+                    "kafka",
+                    {
+                        "position_tag": "devops",
+                        "seniority_level": ["senior", "lead"],
+                        "country_normalized": "Germany",
+                        "posted_since": since,
+                    },
+                ),
+            ),
+            (
+                "filters only",
+                lambda: db.search_jobs(
+                    filters={"country_normalized": "Poland", "posted_since": since}
+                ),
+            ),
+            (
+                "company substring",
+                lambda: db.search_jobs(filters={"company": "y 1234"}),
+            ),
+            ("page 10, common term", lambda: deep_page(db, "python", 10)),
+            ("ILIKE rare term (before)", lambda: ilike_scan(db, "t5000 ")),
+        ]
+        print(f"{'case':<26} {'p50 ms':>9} {'p95 ms':>9} {'rows':>5}")
+        for name, fn in cases:
+            p50, p95, result = timed(fn, args.repeat)
+            rows = len(result.jobs) if hasattr(result, "jobs") else len(result)
+            print(f"{name:<26} {p50:>9.1f} {p95:>9.1f} {rows:>5}")
+    finally:
+        if not args.keep:
+            with db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+                    conn.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""Benchmark of TechTagMatcher's trie against one substring scan per needle.
+
+Times tagging the example.json postings through the trie pattern, whatever
+the dictionary size, with the shipped tech_tags.json and with that dictionary
+extended by the first --extra-tags entries of EXTRA_TAGS, the kind of
+technologies a tag dictionary grows to cover. Both strategies are checked to
+return the same tags for every posting. The break-even point sets
+classifier.TRIE_MIN_NEEDLES.
+
+    python bench_tech_tags.py --extra-tags 0 50 100 150
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from jobspy.classifier import TECH_TAGS_PATH, TechTagMatcher
+
+EXAMPLE_JOBS = Path(__file__).with_name("example.json")
+
+EXTRA_TAGS = {
+    "graphql": ["graphql"],
+    "elasticsearch": ["elasticsearch", "elastic search"],
+    "jenkins": ["jenkins"],
+    "gitlab": ["gitlab"],
+    "github actions": ["github actions"],
+    "circleci": ["circleci"],
+    "helm": [" helm "],
+    "prometheus": ["prometheus"],
+    "grafana": ["grafana"],
+    "datadog": ["datadog"],
+    "splunk": ["splunk"],
+    "new relic": ["new relic"],
+    "linux": ["linux"],
+    "bash": [" bash", "shell scripting"],
+    "powershell": ["powershell"],
+    "sql": [" sql "],
+    "nosql": ["nosql"],
+    "oracle": ["oracle"],
+    "sql server": ["sql server", "mssql"],
+    "sqlite": ["sqlite"],
+    "cassandra": ["cassandra"],
+    "dynamodb": ["dynamodb"],
+    "snowflake": ["snowflake"],
+    "bigquery": ["bigquery"],
+    "redshift": ["redshift"],
+    "databricks": ["databricks"],
+    "airflow": ["airflow"],
+    "dbt": [" dbt "],
+    "hadoop": ["hadoop"],
+    "hive": [" hive "],
+    "flink": ["flink"],
+    "rabbitmq": ["rabbitmq"],
+    "pulsar": ["pulsar"],
+    "grpc": ["grpc"],
+    "rest": ["rest api", "restful"],
+    "soap": [" soap "],
+    "microservices": ["microservice"],
+    "serverless": ["serverless"],
+    "lambda": ["aws lambda"],
+    "cloudformation": ["cloudformation"],
+    "pulumi": ["pulumi"],
+    "openshift": ["openshift"],
+    "istio": ["istio"],
+    "nginx": ["nginx"],
+    "apache": ["apache httpd", "apache web server"],
+    "tomcat": ["tomcat"],
+    "express": ["express.js", "expressjs"],
+    "nestjs": ["nestjs", "nest.js"],
+    "next.js": ["next.js", "nextjs"],
+    "nuxt": ["nuxt"],
+    "svelte": ["svelte"],
+    "redux": ["redux"],
+    "jquery": ["jquery"],
+    "html": ["html"],
+    "css": [" css", "sass", "scss"],
+    "tailwind": ["tailwind"],
+    "bootstrap": ["bootstrap"],
+    "webpack": ["webpack"],
+    "vite": [" vite "],
+    "jest": [" jest "],
+    "cypress": ["cypress"],
+    "selenium": ["selenium"],
+    "playwright": ["playwright"],
+    "pytest": ["pytest"],
+    "junit": ["junit"],
+    "fastapi": ["fastapi"],
+    "celery": ["celery"],
+    "pandas": ["pandas"],
+    "numpy": ["numpy"],
+    "scikit-learn": ["scikit-learn", "sklearn"],
+    "tensorflow": ["tensorflow"],
+    "pytorch": ["pytorch"],
+    "keras": ["keras"],
+    "llm": [" llm", "large language model"],
+    "nlp": [" nlp ", "natural language processing"],
+    "computer vision": ["computer vision", "opencv"],
+    "mlflow": ["mlflow"],
+    "kubeflow": ["kubeflow"],
+    "sagemaker": ["sagemaker"],
+    "tableau": ["tableau"],
+    "power bi": ["power bi", "powerbi"],
+    "looker": ["looker"],
+    "excel": [" excel "],
+    "sap": [" sap "],
+    "salesforce": ["salesforce"],
+    "servicenow": ["servicenow"],
+    "jira": [" jira"],
+    "confluence": ["confluence"],
+    "git": [" git "],
+    "svn": [" svn "],
+    "maven": ["maven"],
+    "gradle": ["gradle"],
+    "npm": [" npm "],
+    "yarn": [" yarn "],
+    "laravel": ["laravel"],
+    "symfony": ["symfony"],
+    "wordpress": ["wordpress"],
+    "drupal": ["drupal"],
+    "magento": ["magento"],
+    "shopify": ["shopify"],
+    "unity": [" unity "],
+    "unreal": ["unreal engine"],
+    "flutter": ["flutter"],
+    "react native": ["react native"],
+    "xamarin": ["xamarin"],
+    "android": ["android"],
+    "ios": [" ios "],
+    "objective-c": ["objective-c"],
+    "perl": [" perl "],
+    "haskell": ["haskell"],
+    "elixir": ["elixir"],
+    "erlang": ["erlang"],
+    "clojure": ["clojure"],
+    "f#": ["f#"],
+    "r": [" r "],
+    "matlab": ["matlab"],
+    "julia": [" julia "],
+    "cobol": ["cobol"],
+    "fortran": ["fortran"],
+    "assembly": ["assembly language"],
+    "embedded": ["embedded c", "firmware"],
+    "rtos": ["rtos"],
+    "fpga": ["fpga"],
+    "verilog": ["verilog"],
+    "vhdl": ["vhdl"],
+    "solidity": ["solidity"],
+    "blockchain": ["blockchain"],
+    "web3": ["web3"],
+    "oauth": ["oauth"],
+    "saml": [" saml"],
+    "ldap": [" ldap"],
+    "active directory": ["active directory"],
+    "okta": [" okta"],
+    "vault": ["hashicorp vault"],
+    "consul": ["consul"],
+    "nomad": ["hashicorp nomad"],
+    "vmware": ["vmware"],
+    "hyper-v": ["hyper-v"],
+    "openstack": ["openstack"],
+    "ceph": [" ceph"],
+    "zookeeper": ["zookeeper"],
+    "memcached": ["memcached"],
+    "neo4j": ["neo4j"],
+    "clickhouse": ["clickhouse"],
+    "timescaledb": ["timescale"],
+    "influxdb": ["influxdb"],
+    "mariadb": ["mariadb"],
+    "couchbase": ["couchbase"],
+    "firebase": ["firebase"],
+    "supabase": ["supabase"],
+    "heroku": ["heroku"],
+    "vercel": ["vercel"],
+    "netlify": ["netlify"],
+    "cloudflare": ["cloudflare"],
+    "akamai": ["akamai"],
+}
+
+
+def substring_tags(tags, text):
+    """What TechTagMatcher replaces: one ``in`` scan per needle"""
+    return {tag for tag, needles in tags.items() if any(n in text for n in needles)}
+
+
+def timed(fn, texts, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = [fn(text) for text in texts]
+        samples.append(time.perf_counter() - started)
+    return min(samples) / len(texts) * 1e6, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--extra-tags", type=int, nargs="+", default=[0, 25, 50, 100, len(EXTRA_TAGS)]
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with open(TECH_TAGS_PATH, encoding="utf-8") as f:
+        shipped = json.load(f)["tags"]
+    with open(EXAMPLE_JOBS, encoding="utf-8") as f:
+        texts = [
+            f"{job['title'] or ''} {job['description'] or ''}".lower()
+            for job in json.load(f)
+        ]
+
+    print(
+        f"{'tags':>5} {'needles':>8} {'substring us':>13} {'trie us':>8} {'speedup':>8}"
+    )
+    for extra in args.extra_tags:
+        tags = {**shipped, **dict(list(EXTRA_TAGS.items())[:extra])}
+        matcher = TechTagMatcher(tags, [], trie_min_needles=1)
+        needles = sum(len(n) for n in tags.values())
+        before, expected = timed(
+            lambda t, d=tags: substring_tags(d, t), texts, args.repeat
+        )
+        after, actual = timed(matcher._tags, texts, args.repeat)
+        assert actual == expected
+        print(
+            f"{len(tags):>5} {needles:>8} {before:>13.0f} {after:>8.0f} "
+            f"{before / after:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import jobspy
+from jobspy.indeed import Indeed
+from jobspy.linkedin import LinkedIn
+from jobspy.model import Site
+
+
+@pytest.fixture
+def fake_indeed(monkeypatch):
+    """Registers a fresh subclass of a fake scraper class as the Indeed
+    scraper, so the class-level settings and counters tests change start
+    from the defaults again"""
+
+    def register(scraper_class):
+        fake = type(scraper_class.__name__, (scraper_class,), {})
+        monkeypatch.setitem(jobspy.SCRAPER_MAPPING, Site.INDEED, fake)
+        return fake
+
+    return register
+
+
+class MockBoards(ThreadingHTTPServer):
+    """
+    Serves 25 LinkedIn jobs, 10 per search page, with job pages that take
+    detail_seconds, and three Indeed GraphQL pages of 5 jobs. Search pages
+    starting at hang_start or later answer after a second.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), MockHandler)
+        self.detail_seconds = 0.05
+        self.hang_start = None
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path.startswith("/jobs/view/"):
+            self.job_page(url.path.rsplit("/", 1)[-1])
+        else:
+            self.search_page(int(parse_qs(url.query)["start"][0]))
+
+    def search_page(self, start):
+        if self.server.hang_start is not None and start >= self.server.hang_start:
+            time.sleep(1)
+        cards = "".join(
+            f"""<div class="base-search-card">
+            <a class="base-card__full-link" href="{self.server.url}/jobs/view/dev-{i}?trk=x"></a>
+            <span class="sr-only">Engineer {i}</span>
+            <h4 class="base-search-card__subtitle"><a href="{self.server.url}/company/acme?x=1">Acme</a></h4>
+            <div class="base-search-card__metadata">
+              <span class="job-search-card__location">Berlin, Berlin, Germany</span>
+              <time class="job-search-card__listdate" datetime="2026-10-{i % 28 + 1:02d}"></time>
+            </div></div>"""
+            for i in range(start, min(start + 10, 25))
+        )
+        self.reply("text/html", f"<html><body>{cards}</body></html>".encode())
+
+    def job_page(self, job_id):
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.peak_in_flight = max(
+                self.server.peak_in_flight, self.server.in_flight
+            )
+        time.sleep(self.server.detail_seconds)
+        with self.server.lock:
+            self.server.in_flight -= 1
+        body = f"""<html><body>
+        <div class="show-more-less-html__markup"><p>Build things {job_id}</p></div>
+        <ul class="description__job-criteria-list"><li>
+          <h3 class="description__job-criteria-subheader">Seniority level</h3>
+          <span class="description__job-criteria-text description__job-criteria-text--criteria">
+            Mid-Senior level</span>
+        </li></ul>
+        </body></html>"""
+        self.reply("text/html", body.encode())
+
+    def do_POST(self):
+        query = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        page = 0
+        for cursor, number in (('cursor: "p1"', 1), ('cursor: "p2"', 2)):
+            if cursor in query["query"]:
+                page = number
+        results = [
+            {
+                "job": {
+                    "key": f"k{page}{i}",
+                    "title": f"Developer {page}{i}",
+                    "description": {"html": "<p>Write code</p>"},
+                    "attributes": [{"label": "Full-time"}],
+                    "datePublished": 1790000000000 - page * 86400000,
+                    "employer": None,
+                    "location": {
+                        "city": "Berlin",
+                        "admin1Code": "BE",
+                        "countryCode": "DE",
+                        "formatted": {"long": "Berlin"},
+                    },
+                    "compensation": {"baseSalary": None, "estimated": None},
+                    "recruit": None,
+                }
+            }
+            for i in range(5)
+        ]
+        next_cursor = f"p{page + 1}" if page < 2 else None
+        data = {
+            "data": {
+                "jobSearch": {
+                    "results": results,
+                    "pageInfo": {"nextCursor": next_cursor},
+                }
+            }
+        }
+        self.reply("application/json", json.dumps(data).encode())
+
+    def reply(self, content_type, body):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def boards(monkeypatch):
+    server = MockBoards()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(LinkedIn, "base_url", server.url)
+    monkeypatch.setattr(LinkedIn, "delay", 0)
+    monkeypatch.setattr(LinkedIn, "band_delay", 0)
+    monkeypatch.setattr(Indeed, "api_url", f"{server.url}/graphql")
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+SEARCH = {
+    "site_name": ["linkedin", "indeed"],
+    "search_term": "engineer",
+    "results_wanted": 12,
+    "country_indeed": "germany",
+    "linkedin_fetch_description": True,
+}
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Tuple
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from contextvars import copy_context
+from typing import Iterator, NamedTuple
 
+import numpy as np
 import pandas as pd
 
 from jobspy.bayt import BaytScraper
 from jobspy.bdjobs import BDJobs
 from jobspy.glassdoor import Glassdoor
 from jobspy.google import Google
-from jobspy.indeed import Indeed
-from jobspy.linkedin import LinkedIn
+from jobspy.indeed import AsyncIndeed, Indeed
+from jobspy.linkedin import AsyncLinkedIn, LinkedIn
 from jobspy.naukri import Naukri
-from jobspy.model import Location, JobResponse, Country
-from jobspy.model import SalarySource, ScraperInput, Site
+from jobspy.metrics import ScrapeMetrics
+from jobspy.model import AsyncScraper, JobPost, Country, ThreadedScraper
+from jobspy.model import SalarySource, Scraper, ScraperInput, Site
 from jobspy.util import (
     set_logger_level,
     extract_salary,
@@ -25,7 +33,25 @@ from jobspy.util import (
 )
 
 
-# Update the SCRAPER_MAPPING dictionary in the scrape_jobs function
+# Add new scrapers here to make them available to scrape_jobs
+SCRAPER_MAPPING = {
+    Site.LINKEDIN: LinkedIn,
+    Site.INDEED: Indeed,
+    Site.GLASSDOOR: Glassdoor,
+    Site.GOOGLE: Google,
+    Site.BAYT: BaytScraper,
+    Site.NAUKRI: Naukri,
+    Site.BDJOBS: BDJobs,  # Add BDJobs to the scraper mapping
+}
+
+# Sites scrape_jobs_async drives natively; the others run on worker threads
+ASYNC_SCRAPER_MAPPING = {
+    Site.LINKEDIN: AsyncLinkedIn,
+    Site.INDEED: AsyncIndeed,
+}
+
+# Queued by a site's worker in _scrape_pages after its last page
+_DONE = object()
 
 
 def scrape_jobs(
@@ -49,22 +75,420 @@ def scrape_jobs(
     enforce_annual_salary: bool = False,
     verbose: int = 0,
     user_agent: str = None,
+    metrics: ScrapeMetrics | None = None,
     **kwargs,
 ) -> pd.DataFrame:
     """
-    Scrapes job data from job boards concurrently
+    Scrapes job data from job boards concurrently, with new sessions for
+    this call only; use a JobSpy client to keep them between calls
+    :param metrics: collects per-site request counters and timings if given
+    :return: Pandas DataFrame containing job data
+    """
+    return JobSpy(proxies=proxies, ca_cert=ca_cert, user_agent=user_agent).scrape(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+        enforce_annual_salary=enforce_annual_salary,
+        verbose=verbose,
+        metrics=metrics,
+    )
+
+
+def scrape_jobs_iter(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    user_agent: str = None,
+    metrics: ScrapeMetrics | None = None,
+    **kwargs,
+) -> Iterator[pd.DataFrame]:
+    """
+    Scrapes job boards concurrently like scrape_jobs, but yields each search
+    page's jobs as soon as the page is parsed; see JobSpy.scrape_iter
+    :return: Iterator of small DataFrames, one per search page
+    """
+    return JobSpy(proxies=proxies, ca_cert=ca_cert, user_agent=user_agent).scrape_iter(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+        enforce_annual_salary=enforce_annual_salary,
+        verbose=verbose,
+        metrics=metrics,
+    )
+
+
+class _Lease(NamedTuple):
+    """A site's scraper between uses"""
+
+    scraper: Scraper
+    created: float
+    uses: int
+
+
+class JobSpy:
+    """
+    Long-lived client for many searches. Where scrape_jobs builds new
+    scrapers, and so new sessions, on every call, a JobSpy keeps each
+    site's scraper for later calls along with its connections, cookies and
+    tokens (such as the Glassdoor csrf token and the ZipRecruiter session
+    cookies).
+
+    A scraper is rebuilt once it is max_age seconds old or has run
+    max_uses searches, and after a search of its site raised or found
+    nothing, which is how a blocked or expired session shows. Calls made
+    at the same time from several threads each get their own scraper per
+    site.
+    """
+
+    def __init__(
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        max_age: float = 900,
+        max_uses: int = 50,
+    ):
+        self.proxies = proxies
+        self.ca_cert = ca_cert
+        self.user_agent = user_agent
+        self.max_age = max_age
+        self.max_uses = max_uses
+        self._idle: dict[Site, list[_Lease]] = {}
+        self._lock = threading.Lock()
+
+    def scrape(
+        self,
+        site_name: str | list[str] | Site | list[Site] | None = None,
+        search_term: str | None = None,
+        google_search_term: str | None = None,
+        location: str | None = None,
+        distance: int | None = 50,
+        is_remote: bool = False,
+        job_type: str | None = None,
+        easy_apply: bool | None = None,
+        results_wanted: int = 15,
+        country_indeed: str = "usa",
+        description_format: str = "markdown",
+        linkedin_fetch_description: bool | None = False,
+        linkedin_company_ids: list[int] | None = None,
+        offset: int | None = 0,
+        hours_old: int = None,
+        enforce_annual_salary: bool = False,
+        verbose: int = 0,
+        metrics: ScrapeMetrics | None = None,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Scrapes job data from job boards concurrently, like scrape_jobs
+        :param metrics: collects per-site request counters and timings if given
+        :return: Pandas DataFrame containing job data
+        """
+        set_logger_level(verbose)
+        scraper_input = _scraper_input(
+            site_name=site_name,
+            search_term=search_term,
+            google_search_term=google_search_term,
+            location=location,
+            distance=distance,
+            is_remote=is_remote,
+            job_type=job_type,
+            easy_apply=easy_apply,
+            results_wanted=results_wanted,
+            country_indeed=country_indeed,
+            description_format=description_format,
+            linkedin_fetch_description=linkedin_fetch_description,
+            linkedin_company_ids=linkedin_company_ids,
+            offset=offset,
+            hours_old=hours_old,
+        )
+        job_rows = [
+            _flatten_job(job, site, scraper_input.country, enforce_annual_salary)
+            for site, jobs in _scrape_pages(scraper_input, self, metrics)
+            for job in jobs
+        ]
+        return _jobs_dataframe(job_rows)
+
+    def scrape_iter(
+        self,
+        site_name: str | list[str] | Site | list[Site] | None = None,
+        search_term: str | None = None,
+        google_search_term: str | None = None,
+        location: str | None = None,
+        distance: int | None = 50,
+        is_remote: bool = False,
+        job_type: str | None = None,
+        easy_apply: bool | None = None,
+        results_wanted: int = 15,
+        country_indeed: str = "usa",
+        description_format: str = "markdown",
+        linkedin_fetch_description: bool | None = False,
+        linkedin_company_ids: list[int] | None = None,
+        offset: int | None = 0,
+        hours_old: int = None,
+        enforce_annual_salary: bool = False,
+        verbose: int = 0,
+        metrics: ScrapeMetrics | None = None,
+        **kwargs,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Scrapes job boards concurrently like scrape, but yields each search
+        page's jobs as soon as the page is parsed, in whatever order the
+        sites deliver them. Every batch has the columns and normalization of
+        the scrape DataFrame.
+
+        Closing the generator, or breaking out of a loop over it, stops every
+        site at its next page; requests already in flight finish in the
+        background.
+        :return: Iterator of small DataFrames, one per search page
+        """
+        set_logger_level(verbose)
+        scraper_input = _scraper_input(
+            site_name=site_name,
+            search_term=search_term,
+            google_search_term=google_search_term,
+            location=location,
+            distance=distance,
+            is_remote=is_remote,
+            job_type=job_type,
+            easy_apply=easy_apply,
+            results_wanted=results_wanted,
+            country_indeed=country_indeed,
+            description_format=description_format,
+            linkedin_fetch_description=linkedin_fetch_description,
+            linkedin_company_ids=linkedin_company_ids,
+            offset=offset,
+            hours_old=hours_old,
+        )
+        for site, jobs in _scrape_pages(scraper_input, self, metrics):
+            yield _jobs_dataframe(
+                [
+                    _flatten_job(
+                        job, site, scraper_input.country, enforce_annual_salary
+                    )
+                    for job in jobs
+                ]
+            )
+
+    def close(self) -> None:
+        """Closes the idle scrapers' sessions; later calls start new ones"""
+        with self._lock:
+            idle = [lease for leases in self._idle.values() for lease in leases]
+            self._idle.clear()
+        for lease in idle:
+            _close_session(lease.scraper)
+
+    def _checkout(self, site: Site) -> _Lease:
+        """An idle scraper of site that is still fresh, or a new one"""
+        now = time.monotonic()
+        expired = []
+        fresh = None
+        with self._lock:
+            idle = self._idle.get(site, [])
+            while idle:
+                lease = idle.pop()
+                if now - lease.created < self.max_age:
+                    fresh = lease
+                    break
+                expired.append(lease)
+        for lease in expired:
+            _close_session(lease.scraper)
+        if fresh is not None:
+            return fresh
+        scraper_class = SCRAPER_MAPPING[site]
+        scraper = scraper_class(
+            proxies=self.proxies, ca_cert=self.ca_cert, user_agent=self.user_agent
+        )
+        return _Lease(scraper, now, 0)
+
+    def _checkin(self, site: Site, lease: _Lease, healthy: bool) -> None:
+        """Keeps lease's scraper for the next call, unless it is spent"""
+        lease = lease._replace(uses=lease.uses + 1)
+        if (
+            not healthy
+            or lease.uses >= self.max_uses
+            or time.monotonic() - lease.created >= self.max_age
+        ):
+            _close_session(lease.scraper)
+            return
+        with self._lock:
+            self._idle.setdefault(site, []).append(lease)
+
+
+def _close_session(scraper: Scraper) -> None:
+    """Closes the session of a scraper that won't be used again"""
+    session = getattr(scraper, "session", None)
+    if session is None:
+        return
+    try:
+        session.close()
+    except Exception as e:
+        _site_logger(scraper.site).warning(f"closing session failed: {e}")
+
+
+async def scrape_jobs_async(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    user_agent: str = None,
+    metrics: ScrapeMetrics | None = None,
+    max_concurrency: int | asyncio.Semaphore = 5,
+    request_timeout: float | None = 60,
+    timeout: float | None = None,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Scrapes job boards like scrape_jobs, with every site a task on the
+    running event loop instead of a thread. LinkedIn and Indeed are scraped
+    natively, LinkedIn fetching the job pages of each search page
+    concurrently; the other sites run their scraper on a thread of its own.
+    Several calls can share one event loop.
+    :param max_concurrency: requests in flight per site, or an
+        asyncio.Semaphore to share one limit between sites and calls
+    :param request_timeout: seconds before a request raises TimeoutError.
+        It is sent with its timeout capped at the time left, so it ends by
+        then too, and keeps its max_concurrency slot until it does.
+    :param timeout: seconds before the sites still running are stopped,
+        keeping the jobs they found so far. Requests not sent yet are
+        dropped; a request or threaded scraper's page in progress ends on
+        its own, no longer awaited.
     :return: Pandas DataFrame containing job data
     """
-    SCRAPER_MAPPING = {
-        Site.LINKEDIN: LinkedIn,
-        Site.INDEED: Indeed,
-        Site.GLASSDOOR: Glassdoor,
-        Site.GOOGLE: Google,
-        Site.BAYT: BaytScraper,
-        Site.NAUKRI: Naukri,
-        Site.BDJOBS: BDJobs,  # Add BDJobs to the scraper mapping
-    }
     set_logger_level(verbose)
+    scraper_input = _scraper_input(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+    )
+    job_rows = []
+
+    async def scrape_site(site: Site) -> None:
+        scraper = _async_scraper(
+            site, proxies, ca_cert, user_agent, max_concurrency, request_timeout
+        )
+        recording = (
+            metrics.recording(site.value) if metrics is not None else nullcontext()
+        )
+        try:
+            with recording:
+                async for jobs in scraper.scrape_pages(scraper_input):
+                    job_rows.extend(
+                        _flatten_job(
+                            job,
+                            site.value,
+                            scraper_input.country,
+                            enforce_annual_salary,
+                        )
+                        for job in jobs
+                    )
+        finally:
+            scraper.close()
+        _site_logger(site).info("finished scraping")
+
+    tasks = {
+        asyncio.create_task(scrape_site(site)): site for site in scraper_input.site_type
+    }
+    try:
+        done, pending = await asyncio.wait(
+            tasks, timeout=timeout, return_when=asyncio.FIRST_EXCEPTION
+        )
+        for task in done:
+            task.result()
+        for task in pending:
+            _site_logger(tasks[task]).warning(
+                f"stopped after {timeout}s, keeping the jobs found so far"
+            )
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return _jobs_dataframe(job_rows)
+
+
+def _scraper_input(
+    site_name: str | list[str] | Site | list[Site] | None,
+    search_term: str | None,
+    google_search_term: str | None,
+    location: str | None,
+    distance: int | None,
+    is_remote: bool,
+    job_type: str | None,
+    easy_apply: bool | None,
+    results_wanted: int,
+    country_indeed: str,
+    description_format: str,
+    linkedin_fetch_description: bool | None,
+    linkedin_company_ids: list[int] | None,
+    offset: int | None,
+    hours_old: int | None,
+) -> ScraperInput:
     job_type = get_enum_from_value(job_type) if job_type else None
 
     def get_site_type():
@@ -80,11 +504,9 @@ def scrape_jobs(
             ]
         return site_types
 
-    country_enum = Country.from_string(country_indeed)
-
-    scraper_input = ScraperInput(
+    return ScraperInput(
         site_type=get_site_type(),
-        country=country_enum,
+        country=Country.from_string(country_indeed),
         search_term=search_term,
         google_search_term=google_search_term,
         location=location,
@@ -100,119 +522,193 @@ def scrape_jobs(
         hours_old=hours_old,
     )
 
-    def scrape_site(site: Site) -> Tuple[str, JobResponse]:
-        scraper_class = SCRAPER_MAPPING[site]
-        scraper = scraper_class(proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
-        cap_name = site.value.capitalize()
-        site_name = "LinkedIn" if cap_name == "Linkedin" else cap_name
-        create_logger(site_name).info("finished scraping")
-        return site.value, scraped_data
-
-    site_to_jobs_dict = {}
-
-    def worker(site):
-        site_val, scraped_info = scrape_site(site)
-        return site_val, scraped_info
-
-    with ThreadPoolExecutor() as executor:
-        future_to_site = {
-            executor.submit(worker, site): site for site in scraper_input.site_type
-        }
-
-        for future in as_completed(future_to_site):
-            site_value, scraped_data = future.result()
-            site_to_jobs_dict[site_value] = scraped_data
-
-    jobs_dfs: list[pd.DataFrame] = []
-
-    for site, job_response in site_to_jobs_dict.items():
-        for job in job_response.jobs:
-            job_data = job.dict()
-            job_data["site"] = site
-            job_data["company"] = job_data["company_name"]
-            job_data["job_type"] = (
-                ", ".join(job_type.value[0] for job_type in job_data["job_type"])
-                if job_data["job_type"]
-                else None
-            )
-            job_data["emails"] = (
-                ", ".join(job_data["emails"]) if job_data["emails"] else None
-            )
-            if job_data["location"]:
-                job_data["location"] = Location(
-                    **job_data["location"]
-                ).display_location()
-
-            # Handle compensation
-            compensation_obj = job_data.get("compensation")
-            if compensation_obj and isinstance(compensation_obj, dict):
-                job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
-                    else None
-                )
-                job_data["min_amount"] = compensation_obj.get("min_amount")
-                job_data["max_amount"] = compensation_obj.get("max_amount")
-                job_data["currency"] = compensation_obj.get("currency", "USD")
-                job_data["salary_source"] = SalarySource.DIRECT_DATA.value
-                if enforce_annual_salary and (
-                    job_data["interval"]
-                    and job_data["interval"] != "yearly"
-                    and job_data["min_amount"]
-                    and job_data["max_amount"]
-                ):
-                    convert_to_annual(job_data)
-            else:
-                if country_enum == Country.USA:
-                    (
-                        job_data["interval"],
-                        job_data["min_amount"],
-                        job_data["max_amount"],
-                        job_data["currency"],
-                    ) = extract_salary(
-                        job_data["description"],
-                        enforce_annual_salary=enforce_annual_salary,
-                    )
-                    job_data["salary_source"] = SalarySource.DESCRIPTION.value
 
-            job_data["salary_source"] = (
-                job_data["salary_source"]
-                if "min_amount" in job_data and job_data["min_amount"]
-                else None
-            )
+def _scrape_pages(
+    scraper_input: ScraperInput,
+    client: JobSpy,
+    metrics: ScrapeMetrics | None,
+) -> Iterator[tuple[str, list[JobPost]]]:
+    """
+    Runs every site of scraper_input in its own thread, in a copy of the
+    caller's context, with the client's scrapers. At most two pages per site
+    are buffered; sites pause while the caller is behind.
+    :return: Iterator of (site, jobs) for each page, as the pages are parsed
+    """
+    pages = queue.Queue(maxsize=2 * len(scraper_input.site_type))
+    stop = threading.Event()
+
+    def put(item: tuple) -> bool:
+        # Gives up once the caller stopped reading, so no thread stays blocked
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
 
-            # naukri-specific fields
-            job_data["skills"] = (
-                ", ".join(job_data["skills"]) if job_data["skills"] else None
+    def scrape_site(site: Site) -> None:
+        lease = None
+        found = False
+        try:
+            lease = client._checkout(site)
+            recording = (
+                metrics.recording(site.value) if metrics is not None else nullcontext()
             )
-            job_data["experience_range"] = job_data.get("experience_range")
+            with recording:
+                site_pages = lease.scraper.scrape_pages(scraper_input)
+                try:
+                    for jobs in site_pages:
+                        found = found or bool(jobs)
+                        if not put((site.value, jobs)) or stop.is_set():
+                            return
+                finally:
+                    site_pages.close()
+            _site_logger(site).info("finished scraping")
+        except Exception as e:
+            found = False
+            put((site.value, e))
+        finally:
+            if lease is not None:
+                client._checkin(site, lease, found)
+            put((site.value, _DONE))
+
+    executor = ThreadPoolExecutor()
+    for site in scraper_input.site_type:
+        executor.submit(copy_context().run, scrape_site, site)
+    try:
+        running = len(scraper_input.site_type)
+        while running:
+            site, jobs = pages.get()
+            if jobs is _DONE:
+                running -= 1
+            elif isinstance(jobs, Exception):
+                raise jobs
+            else:
+                yield site, jobs
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
 
-            job_df = pd.DataFrame([job_data])
-            jobs_dfs.append(job_df)
 
-    if jobs_dfs:
-        # Step 1: Filter out all-NA columns from each DataFrame before concatenation
-        filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
+def _async_scraper(
+    site: Site,
+    proxies: list[str] | str | None,
+    ca_cert: str | None,
+    user_agent: str | None,
+    limit: int | asyncio.Semaphore,
+    timeout: float | None,
+) -> AsyncScraper:
+    if site in ASYNC_SCRAPER_MAPPING:
+        return ASYNC_SCRAPER_MAPPING[site](
+            proxies=proxies,
+            ca_cert=ca_cert,
+            user_agent=user_agent,
+            limit=limit,
+            timeout=timeout,
+        )
+    scraper_class = SCRAPER_MAPPING[site]
+    return ThreadedScraper(
+        scraper_class(proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
+    )
 
-        # Step 2: Concatenate the filtered DataFrames
-        jobs_df = pd.concat(filtered_dfs, ignore_index=True)
 
-        # Step 3: Ensure all desired columns are present, adding missing ones as empty
-        for column in desired_order:
-            if column not in jobs_df.columns:
-                jobs_df[column] = None  # Add missing columns as empty
+def _site_logger(site: Site):
+    cap_name = site.value.capitalize()
+    return create_logger("LinkedIn" if cap_name == "Linkedin" else cap_name)
 
-        # Reorder the DataFrame according to the desired order
-        jobs_df = jobs_df[desired_order]
 
-        # Step 4: Sort the DataFrame as required
-        return jobs_df.sort_values(
-            by=["site", "date_posted"], ascending=[True, False]
-        ).reset_index(drop=True)
+def _flatten_job(
+    job: JobPost, site: str, country_enum: Country, enforce_annual_salary: bool
+) -> dict:
+    """
+    Flattens a scraped JobPost into one row of the scrape_jobs DataFrame,
+    reading its fields in place rather than through a dict() copy
+    :return: dict holding at least the desired_order columns
+    """
+    job_data = dict(vars(job))
+    job_data["site"] = site
+    job_data["company"] = job.company_name
+    job_data["job_type"] = (
+        ", ".join(job_type.value[0] for job_type in job.job_type)
+        if job.job_type
+        else None
+    )
+    job_data["emails"] = ", ".join(job.emails) if job.emails else None
+    if job.location is not None:
+        job_data["location"] = job.location.display_location()
+
+    # Handle compensation
+    compensation = job.compensation
+    if compensation is not None:
+        job_data["interval"] = (
+            compensation.interval.value if compensation.interval else None
+        )
+        job_data["min_amount"] = compensation.min_amount
+        job_data["max_amount"] = compensation.max_amount
+        job_data["currency"] = compensation.currency
+        job_data["salary_source"] = SalarySource.DIRECT_DATA.value
+        if enforce_annual_salary and (
+            job_data["interval"]
+            and job_data["interval"] != "yearly"
+            and job_data["min_amount"]
+            and job_data["max_amount"]
+        ):
+            convert_to_annual(job_data)
     else:
+        if country_enum == Country.USA:
+            (
+                job_data["interval"],
+                job_data["min_amount"],
+                job_data["max_amount"],
+                job_data["currency"],
+            ) = extract_salary(
+                job.description,
+                enforce_annual_salary=enforce_annual_salary,
+            )
+            job_data["salary_source"] = SalarySource.DESCRIPTION.value
+
+    job_data["salary_source"] = (
+        job_data["salary_source"]
+        if "min_amount" in job_data and job_data["min_amount"]
+        else None
+    )
+
+    # naukri-specific fields
+    job_data["skills"] = ", ".join(job.skills) if job.skills else None
+    return job_data
+
+
+def _jobs_dataframe(job_rows: list[dict]) -> pd.DataFrame:
+    """
+    Builds the scrape_jobs DataFrame, in desired_order, from flattened jobs.
+
+    Each column is built once from a list instead of concatenating one
+    DataFrame per job. The result matches the per-job frames it replaces:
+    values a job lacks are NaN (so numeric columns stay numeric), and a
+    column no job has a value for holds None.
+    :return: DataFrame sorted by site, newest first
+    """
+    if not job_rows:
         return pd.DataFrame()
 
+    columns = {}
+    for column in desired_order:
+        values = [row.get(column) for row in job_rows]
+        missing = pd.Series(values, dtype=object).isna()
+        if missing.all():
+            columns[column] = [None] * len(values)
+        else:
+            columns[column] = [
+                np.nan if is_missing else value
+                for value, is_missing in zip(values, missing.tolist())
+            ]
+    jobs_df = pd.DataFrame(columns, columns=desired_order)
+
+    return jobs_df.sort_values(
+        by=["site", "date_posted"], ascending=[True, False]
+    ).reset_index(drop=True)
+
 
 # Add BDJobs to __all__
 __all__ = [
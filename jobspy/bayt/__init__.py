@@ -5,6 +5,7 @@ import time
 
 from bs4 import BeautifulSoup
 
+from jobspy import metrics
 from jobspy.model import (
     Scraper,
     ScraperInput,
@@ -37,9 +38,13 @@ class BaytScraper(Scraper):
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
-        )
+        if self.session is None:
+            self.session = create_session(
+                proxies=self.proxies,
+                ca_cert=self.ca_cert,
+                is_tls=False,
+                has_retry=True,
+            )
         job_list: list[JobPost] = []
         page = 1
         results_wanted = (
@@ -90,6 +95,7 @@ class BaytScraper(Scraper):
         """
         try:
             url = f"{self.base_url}/en/international/jobs/{query}-jobs/?page={page}"
+            metrics.count("search_pages")
             response = self.session.get(url)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, "html.parser")
@@ -9,6 +9,7 @@ from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 
+from jobspy import metrics
 from jobspy.bdjobs.constant import headers, search_params
 from jobspy.bdjobs.util import (
     parse_location,
@@ -92,6 +93,7 @@ class BDJobs(Scraper):
                 if page > 1:
                     params["pg"] = page
 
+                metrics.count("search_pages")
                 response = self.session.get(
                     self.search_url,
                     params=params,
@@ -256,6 +258,7 @@ class BDJobs(Scraper):
         :return: Dictionary with job details
         """
         try:
+            metrics.count("detail_fetches")
             response = self.session.get(job_url, timeout=60)
             if response.status_code != 200:
                 return {}
@@ -0,0 +1,445 @@
+"""
+jobspy.classifier
+~~~~~~~~~~~~~~~~~
+
+Rule-based labelling of scraped jobs: seniority level, role family,
+position tag and tech tags.
+
+Every rule is compiled once at import. A job's title and description are
+normalized once and scanned by a single combined pattern that reports every
+rule family matching at each word start, so all labels come out of one pass.
+
+Tech tags are plain substring needles loaded from ``tech_tags.json`` (or the
+file named by ``TECH_TAGS_PATH``), so the dictionary can grow without code
+changes. Large dictionaries are matched together by one trie-shaped
+pattern; below TRIE_MIN_NEEDLES needles one substring scan per needle is
+faster (see bench_tech_tags.py).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+TECH_TAGS_PATH = Path(
+    os.getenv("TECH_TAGS_PATH") or Path(__file__).with_name("tech_tags.json")
+)
+
+# Below this many needles, one substring scan per needle beats the trie
+# (they break even at 50-60 needles on the example.json postings)
+TRIE_MIN_NEEDLES = 64
+
+_NON_TOKEN = re.compile(r"[^a-z0-9+#]+")
+
+# --- Seniority (mapped to frontend enum values: entry, junior, mid, senior) ---
+SENIORITY_RULES = {
+    "entry": [
+        r"\b(intern|internship|apprentice|trainee)\b",
+        r"\b(new\s*grad|graduate|recent\s*graduate)\b",
+        r"\b(entry\s*level|entry\s*-\s*level)\b",
+    ],
+    "junior": [
+        r"\b(junior|jr\b|jr\.)\b",
+        r"\b(associate)\b",
+        r"\b(engineer|developer)\s*(i|1)\b",
+        r"\b(level\s*(i|1))\b",
+        r"\b(l1)\b",
+    ],
+    "senior": [
+        r"\b(senior|sr\b|sr\.)\b",
+        r"\b(staff|principal|lead|architect)\b",
+        r"\b(head\s+of)\b",
+        r"\b(director|vp|vice\s+president|chief)\b",
+        r"\b(engineering\s+manager|software\s+engineering\s+manager)\b",
+    ],
+    "mid": [
+        r"\b(mid\s*level|mid\s*-\s*level|intermediate)\b",
+        r"\b(engineer|developer)\s*(ii|2|iii|3)\b",
+        r"\b(level\s*(ii|2|iii|3))\b",
+        r"\b(l2|l3)\b",
+    ],
+}
+SENIORITY_PRECEDENCE = ["entry", "junior", "senior", "mid"]
+
+_YEARS = re.compile(r"\b(\d{1,2})\s*(?:\+)?\s*(?:years|yrs)\b")
+_YEARS_RANGE = re.compile(r"\b(\d{1,2})\s*(?:-|–|to)\s*(\d{1,2})\s*(?:years|yrs)\b")
+
+# --- Families shared by role_family and position_tag ---
+_DATA_SCIENCE = [
+    r"\b(data\s+scientist)\b",
+    r"\b(machine\s+learning|ml\b|ml\s+engineer|ai\s+engineer|deep\s+learning)\b",
+    r"\b(nlp|computer\s+vision|cv\b|llm|genai|generative\s+ai)\b",
+    r"\b(applied\s+scientist|research\s+scientist)\b",
+]
+_DEVOPS = [
+    r"\b(devops|site\s+reliability|sre\b|platform\s+engineer)\b",
+    r"\b(infrastructure\s+engineer|infra\b|ci\s*/\s*cd|cicd)\b",
+    r"\b(kubernetes|k8s|docker|terraform|ansible)\b",
+    r"\b(cloud\s+engineer|cloud\s+architect|aws|azure|gcp)\b",
+]
+_MOBILE = [
+    r"\b(mobile\s+developer|mobile\s+engineer)\b",
+    r"\b(ios\b|android\b|react\s+native|flutter)\b",
+    r"\b(swift|kotlin)\b",
+]
+_FULLSTACK = [
+    r"\b(full\s*stack|full\s*-\s*stack|fullstack|mern|mean)\b",
+]
+_FRONTEND = [
+    r"\b(front\s*end|front\s*-\s*end|frontend)\b",
+    r"\b(ui\s+engineer|ui\s+developer|web\s+ui)\b",
+    r"\b(react|next\s*js|angular|vue)\b",
+]
+_BACKEND = [
+    r"\b(back\s*end|back\s*-\s*end|backend)\b",
+    r"\b(server\s*side|server\s*-\s*side)\b",
+    r"\b(api\s+engineer|api\s+developer|microservices)\b",
+]
+
+# --- Role family, checked in dict order ---
+ROLE_FAMILY_RULES = {
+    "product": [
+        r"\b(product\s+manager|technical\s+product\s+manager|product\s+owner)\b",
+        r"\b(group\s+product\s+manager|gpm)\b",
+    ],
+    "security": [
+        r"\b(cyber\s*security|cybersecurity|info\s*sec|infosec|information\s+security)\b",
+        r"\b(security\s+engineer|security\s+analyst|soc\s+analyst)\b",
+        r"\b(penetration\s+tester|pentest|ethical\s+hacker|red\s+team|blue\s+team)\b",
+        r"\b(application\s+security|appsec|vulnerability\s+management|incident\s+response)\b",
+    ],
+    "data_scientist": _DATA_SCIENCE,
+    "data_engineer": [
+        r"\b(data\s+engineer|analytics\s+engineer|etl\b|elt\b)\b",
+        r"\b(data\s+pipeline|data\s+warehouse|data\s+platform)\b",
+        r"\b(dbt|airflow|spark|kafka|snowflake|bigquery|redshift)\b",
+        r"\b(bi\s+developer|business\s+intelligence)\b",
+        r"\b(data\s+analyst|analytics)\b",
+    ],
+    "devops": _DEVOPS,
+    "mobile": _MOBILE,
+    "fullstack": _FULLSTACK,
+    "frontend": _FRONTEND,
+    "backend": _BACKEND,
+}
+
+# --- Position tag ---
+POSITION_TAG_RULES = {
+    "cybersecurity": [
+        r"\b(cyber\s*security|cybersecurity|info\s*sec|infosec|information\s+security)\b",
+        r"\b(security\s+engineer|security\s+analyst|soc\s+analyst)\b",
+        r"\b(penetration\s+tester|pentest|ethical\s+hacker|red\s+team|blue\s+team)\b",
+        r"\b(application\s+security|appsec|devsecops|incident\s+response)\b",
+        r"\b(vulnerability\s+management|threat\s+model(ing)?)\b",
+    ],
+    "product-manager": [
+        r"\b(product\s+manager|product\s+owner)\b",
+        r"\b(technical\s+product\s+manager|tpm)\b",
+        r"\b(group\s+product\s+manager|gpm)\b",
+    ],
+    "data-scientist": _DATA_SCIENCE,
+    "data": [
+        r"\b(data\s+engineer|analytics\s+engineer|etl\b|elt\b)\b",
+        r"\b(data\s+pipeline|data\s+warehouse|data\s+platform)\b",
+        r"\b(dbt|airflow|spark|kafka|snowflake|bigquery|redshift)\b",
+        r"\b(bi\s+developer|business\s+intelligence|data\s+analyst|analytics)\b",
+    ],
+    "devops": _DEVOPS,
+    "mobile": _MOBILE,
+    "fullstack": _FULLSTACK,
+    "frontend": _FRONTEND,
+    "backend": _BACKEND
+    + [r"\b(django|flask|fastapi|spring\s+boot|rails|dotnet|\.net)\b"],
+}
+
+# Titles that only say "engineer"/"developer" are classified from the
+# description alone unless they also name a specific role.
+GENERIC_TITLE_MARKERS = [
+    r"\bsoftware\s+engineer\b",
+    r"\bsoftware\s+developer\b",
+    r"\bengineer\b",
+    r"\bdeveloper\b",
+]
+SPECIFIC_TITLE_MARKERS = [
+    r"\bfront\s*end\b",
+    r"\bfrontend\b",
+    r"\bback\s*end\b",
+    r"\bbackend\b",
+    r"\bfull\s*stack\b",
+    r"\bfullstack\b",
+    r"\bdevops\b",
+    r"\bsre\b",
+    r"\bmobile\b",
+    r"\bios\b",
+    r"\bandroid\b",
+    r"\bdata\s+engineer\b",
+    r"\bdata\s+scientist\b",
+    r"\bproduct\s+manager\b",
+    r"\bcybersecurity\b",
+    r"\bsecurity\s+engineer\b",
+]
+
+
+class JobLabels(NamedTuple):
+    seniority_level: str
+    role_family: str | None
+    position_tag: str | None
+
+
+def _split_alternatives(pattern: str) -> list[str]:
+    """Top-level alternatives of the leading group of a ``\\b(...)`` rule"""
+    body = pattern.removeprefix(r"\b")
+    if not body.startswith("("):
+        return [body]
+    alternatives, current, depth, escaped = [], "", 0, False
+    for ch in body[1:]:
+        if escaped:
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            if depth == 0:
+                break
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            alternatives.append(current)
+            current = ""
+            continue
+        current += ch
+    alternatives.append(current)
+    return alternatives
+
+
+def _literal_prefix(alternative: str) -> str:
+    prefix = re.match(r"[a-z0-9 #]*", alternative).group(0)
+    # A quantifier makes the last literal character optional
+    if prefix and alternative[len(prefix) : len(prefix) + 1] in ("?", "*", "{"):
+        prefix = prefix[:-1]
+    return prefix
+
+
+def _trie_pattern(words: set[str]) -> str:
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: dict) -> str:
+        branches = [
+            re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch
+        ]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if "" in node else "")
+
+    return emit(trie)
+
+
+def _compile_scanner(families: dict[str, list[str]]) -> re.Pattern:
+    """
+    Build one pattern that, at every word start where any rule matches,
+    captures each family with a match starting there. Optional lookaheads keep
+    the scan zero-width so overlapping matches of different families are not
+    hidden from each other.
+
+    Word starts are first screened by a trie of the rules' literal prefixes,
+    so most words are rejected after a character or two.
+    """
+    prefixes, unprefixed = set(), []
+    for patterns in families.values():
+        for pattern in patterns:
+            for alternative in _split_alternatives(pattern):
+                prefix = _literal_prefix(alternative)
+                if prefix:
+                    prefixes.add(prefix)
+                else:
+                    unprefixed.append(alternative)
+    gate = "|".join([_trie_pattern(prefixes)] + unprefixed)
+    captures = "".join(
+        f"(?:(?=(?P<{group}>{'|'.join(patterns)})))?"
+        for group, patterns in families.items()
+    )
+    return re.compile(rf"\b(?=(?:{gate})){captures}")
+
+
+def _group(prefix: str, name: str) -> str:
+    return prefix + re.sub(r"\W", "_", name)
+
+
+_SENIORITY_GROUPS = [(level, _group("s_", level)) for level in SENIORITY_PRECEDENCE]
+_ROLE_FAMILY_GROUPS = [(family, _group("r_", family)) for family in ROLE_FAMILY_RULES]
+_POSITION_TAG_GROUPS = [(tag, _group("p_", tag)) for tag in POSITION_TAG_RULES]
+_SCANNER = _compile_scanner(
+    {
+        **{group: SENIORITY_RULES[level] for level, group in _SENIORITY_GROUPS},
+        **{group: ROLE_FAMILY_RULES[fam] for fam, group in _ROLE_FAMILY_GROUPS},
+        **{group: POSITION_TAG_RULES[tag] for tag, group in _POSITION_TAG_GROUPS},
+    }
+)
+_GENERIC_TITLE = re.compile("|".join(GENERIC_TITLE_MARKERS))
+_SPECIFIC_TITLE = re.compile("|".join(SPECIFIC_TITLE_MARKERS))
+
+
+def normalize_text(value) -> str:
+    """Lower-case and collapse everything but [a-z0-9+#] to single spaces"""
+    return _NON_TOKEN.sub(" ", f"{value or ''}".lower())
+
+
+def _max_years_of_experience(text: str) -> int | None:
+    years = [int(m.group(1)) for m in _YEARS.finditer(text)]
+    years.extend(int(m.group(2)) for m in _YEARS_RANGE.finditer(text))
+    return max(years) if years else None
+
+
+def _seniority_from_years(years: int | None) -> str:
+    if years is None:
+        return "mid"
+    if years <= 0:
+        return "entry"
+    if years <= 2:
+        return "junior"
+    if years <= 5:
+        return "mid"
+    return "senior"
+
+
+def _position_tag(matched: set[str]) -> str | None:
+    if "cybersecurity" in matched:
+        return "cybersecurity"
+    if "product-manager" in matched:
+        return "product-manager"
+    if "data-scientist" in matched:
+        return "data-scientist"
+
+    if "fullstack" in matched or ("frontend" in matched and "backend" in matched):
+        return "fullstack"
+
+    for tag in ("devops", "mobile", "data", "frontend", "backend"):
+        if tag in matched:
+            return tag
+    return None
+
+
+def classify(title, description) -> JobLabels:
+    """Derive seniority level, role family and position tag for one job"""
+    title_text = normalize_text(title)
+    desc_start = len(title_text) + 1
+    text = f"{title_text} {normalize_text(description)}"
+
+    # group -> start of its last (i.e. right-most) match
+    last_start: dict[str, int] = {}
+    for match in _SCANNER.finditer(text):
+        for group, value in match.groupdict().items():
+            if value is not None:
+                last_start[group] = match.start()
+
+    seniority_level = next(
+        (level for level, group in _SENIORITY_GROUPS if group in last_start), None
+    ) or _seniority_from_years(_max_years_of_experience(text))
+
+    role_family = next(
+        (family for family, group in _ROLE_FAMILY_GROUPS if group in last_start),
+        None,
+    )
+
+    description_only = _GENERIC_TITLE.search(title_text) and not _SPECIFIC_TITLE.search(
+        title_text
+    )
+    min_start = desc_start if description_only else 0
+    position_matches = {
+        tag
+        for tag, group in _POSITION_TAG_GROUPS
+        if last_start.get(group, -1) >= min_start
+    }
+
+    return JobLabels(seniority_level, role_family, _position_tag(position_matches))
+
+
+class TechTagMatcher:
+    """
+    Finds every tag of a ``{tag: [needle, ...]}`` dictionary whose needles occur
+    as substrings of a job's lowercased title and description.
+
+    Dictionaries of at least ``trie_min_needles`` needles share one pattern,
+    so the text is scanned once no matter how many tags there are. The pattern
+    reports a single (longest) needle per start offset; the shorter needles
+    matching at that offset are exactly its prefixes, so each needle maps to
+    the tags of all of its prefixes too. Smaller dictionaries are cheaper to
+    match with one ``in`` scan per needle.
+    """
+
+    def __init__(
+        self,
+        tags: dict[str, list[str]],
+        language_order: list[str],
+        trie_min_needles: int | None = None,
+    ):
+        self.tags = tags
+        self.language_order = list(language_order)
+        needles = {needle for tag_needles in tags.values() for needle in tag_needles}
+        self._tags_by_needle = {
+            needle: frozenset(
+                tag
+                for tag, tag_needles in tags.items()
+                if any(needle.startswith(other) for other in tag_needles)
+            )
+            for needle in needles
+        }
+        if trie_min_needles is None:
+            trie_min_needles = TRIE_MIN_NEEDLES
+        self._pattern = (
+            re.compile(_trie_pattern(needles))
+            if needles and len(needles) >= trie_min_needles
+            else None
+        )
+
+    @classmethod
+    def from_file(cls, path: str | Path = TECH_TAGS_PATH) -> TechTagMatcher:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["tags"], data.get("language_order", []))
+
+    def extract(self, title, description) -> tuple[str | None, str | None]:
+        """Return ``(primary_language, tech_tags)``, or ``(None, None)``"""
+        tags = self._tags(f"{title or ''} {description or ''}".lower())
+        if not tags:
+            return None, None
+        primary_language = next(
+            (lang for lang in self.language_order if lang in tags), None
+        )
+        return primary_language, ",".join(sorted(tags))
+
+    def _tags(self, text: str) -> set[str]:
+        if self._pattern is None:
+            return {
+                tag
+                for tag, needles in self.tags.items()
+                if any(needle in text for needle in needles)
+            }
+        tags: set[str] = set()
+        search = self._pattern.search
+        match = search(text)
+        while match:
+            tags |= self._tags_by_needle[match.group()]
+            match = search(text, match.start() + 1)
+        return tags
+
+
+_TECH_TAGS: TechTagMatcher | None = None
+
+
+def extract_tech_tags(title, description) -> tuple[str | None, str | None]:
+    """Primary language and comma-separated tech tags of one job"""
+    global _TECH_TAGS
+    if _TECH_TAGS is None:
+        _TECH_TAGS = TechTagMatcher.from_file()
+    return _TECH_TAGS.extract(title, description)
@@ -6,7 +6,9 @@ import requests
 from typing import Tuple
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
 
+from jobspy import metrics
 from jobspy.glassdoor.constant import fallback_token, query_template, headers
 from jobspy.glassdoor.util import (
     get_cursor_for_page,
@@ -48,6 +50,8 @@ class Glassdoor(Scraper):
         self.base_url = None
         self.country = None
         self.session = None
+        # The Glassdoor domain the session's csrf token was fetched from
+        self.token_url = None
         self.scraper_input = None
         self.jobs_per_page = 30
         self.max_pages = 30
@@ -62,15 +66,20 @@ class Glassdoor(Scraper):
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
         self.base_url = self.scraper_input.country.get_glassdoor_url()
+        self.seen_urls = set()
 
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
-        )
-        token = self._get_csrf_token()
-        headers["gd-csrf-token"] = token if token else fallback_token
-        if self.user_agent:
-            headers["user-agent"] = self.user_agent
-        self.session.headers.update(headers)
+        # The session and its token are kept for later scrapes of the domain
+        if self.session is None:
+            self.session = create_session(
+                proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
+            )
+        if self.token_url != self.base_url:
+            token = self._get_csrf_token()
+            headers["gd-csrf-token"] = token if token else fallback_token
+            if self.user_agent:
+                headers["user-agent"] = self.user_agent
+            self.session.headers.update(headers)
+            self.token_url = self.base_url
 
         location_id, location_type = self._get_location(
             scraper_input.location, scraper_input.is_remote
@@ -114,6 +123,7 @@ class Glassdoor(Scraper):
         self.scraper_input = scraper_input
         try:
             payload = self._add_payload(location_id, location_type, page_num, cursor)
+            metrics.count("search_pages")
             response = self.session.post(
                 f"{self.base_url}/graph",
                 timeout_seconds=15,
@@ -138,7 +148,8 @@ class Glassdoor(Scraper):
 
         with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
             future_to_job_data = {
-                executor.submit(self._process_job, job): job for job in jobs_data
+                executor.submit(copy_context().run, self._process_job, job): job
+                for job in jobs_data
             }
             for future in as_completed(future_to_job_data):
                 try:
@@ -249,7 +260,10 @@ class Glassdoor(Scraper):
                 """,
             }
         ]
-        res = requests.post(url, json=body, headers=headers)
+        metrics.count("detail_fetches")
+        with metrics.timed("network_seconds"):
+            res = requests.post(url, json=body, headers=headers)
+        metrics.record_response(res)
         if res.status_code != 200:
             return None
         data = res.json()[0]
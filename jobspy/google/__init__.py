@@ -6,6 +6,7 @@ import json
 from typing import Tuple
 from datetime import datetime, timedelta
 
+from jobspy import metrics
 from jobspy.google.constant import headers_jobs, headers_initial, async_param
 from jobspy.model import (
     Scraper,
@@ -49,10 +50,15 @@ class Google(Scraper):
         """
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
+        self.seen_urls = set()
 
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
-        )
+        if self.session is None:
+            self.session = create_session(
+                proxies=self.proxies,
+                ca_cert=self.ca_cert,
+                is_tls=False,
+                has_retry=True,
+            )
         forward_cursor, job_list = self._get_initial_cursor_and_jobs()
         if forward_cursor is None:
             log.warning(
@@ -124,6 +130,7 @@ class Google(Scraper):
             query = self.scraper_input.google_search_term
 
         params = {"q": query, "udm": "8"}
+        metrics.count("search_pages")
         response = self.session.get(self.url, headers=headers_initial, params=params)
 
         pattern_fc = r'<div jsname="Yust4d"[^>]+data-async-fc="([^"]+)"'
@@ -139,6 +146,7 @@ class Google(Scraper):
 
     def _get_jobs_next_page(self, forward_cursor: str) -> Tuple[list[JobPost], str]:
         params = {"fc": [forward_cursor], "fcv": ["3"], "async": [async_param]}
+        metrics.count("search_pages")
         response = self.session.get(self.jobs_url, headers=headers_jobs, params=params)
         return self._parse_jobs(response.text)
 
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import math
 from datetime import datetime
-from typing import Tuple
+from typing import AsyncIterator, Generator, Iterator, Tuple
 
+from jobspy import metrics
 from jobspy.indeed.constant import job_search_query, api_headers
 from jobspy.indeed.util import is_job_remote, get_compensation, get_job_type
 from jobspy.model import (
+    AsyncScraper,
     Scraper,
     ScraperInput,
     Site,
@@ -17,6 +20,10 @@ from jobspy.model import (
     DescriptionFormat,
 )
 from jobspy.util import (
+    AsyncSession,
+    Fetch,
+    run_search,
+    run_search_async,
     extract_emails_from_text,
     markdown_converter,
     create_session,
@@ -27,6 +34,8 @@ log = create_logger("Indeed")
 
 
 class Indeed(Scraper):
+    api_url = "https://apis.indeed.com/graphql"
+
     def __init__(
         self,
         proxies: list[str] | str | None = None,
@@ -36,11 +45,9 @@ class Indeed(Scraper):
         """
         Initializes IndeedScraper with the Indeed API url
         """
-        super().__init__(Site.INDEED, proxies=proxies)
+        super().__init__(Site.INDEED, proxies=proxies, ca_cert=ca_cert)
 
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=ca_cert, is_tls=False
-        )
+        self.session = self._create_session()
         self.scraper_input = None
         self.jobs_per_page = 100
         self.num_workers = 10
@@ -48,7 +55,9 @@ class Indeed(Scraper):
         self.headers = None
         self.api_country_code = None
         self.base_url = None
-        self.api_url = "https://apis.indeed.com/graphql"
+
+    def _create_session(self):
+        return create_session(proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False)
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
@@ -56,41 +65,67 @@ class Indeed(Scraper):
         :param scraper_input:
         :return: job_response
         """
-        self.scraper_input = scraper_input
-        domain, self.api_country_code = self.scraper_input.country.indeed_domain_value
-        self.base_url = f"https://{domain}.indeed.com"
-        self.headers = api_headers.copy()
-        self.headers["indeed-co"] = self.scraper_input.country.indeed_domain_value
-        job_list = []
+        return JobResponse(
+            jobs=[job for page in self.scrape_pages(scraper_input) for job in page]
+        )
+
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        """
+        Scrapes Indeed page by page with scraper_input criteria
+        :param scraper_input:
+        :return: jobs of each page, within offset and results_wanted
+        """
+        yield from run_search(self._search(scraper_input), self.session)
+
+    def _search(self, scraper_input: ScraperInput) -> Generator:
+        """
+        The page loop of Indeed and AsyncIndeed, for run_search and
+        run_search_async to send its requests
+        :param scraper_input:
+        :return: generator of Fetch steps and job pages
+        """
+        self._start(scraper_input)
+        first = scraper_input.offset
+        last = scraper_input.offset + scraper_input.results_wanted
+        found = 0
         page = 1
 
         cursor = None
 
-        while len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset:
+        while len(self.seen_urls) < last:
             log.info(
                 f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
             )
-            jobs, cursor = self._scrape_page(cursor)
+            metrics.count("search_pages")
+            jobs, cursor = self._parse_page((yield self._page_request(cursor)))
             if not jobs:
                 log.info(f"found no jobs on page: {page}")
                 break
-            job_list += jobs
+            # Only the jobs between offset and offset + results_wanted count
+            wanted = jobs[max(first - found, 0) : max(last - found, 0)]
+            found += len(jobs)
+            if wanted:
+                yield wanted
             page += 1
-        return JobResponse(
-            jobs=job_list[
-                scraper_input.offset : scraper_input.offset
-                + scraper_input.results_wanted
-            ]
-        )
 
-    def _scrape_page(self, cursor: str | None) -> Tuple[list[JobPost], str | None]:
+    def _start(self, scraper_input: ScraperInput) -> None:
+        """
+        Sets up the country domain and headers for a search
+        :param scraper_input:
+        """
+        self.scraper_input = scraper_input
+        self.seen_urls = set()
+        domain, self.api_country_code = self.scraper_input.country.indeed_domain_value
+        self.base_url = f"https://{domain}.indeed.com"
+        self.headers = api_headers.copy()
+        self.headers["indeed-co"] = self.scraper_input.country.indeed_domain_value
+
+    def _page_request(self, cursor: str | None) -> Fetch:
         """
-        Scrapes a page of Indeed for jobs with scraper_input criteria
+        Builds the GraphQL request of a search page
         :param cursor:
-        :return: jobs found on page, next page cursor
+        :return: the POST request
         """
-        jobs = []
-        new_cursor = None
         filters = self._build_filters()
         search_term = (
             self.scraper_input.search_term.replace('"', '\\"')
@@ -113,13 +148,25 @@ class Indeed(Scraper):
         }
         api_headers_temp = api_headers.copy()
         api_headers_temp["indeed-co"] = self.api_country_code
-        response = self.session.post(
+        return Fetch(
+            "POST",
             self.api_url,
-            headers=api_headers_temp,
-            json=payload,
-            timeout=10,
-            verify=False,
+            {
+                "headers": api_headers_temp,
+                "json": payload,
+                "timeout": 10,
+                "verify": False,
+            },
         )
+
+    def _parse_page(self, response) -> Tuple[list[JobPost], str | None]:
+        """
+        Parses the jobs of a search page response
+        :param response:
+        :return: jobs found on page, next page cursor
+        """
+        jobs = []
+        new_cursor = None
         if not response.ok:
             log.info(
                 f"responded with status code: {response.status_code} (submit GitHub issue if this appears to be a bug)"
@@ -259,3 +306,38 @@ class Indeed(Scraper):
                 else None
             ),
         )
+
+
+class AsyncIndeed(AsyncScraper):
+    """
+    Indeed on an event loop. The GraphQL pages follow each other's cursor,
+    so they are awaited in turn; the page loop and parsing are Indeed's.
+    """
+
+    def __init__(
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        limit: int | asyncio.Semaphore = 5,
+        timeout: float | None = None,
+    ):
+        super().__init__(Site.INDEED, proxies=proxies, ca_cert=ca_cert)
+        self.scraper = Indeed(proxies=proxies, ca_cert=ca_cert)
+        self.session = AsyncSession(self.scraper._create_session, limit, timeout)
+
+    async def scrape_pages(
+        self, scraper_input: ScraperInput
+    ) -> AsyncIterator[list[JobPost]]:
+        """
+        Scrapes Indeed page by page with scraper_input criteria
+        :param scraper_input:
+        :return: jobs of each page, within offset and results_wanted
+        """
+        search = self.scraper._search(scraper_input)
+        async for jobs in run_search_async(search, self.session):
+            yield jobs
+
+    def close(self) -> None:
+        self.session.close()
+        self.scraper.session.close()
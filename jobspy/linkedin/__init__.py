@@ -1,16 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import math
 import random
-import time
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Generator, Iterator, Optional
 from urllib.parse import urlparse, urlunparse, unquote
 
 import regex as re
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 
+from jobspy import metrics
 from jobspy.exception import LinkedInException
 from jobspy.linkedin.constant import headers
 from jobspy.linkedin.util import (
@@ -21,6 +22,7 @@ from jobspy.linkedin.util import (
     parse_company_industry,
 )
 from jobspy.model import (
+    AsyncScraper,
     JobPost,
     Location,
     JobResponse,
@@ -32,6 +34,12 @@ from jobspy.model import (
     Site,
 )
 from jobspy.util import (
+    AsyncSession,
+    Fetch,
+    FetchAll,
+    Wait,
+    run_search,
+    run_search_async,
     extract_emails_from_text,
     currency_parser,
     markdown_converter,
@@ -60,18 +68,22 @@ class LinkedIn(Scraper):
         Initializes LinkedInScraper with the LinkedIn job search url
         """
         super().__init__(Site.LINKEDIN, proxies=proxies, ca_cert=ca_cert)
-        self.session = create_session(
+        self.session = self._create_session()
+        self.scraper_input = None
+        self.country = "worldwide"
+        self.job_url_direct_regex = re.compile(r'(?<=\?url=)[^"]+')
+
+    def _create_session(self):
+        session = create_session(
             proxies=self.proxies,
-            ca_cert=ca_cert,
+            ca_cert=self.ca_cert,
             is_tls=False,
             has_retry=True,
             delay=5,
             clear_cookies=True,
         )
-        self.session.headers.update(headers)
-        self.scraper_input = None
-        self.country = "worldwide"
-        self.job_url_direct_regex = re.compile(r'(?<=\?url=)[^"]+')
+        session.headers.update(headers)
+        return session
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
@@ -79,8 +91,27 @@ class LinkedIn(Scraper):
         :param scraper_input:
         :return: job_response
         """
+        return JobResponse(
+            jobs=[job for page in self.scrape_pages(scraper_input) for job in page]
+        )
+
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        """
+        Scrapes LinkedIn page by page with scraper_input criteria
+        :param scraper_input:
+        :return: jobs of each search page, up to results_wanted in total
+        """
+        yield from run_search(self._search(scraper_input), self.session)
+
+    def _search(self, scraper_input: ScraperInput) -> Generator:
+        """
+        The search page loop of LinkedIn and AsyncLinkedIn, for run_search
+        and run_search_async to send its requests and waits
+        :param scraper_input:
+        :return: generator of Fetch, FetchAll and Wait steps and job pages
+        """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        found = 0
         seen_ids = set()
         start = scraper_input.offset // 10 * 10 if scraper_input.offset else 0
         request_count = 0
@@ -89,92 +120,149 @@ class LinkedIn(Scraper):
         )
 
         def continue_search() -> bool:
-            return len(job_list) < scraper_input.results_wanted and start < 1000
+            return found < scraper_input.results_wanted and start < 1000
 
         while continue_search():
             request_count += 1
             log.info(
                 f"search page: {request_count} / {math.ceil(scraper_input.results_wanted / 10)}"
             )
-            params = {
-                "keywords": scraper_input.search_term,
-                "location": scraper_input.location,
-                "distance": scraper_input.distance,
-                "f_WT": 2 if scraper_input.is_remote else None,
-                "f_JT": (
-                    job_type_code(scraper_input.job_type)
-                    if scraper_input.job_type
-                    else None
-                ),
-                "pageNum": 0,
-                "start": start,
-                "f_AL": "true" if scraper_input.easy_apply else None,
-                "f_C": (
-                    ",".join(map(str, scraper_input.linkedin_company_ids))
-                    if scraper_input.linkedin_company_ids
-                    else None
-                ),
-            }
-            if seconds_old is not None:
-                params["f_TPR"] = f"r{seconds_old}"
-
-            params = {k: v for k, v in params.items() if v is not None}
             try:
-                response = self.session.get(
-                    f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?",
-                    params=params,
-                    timeout=10,
+                metrics.count("search_pages")
+                response = yield Fetch(
+                    "GET",
+                    self._search_url,
+                    {"params": self._search_params(start, seconds_old), "timeout": 10},
                 )
-                if response.status_code not in range(200, 400):
-                    if response.status_code == 429:
-                        err = "429 Response - Blocked by LinkedIn for too many requests"
-                    else:
-                        err = f"LinkedIn response status code {response.status_code}"
-                        err += f" - {response.text}"
-                    log.error(err)
-                    return JobResponse(jobs=job_list)
             except Exception as e:
-                if "Proxy responded with" in str(e):
-                    log.error("LinkedIn: Bad proxy")
-                else:
-                    log.error(f"LinkedIn: {str(e)}")
-                return JobResponse(jobs=job_list)
+                self._log_request_error(e)
+                return
+            if err := self._search_error(response):
+                log.error(err)
+                return
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            job_cards = soup.find_all("div", class_="base-search-card")
+            job_cards = self._parse_job_cards(response.text)
             if len(job_cards) == 0:
-                return JobResponse(jobs=job_list)
-
-            for job_card in job_cards:
-                href_tag = job_card.find("a", class_="base-card__full-link")
-                if href_tag and "href" in href_tag.attrs:
-                    href = href_tag.attrs["href"].split("?")[0]
-                    job_id = href.split("-")[-1]
-
-                    if job_id in seen_ids:
-                        continue
-                    seen_ids.add(job_id)
-
-                    try:
-                        fetch_desc = scraper_input.linkedin_fetch_description
-                        job_post = self._process_job(job_card, job_id, fetch_desc)
-                        if job_post:
-                            job_list.append(job_post)
-                        if not continue_search():
-                            break
-                    except Exception as e:
-                        raise LinkedInException(str(e))
+                return
+
+            cards = self._new_job_cards(job_cards, seen_ids)
+            cards = cards[: scraper_input.results_wanted - found]
+            details = [{}] * len(cards)
+            if scraper_input.linkedin_fetch_description:
+                metrics.count("detail_fetches", len(cards))
+                responses = yield FetchAll(
+                    [
+                        Fetch("GET", self._job_url(job_id), {"timeout": 5})
+                        for _, job_id in cards
+                    ]
+                )
+                details = [self._job_details(response) for response in responses]
+            try:
+                page_jobs = [
+                    self._parse_job_card(job_card, job_id, job_details)
+                    for (job_card, job_id), job_details in zip(cards, details)
+                ]
+            except Exception as e:
+                raise LinkedInException(str(e))
+            found += len(page_jobs)
 
+            if page_jobs:
+                yield page_jobs
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+                yield Wait(random.uniform(self.delay, self.delay + self.band_delay))
                 start += len(job_cards)
 
-        job_list = job_list[: scraper_input.results_wanted]
-        return JobResponse(jobs=job_list)
+    @property
+    def _search_url(self) -> str:
+        return f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?"
 
-    def _process_job(
-        self, job_card: Tag, job_id: str, full_descr: bool
-    ) -> Optional[JobPost]:
+    def _search_params(self, start: int, seconds_old: int | None) -> dict:
+        """
+        Builds the query params of the search page starting at start
+        :param start:
+        :param seconds_old:
+        :return: params
+        """
+        scraper_input = self.scraper_input
+        params = {
+            "keywords": scraper_input.search_term,
+            "location": scraper_input.location,
+            "distance": scraper_input.distance,
+            "f_WT": 2 if scraper_input.is_remote else None,
+            "f_JT": (
+                job_type_code(scraper_input.job_type)
+                if scraper_input.job_type
+                else None
+            ),
+            "pageNum": 0,
+            "start": start,
+            "f_AL": "true" if scraper_input.easy_apply else None,
+            "f_C": (
+                ",".join(map(str, scraper_input.linkedin_company_ids))
+                if scraper_input.linkedin_company_ids
+                else None
+            ),
+        }
+        if seconds_old is not None:
+            params["f_TPR"] = f"r{seconds_old}"
+
+        return {k: v for k, v in params.items() if v is not None}
+
+    @staticmethod
+    def _search_error(response) -> str | None:
+        """
+        Describes why a search page response cannot be used, if it cannot
+        :param response:
+        :return: error message or None
+        """
+        if response.status_code in range(200, 400):
+            return None
+        if response.status_code == 429:
+            return "429 Response - Blocked by LinkedIn for too many requests"
+        return f"LinkedIn response status code {response.status_code} - {response.text}"
+
+    @staticmethod
+    def _log_request_error(e: Exception) -> None:
+        if "Proxy responded with" in str(e):
+            log.error("LinkedIn: Bad proxy")
+        else:
+            log.error(f"LinkedIn: {str(e)}")
+
+    @staticmethod
+    def _parse_job_cards(html: str) -> list[Tag]:
+        with metrics.timed("parse_seconds"):
+            soup = BeautifulSoup(html, "html.parser")
+        return soup.find_all("div", class_="base-search-card")
+
+    @staticmethod
+    def _new_job_cards(job_cards: list[Tag], seen_ids: set) -> list[tuple[Tag, str]]:
+        """
+        Picks the job cards not seen on earlier pages
+        :param job_cards:
+        :param seen_ids: ids seen so far, updated in place
+        :return: (job_card, job_id) pairs
+        """
+        new_cards = []
+        for job_card in job_cards:
+            href_tag = job_card.find("a", class_="base-card__full-link")
+            if href_tag and "href" in href_tag.attrs:
+                href = href_tag.attrs["href"].split("?")[0]
+                job_id = href.split("-")[-1]
+
+                if job_id in seen_ids:
+                    continue
+                seen_ids.add(job_id)
+                new_cards.append((job_card, job_id))
+        return new_cards
+
+    def _parse_job_card(self, job_card: Tag, job_id: str, job_details: dict) -> JobPost:
+        """
+        Builds the JobPost of a search page job card
+        :param job_card:
+        :param job_id:
+        :param job_details: fetched from the job page, empty if not fetched
+        :return: job_post
+        """
         salary_tag = job_card.find("span", class_="job-search-card__salary-info")
 
         compensation = description = None
@@ -218,10 +306,7 @@ class LinkedIn(Scraper):
                 date_posted = datetime.strptime(datetime_str, "%Y-%m-%d")
             except Exception:
                 date_posted = None
-        job_details = {}
-        if full_descr:
-            job_details = self._get_job_details(job_id)
-            description = job_details.get("description")
+        description = job_details.get("description")
         is_remote = is_job_remote(title, description, location)
 
         return JobPost(
@@ -232,7 +317,7 @@ class LinkedIn(Scraper):
             location=location,
             is_remote=is_remote,
             date_posted=date_posted,
-            job_url=f"{self.base_url}/jobs/view/{job_id}",
+            job_url=self._job_url(job_id),
             compensation=compensation,
             job_type=job_details.get("job_type"),
             job_level=job_details.get("job_level", "").lower(),
@@ -244,23 +329,30 @@ class LinkedIn(Scraper):
             job_function=job_details.get("job_function"),
         )
 
-    def _get_job_details(self, job_id: str) -> dict:
+    def _job_details(self, response) -> dict:
         """
-        Retrieves job description and other job details by going to the job page url
-        :param job_page_url:
-        :return: dict
+        Job description and other details of a job page response
+        :param response: or the exception fetching the job page raised
+        :return: dict, empty if the page couldn't be fetched
         """
-        try:
-            response = self.session.get(
-                f"{self.base_url}/jobs/view/{job_id}", timeout=5
-            )
-            response.raise_for_status()
-        except Exception:
+        if isinstance(response, Exception) or not response.ok:
             return {}
+        return self._parse_job_details(response)
+
+    def _job_url(self, job_id: str) -> str:
+        return f"{self.base_url}/jobs/view/{job_id}"
+
+    def _parse_job_details(self, response) -> dict:
+        """
+        Parses the description and other job details of a job page response
+        :param response:
+        :return: dict
+        """
         if "linkedin.com/signup" in response.url:
             return {}
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        with metrics.timed("parse_seconds"):
+            soup = BeautifulSoup(response.text, "html.parser")
         div_content = soup.find(
             "div", class_=lambda x: x and "show-more-less-html__markup" in x
         )
@@ -341,3 +433,39 @@ class LinkedIn(Scraper):
                 job_url_direct = unquote(job_url_direct_match.group())
 
         return job_url_direct
+
+
+class AsyncLinkedIn(AsyncScraper):
+    """
+    LinkedIn on an event loop: search pages are fetched one after another
+    with the same delays as LinkedIn, the job pages of each search page
+    concurrently. The search loop and parsing are LinkedIn's.
+    """
+
+    def __init__(
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        limit: int | asyncio.Semaphore = 5,
+        timeout: float | None = None,
+    ):
+        super().__init__(Site.LINKEDIN, proxies=proxies, ca_cert=ca_cert)
+        self.scraper = LinkedIn(proxies=proxies, ca_cert=ca_cert)
+        self.session = AsyncSession(self.scraper._create_session, limit, timeout)
+
+    async def scrape_pages(
+        self, scraper_input: ScraperInput
+    ) -> AsyncIterator[list[JobPost]]:
+        """
+        Scrapes LinkedIn page by page with scraper_input criteria
+        :param scraper_input:
+        :return: jobs of each search page, up to results_wanted in total
+        """
+        search = self.scraper._search(scraper_input)
+        async for jobs in run_search_async(search, self.session):
+            yield jobs
+
+    def close(self) -> None:
+        self.session.close()
+        self.scraper.session.close()
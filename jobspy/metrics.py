@@ -0,0 +1,117 @@
+"""
+jobspy.metrics
+~~~~~~~~~~~~~~
+
+Per-site counters and stage timings of a scrape.
+
+Pass a ScrapeMetrics to scrape_jobs(metrics=...) and every site's scraper
+records into it while it runs: the HTTP sessions count requests, bytes
+downloaded, retries, 429 responses and time spent on the network; the
+scrapers count search pages and detail fetches; the description converters
+time the parsing. Without one, count() and timed() are no-ops.
+
+The active collector and site are kept in context variables, set by
+ScrapeMetrics.recording() around each site's scrape, so scraper code does
+not need to pass them around.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Counters every site reports, so reports line up even when a site did
+# nothing; timings end in _seconds
+COUNTERS = (
+    "search_pages",
+    "detail_fetches",
+    "requests",
+    "request_errors",
+    "bytes_downloaded",
+    "retries",
+    "rate_limited",
+    "network_seconds",
+    "parse_seconds",
+)
+
+_metrics: ContextVar[ScrapeMetrics | None] = ContextVar("metrics", default=None)
+_site: ContextVar[str | None] = ContextVar("metrics_site", default=None)
+
+
+class ScrapeMetrics:
+    """Thread-safe counters keyed by site"""
+
+    def __init__(self):
+        self._sites: dict[str, Counter] = {}
+        self._lock = threading.Lock()
+
+    def _counters(self, site: str) -> Counter:
+        counters = self._sites.get(site)
+        if counters is None:
+            counters = self._sites[site] = Counter(dict.fromkeys(COUNTERS, 0))
+        return counters
+
+    def add(self, site: str, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters(site)[name] += value
+
+    @contextmanager
+    def recording(self, site: str):
+        """Make count() and timed() in this thread record into site"""
+        with self._lock:
+            self._counters(site)
+        metrics_token = _metrics.set(self)
+        site_token = _site.set(site)
+        try:
+            yield self
+        finally:
+            _site.reset(site_token)
+            _metrics.reset(metrics_token)
+
+    def sites(self) -> dict[str, dict[str, float]]:
+        """Snapshot of the counters of every site seen so far"""
+        with self._lock:
+            return {site: dict(counters) for site, counters in self._sites.items()}
+
+
+def count(name: str, value: float = 1) -> None:
+    """Add value to counter name of the site being scraped, if any"""
+    metrics = _metrics.get()
+    if metrics is not None:
+        metrics.add(_site.get(), name, value)
+
+
+@contextmanager
+def timed(name: str):
+    """Add the seconds the block takes to counter name"""
+    if _metrics.get() is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        count(name, time.perf_counter() - started)
+
+
+def record_response(response) -> None:
+    """Count one HTTP response: size, retries and 429s"""
+    if _metrics.get() is None:
+        return
+    count("requests")
+    content = getattr(response, "content", None)
+    if content:
+        count("bytes_downloaded", len(content))
+    # urllib3 keeps the attempts it retried on the final response
+    retries = getattr(getattr(response, "raw", None), "retries", None)
+    history = getattr(retries, "history", None) or ()
+    if history:
+        count("retries", len(history))
+    rate_limited = sum(1 for attempt in history if attempt.status == 429)
+    if response.status_code == 429:
+        rate_limited += 1
+    if rate_limited:
+        count("rate_limited", rate_limited)
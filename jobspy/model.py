@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterator, Optional
 from datetime import date
 from enum import Enum
 from pydantic import BaseModel
@@ -236,3 +239,88 @@ class Scraper(ABC):
 
     @abstractmethod
     def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
+
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        """
+        Yields the jobs scrape() returns, one search page at a time, as soon
+        as each page is parsed. Scrapers that paginate override this; the
+        default yields everything as a single page once scrape() finishes.
+        """
+        yield self.scrape(scraper_input).jobs
+
+
+class AsyncScraper(ABC):
+    def __init__(
+        self,
+        site: Site,
+        proxies: list[str] | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+    ):
+        self.site = site
+        self.proxies = proxies
+        self.ca_cert = ca_cert
+        self.user_agent = user_agent
+
+    async def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+        return JobResponse(
+            jobs=[
+                job async for page in self.scrape_pages(scraper_input) for job in page
+            ]
+        )
+
+    @abstractmethod
+    def scrape_pages(
+        self, scraper_input: ScraperInput
+    ) -> AsyncIterator[list[JobPost]]: ...
+
+    def close(self) -> None:
+        """
+        Releases the scraper's threads and sessions once its search stopped.
+        Work still in progress ends on its own, without a caller waiting.
+        """
+
+
+class ThreadedScraper(AsyncScraper):
+    """
+    Runs a blocking Scraper on a thread of its own, for the sites without a
+    native async scraper. Its pages are pulled one at a time, so once the
+    caller stops reading, the scraper stops after the page it is on.
+    """
+
+    def __init__(self, scraper: Scraper):
+        super().__init__(
+            scraper.site,
+            proxies=scraper.proxies,
+            ca_cert=scraper.ca_cert,
+            user_agent=scraper.user_agent,
+        )
+        self.scraper = scraper
+        self._executor = ThreadPoolExecutor(
+            1, thread_name_prefix=f"jobspy-{scraper.site.value}"
+        )
+
+    async def scrape_pages(
+        self, scraper_input: ScraperInput
+    ) -> AsyncIterator[list[JobPost]]:
+        loop = asyncio.get_running_loop()
+        # One context for every page, so metrics record into this site
+        context = contextvars.copy_context()
+        pages = self.scraper.scrape_pages(scraper_input)
+        try:
+            while True:
+                jobs = await loop.run_in_executor(
+                    self._executor, context.run, next, pages, None
+                )
+                if jobs is None:
+                    return
+                yield jobs
+        finally:
+            # Queued behind the page in progress, if any
+            self._executor.submit(context.run, pages.close)
+
+    def close(self) -> None:
+        session = getattr(self.scraper, "session", None)
+        if session is not None:
+            self._executor.submit(session.close)
+        self._executor.shutdown(wait=False)
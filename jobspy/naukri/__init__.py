@@ -8,6 +8,7 @@ from typing import Optional
 
 import regex as re
 
+from jobspy import metrics
 from jobspy.exception import NaukriException
 from jobspy.naukri.constant import headers as naukri_headers
 from jobspy.naukri.util import (
@@ -109,6 +110,7 @@ class Naukri(Scraper):
             params = {k: v for k, v in params.items() if v is not None}
             try:
                 log.debug(f"Sending request to {self.base_url} with params: {params}")
+                metrics.count("search_pages")
                 response = self.session.get(self.base_url, params=params, timeout=10)
                 if response.status_code not in range(200, 400):
                     err = f"Naukri API response status code {response.status_code} - {response.text}"
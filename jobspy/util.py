@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from itertools import cycle
+from typing import AsyncIterator, Callable, Generator, Iterator, NamedTuple
 
 import numpy as np
 import requests
@@ -11,6 +17,7 @@ import urllib3
 from markdownify import markdownify as md
 from requests.adapters import HTTPAdapter, Retry
 
+from jobspy import metrics
 from jobspy.model import CompensationInterval, JobType, Site
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -29,6 +36,37 @@ def create_logger(name: str):
     return logger
 
 
+# Set by AsyncSession on its worker thread while it sends a request
+_request_deadline = contextvars.ContextVar("request_deadline", default=None)
+
+
+class DeadlineRetry(Retry):
+    """
+    Retry that neither retries nor backs off past the deadline AsyncSession
+    gives the request being sent; without one it is a plain Retry
+    """
+
+    def is_exhausted(self) -> bool:
+        deadline = _request_deadline.get()
+        return super().is_exhausted() or (
+            deadline is not None and time.monotonic() >= deadline
+        )
+
+    def get_backoff_time(self) -> float:
+        return self._until_deadline(super().get_backoff_time())
+
+    def get_retry_after(self, response) -> float | None:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else self._until_deadline(retry_after)
+
+    @staticmethod
+    def _until_deadline(seconds: float) -> float:
+        deadline = _request_deadline.get()
+        if deadline is None:
+            return seconds
+        return min(seconds, max(deadline - time.monotonic(), 0))
+
+
 class RotatingProxySession:
     def __init__(self, proxies=None):
         if isinstance(proxies, str):
@@ -62,7 +100,7 @@ class RequestsRotating(RotatingProxySession, requests.Session):
 
     def setup_session(self, has_retry, delay):
         if has_retry:
-            retries = Retry(
+            retries = DeadlineRetry(
                 total=3,
                 connect=3,
                 status=3,
@@ -83,7 +121,14 @@ class RequestsRotating(RotatingProxySession, requests.Session):
                 self.proxies = next_proxy
             else:
                 self.proxies = {}
-        return requests.Session.request(self, method, url, **kwargs)
+        try:
+            with metrics.timed("network_seconds"):
+                response = requests.Session.request(self, method, url, **kwargs)
+        except Exception:
+            metrics.count("request_errors")
+            raise
+        metrics.record_response(response)
+        return response
 
 
 class TLSRotating(RotatingProxySession, tls_client.Session):
@@ -98,7 +143,13 @@ class TLSRotating(RotatingProxySession, tls_client.Session):
                 self.proxies = next_proxy
             else:
                 self.proxies = {}
-        response = tls_client.Session.execute_request(self, *args, **kwargs)
+        try:
+            with metrics.timed("network_seconds"):
+                response = tls_client.Session.execute_request(self, *args, **kwargs)
+        except Exception:
+            metrics.count("request_errors")
+            raise
+        metrics.record_response(response)
         response.ok = response.status_code in range(200, 400)
         return response
 
@@ -132,6 +183,193 @@ def create_session(
     return session
 
 
+class AsyncSession:
+    """
+    Awaitable requests, sent on a pool of `workers` threads that each make
+    their own session with new_session, as sessions aren't thread-safe. At
+    most `limit` requests run at once; pass one asyncio.Semaphore as limit
+    to share it between sessions (workers then defaults to 5). A request is
+    sent with its timeout capped at the `timeout` seconds left for it and
+    isn't retried past them, so one the caller stopped waiting for ends by
+    itself; it holds its slot until then. close() drops the requests not
+    sent yet and closes the sessions.
+    """
+
+    def __init__(
+        self,
+        new_session: Callable[[], requests.Session],
+        limit: int | asyncio.Semaphore = 5,
+        timeout: float | None = None,
+        workers: int | None = None,
+    ):
+        self.new_session = new_session
+        if isinstance(limit, asyncio.Semaphore):
+            self.limit = limit
+        else:
+            self.limit = asyncio.Semaphore(limit)
+            workers = workers or limit
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            workers or 5, thread_name_prefix="jobspy-request"
+        )
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+
+    async def request(self, method: str, url: str, **kwargs):
+        loop = asyncio.get_running_loop()
+        await self.limit.acquire()
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        try:
+            # In a copy of the context, so metrics record into this site
+            request = self._executor.submit(
+                contextvars.copy_context().run,
+                self._send,
+                method,
+                url,
+                deadline,
+                kwargs,
+            )
+        except BaseException:
+            self.limit.release()
+            raise
+        request.add_done_callback(lambda _: self._release(loop))
+        return await asyncio.wait_for(asyncio.wrap_future(request), self.timeout)
+
+    def _send(self, method: str, url: str, deadline: float | None, kwargs: dict):
+        if deadline is not None:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                raise TimeoutError(f"{method} {url} timed out before it was sent")
+            timeout = kwargs.get("timeout")
+            kwargs["timeout"] = left if timeout is None else min(timeout, left)
+        _request_deadline.set(deadline)
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self.new_session()
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session.request(method, url, **kwargs)
+
+    def _release(self, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            loop.call_soon_threadsafe(self.limit.release)
+        except RuntimeError:
+            pass  # the loop is closed; nobody is waiting for a slot
+
+    async def get(self, url: str, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+
+
+class Fetch(NamedTuple):
+    """
+    A request a search generator yields: its response is sent back into the
+    generator, or the exception sending it raised is thrown in
+    """
+
+    method: str
+    url: str
+    kwargs: dict
+
+
+class FetchAll(NamedTuple):
+    """
+    Requests a search generator yields to have sent, concurrently where the
+    runner can: their responses, or the exceptions they raised, are sent
+    back as a list in the same order
+    """
+
+    fetches: list[Fetch]
+
+
+class Wait(NamedTuple):
+    """Seconds a search generator yields to pause for"""
+
+    seconds: float
+
+
+def run_search(search: Generator, session: requests.Session) -> Iterator[list]:
+    """
+    Runs a search generator with blocking calls: its Fetch and FetchAll
+    requests are sent on session one after another and Waits sleep. Every
+    other value it yields is a page of jobs, yielded on.
+    """
+    try:
+        reply = error = None
+        while True:
+            try:
+                step = search.send(reply) if error is None else search.throw(error)
+            except StopIteration:
+                return
+            reply = error = None
+            if isinstance(step, Fetch):
+                try:
+                    reply = session.request(step.method, step.url, **step.kwargs)
+                except Exception as e:
+                    error = e
+            elif isinstance(step, FetchAll):
+                reply = []
+                for fetch in step.fetches:
+                    try:
+                        reply.append(
+                            session.request(fetch.method, fetch.url, **fetch.kwargs)
+                        )
+                    except Exception as e:
+                        reply.append(e)
+            elif isinstance(step, Wait):
+                time.sleep(step.seconds)
+            else:
+                yield step
+    finally:
+        search.close()
+
+
+async def run_search_async(
+    search: Generator, session: AsyncSession
+) -> AsyncIterator[list]:
+    """
+    Runs a search generator on the event loop, like run_search: the
+    requests of a FetchAll are sent concurrently on session.
+    """
+    try:
+        reply = error = None
+        while True:
+            try:
+                step = search.send(reply) if error is None else search.throw(error)
+            except StopIteration:
+                return
+            reply = error = None
+            if isinstance(step, Fetch):
+                try:
+                    reply = await session.request(step.method, step.url, **step.kwargs)
+                except Exception as e:
+                    error = e
+            elif isinstance(step, FetchAll):
+                reply = await asyncio.gather(
+                    *(
+                        session.request(fetch.method, fetch.url, **fetch.kwargs)
+                        for fetch in step.fetches
+                    ),
+                    return_exceptions=True,
+                )
+            elif isinstance(step, Wait):
+                await asyncio.sleep(step.seconds)
+            else:
+                yield step
+    finally:
+        search.close()
+
+
 def set_logger_level(verbose: int):
     """
     Adjusts the logger's level. This function allows the logging level to be changed at runtime.
@@ -154,7 +392,8 @@ def set_logger_level(verbose: int):
 def markdown_converter(description_html: str):
     if description_html is None:
         return None
-    markdown = md(description_html)
+    with metrics.timed("parse_seconds"):
+        markdown = md(description_html)
     return markdown.strip()
 
 
@@ -163,9 +402,10 @@ def plain_converter(decription_html: str):
 
     if decription_html is None:
         return None
-    soup = BeautifulSoup(decription_html, "html.parser")
-    text = soup.get_text(separator=" ")
-    text = re.sub(r"\s+", " ", text)
+    with metrics.timed("parse_seconds"):
+        soup = BeautifulSoup(decription_html, "html.parser")
+        text = soup.get_text(separator=" ")
+        text = re.sub(r"\s+", " ", text)
     return text.strip()
 
 
@@ -5,10 +5,12 @@ import math
 import re
 import time
 from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from datetime import datetime
 
 from bs4 import BeautifulSoup
 
+from jobspy import metrics
 from jobspy.ziprecruiter.constant import headers, get_cookie_data
 from jobspy.util import (
     extract_emails_from_text,
@@ -64,6 +66,7 @@ class ZipRecruiter(Scraper):
         :return: JobResponse containing a list of jobs.
         """
         self.scraper_input = scraper_input
+        self.seen_urls = set()
         job_list: list[JobPost] = []
         continue_token = None
 
@@ -99,6 +102,7 @@ class ZipRecruiter(Scraper):
         if continue_token:
             params["continue_from"] = continue_token
         try:
+            metrics.count("search_pages")
             res = self.session.get(f"{self.api_url}/jobs-app/jobs", params=params)
             if res.status_code not in range(200, 400):
                 if res.status_code == 429:
@@ -119,7 +123,10 @@ class ZipRecruiter(Scraper):
         jobs_list = res_data.get("jobs", [])
         next_continue_token = res_data.get("continue", None)
         with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            job_results = [executor.submit(self._process_job, job) for job in jobs_list]
+            job_results = [
+                executor.submit(copy_context().run, self._process_job, job)
+                for job in jobs_list
+            ]
 
         job_list = list(filter(None, (result.result() for result in job_results)))
         return job_list, next_continue_token
@@ -180,6 +187,7 @@ class ZipRecruiter(Scraper):
         )
 
     def _get_descr(self, job_url):
+        metrics.count("detail_fetches")
         res = self.session.get(job_url, allow_redirects=True)
         description_full = job_url_direct = None
         if res.ok:
@@ -1,33 +1,708 @@
+import io
 import os
+import contextvars
+import hashlib
+import json
 import logging
-import re
+import math
+import multiprocessing
+import queue
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import NamedTuple
+from urllib.parse import urlencode
 import pandas as pd
-from jobspy import scrape_jobs
+from jobspy import JobSpy, scrape_jobs, scrape_jobs_iter
+from jobspy import classifier
+from jobspy.classifier import classify, extract_tech_tags
 from jobspy.config import CONFIG_GROUPS
+from jobspy.metrics import COUNTERS, ScrapeMetrics
 import psycopg2
 from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
+import statistics
 import time
 import requests
+from requests.adapters import HTTPAdapter
+
+# query_id of the config being run, when configs run concurrently; log lines
+# are prefixed with it to keep them attributable. A context variable rather
+# than a thread-local, because jobspy copies the context into the threads
+# it scrapes each site on.
+_log_query_id = contextvars.ContextVar("log_query_id", default=None)
+
+
+class _ConfigContextFilter(logging.Filter):
+    def filter(self, record):
+        query_id = _log_query_id.get()
+        record.config_prefix = f"[{query_id}] " if query_id else ""
+        return True
+
 
 # Configure logging
+_log_handlers = [logging.FileHandler("scraper.log"), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.addFilter(_ConfigContextFilter())
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("scraper.log"), logging.StreamHandler()],
+    format="%(asctime)s - %(levelname)s - %(config_prefix)s%(message)s",
+    handlers=_log_handlers,
 )
 logger = logging.getLogger(__name__)
 
+# jobspy's loggers don't propagate and have handlers of their own
+for _name, _jobspy_logger in list(logging.root.manager.loggerDict.items()):
+    if _name.startswith("JobSpy:") and isinstance(_jobspy_logger, logging.Logger):
+        for _handler in _jobspy_logger.handlers:
+            _handler.addFilter(_ConfigContextFilter())
+            _handler.setFormatter(
+                logging.Formatter(
+                    "%(asctime)s - %(levelname)s - %(name)s - "
+                    "%(config_prefix)s%(message)s"
+                )
+            )
+
+
+JOB_COLUMNS = [
+    "id",
+    "site",
+    "job_url",
+    "job_url_direct",
+    "title",
+    "company",
+    "location",
+    "date_posted",
+    "job_type",
+    "salary_source",
+    "min_amount",
+    "max_amount",
+    "currency",
+    "is_remote",
+    "job_level",
+    "job_function",
+    "listing_type",
+    "emails",
+    "description",
+    "company_industry",
+    "company_url",
+    "company_logo",
+    "company_url_direct",
+    "company_description",
+    "skills",
+    "seniority_level",
+    "primary_language",
+    "tech_tags",
+    "city_normalized",
+    "country_normalized",
+    "position_tag",
+    "company_profile",
+    "content_hash",
+]
+
+# Loader modes for JobDatabase.insert_jobs: "values" uses execute_values
+# directly, "copy" streams rows through COPY into a temporary staging table.
+# At the writer's batch sizes the two tie once descriptions are realistic
+# (see bench_db_loader.py), so the simpler "values" is the default.
+LOADER_COPY = "copy"
+LOADER_VALUES = "values"
+
+# Write modes for JobDatabase.insert_jobs: "insert" never touches stored jobs,
+# "upsert" rewrites stored jobs whose content_hash changed.
+WRITE_INSERT = "insert"
+WRITE_UPSERT = "upsert"
+
+# Partitioned schema: jobs is range-partitioned by retention_date, the day a
+# job's retention clock started (date_posted, else the day it was stored),
+# into one jobs_pYYYYMMDD partition per day plus jobs_default for the rest.
+# Its primary key has to include retention_date, so Postgres only enforces
+# unique (id, retention_date) pairs. insert_jobs keeps ids unique by looking
+# up stored ids (existing_job_ids, stored_retention_dates) before writing;
+# those lookups raise rather than report nothing stored, and concurrent
+# writers of the same new id are not guarded against.
+PARTITION_PREFIX = "jobs_p"
+DEFAULT_PARTITION = "jobs_default"
+
+
+# Columns returned by JobDatabase.search_jobs, and the date its results are
+# ordered and filtered by: when the job was posted, else when it was stored
+SEARCH_COLUMNS = [
+    "id",
+    "site",
+    "job_url",
+    "title",
+    "company",
+    "location",
+    "date_posted",
+    "is_remote",
+    "seniority_level",
+    "position_tag",
+    "tech_tags",
+    "city_normalized",
+    "country_normalized",
+]
+SEARCH_DATE = "COALESCE(date_posted, created_at::date)"
+# Filter columns also indexed as "column:value" lexemes in search_vector, so
+# text searches narrow by them inside the GIN index
+SEARCH_FACETS = ("position_tag", "seniority_level", "country_normalized")
+# Text searches the planner expects to match at most this many jobs are
+# sorted from the GIN index results instead of walking the date index
+SEARCH_SORT_ROWS = 5000
+
+
+class WriteCounts(NamedTuple):
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+
+
+class WriteTimings(NamedTuple):
+    # Normalizing and enriching the rows
+    enrich_seconds: float = 0.0
+    # Existence checks and the insert statement
+    insert_seconds: float = 0.0
+
+
+def _env_int(name, default):
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.error(f"Invalid {name} value: {value}. Using default {default}.")
+        return default
+
+
+_MISSING = object()
+
+
+class EnrichmentCache:
+    """Bounded LRU of enrichment results keyed by a hash of the job's inputs.
+
+    Reposted jobs show up under many queries with identical title, description
+    and company fields; those are enriched once per cache lifetime. With a
+    path the cache is loaded from and saved to a JSON file, so it is reused
+    between runs. The file records a fingerprint of the enrichment code and
+    tag dictionary and is ignored once either changes.
+    """
+
+    def __init__(self, max_entries, path=None):
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._fingerprint = self._code_fingerprint()
+        if path:
+            self.load()
+
+    @staticmethod
+    def _code_fingerprint():
+        digest = hashlib.blake2b(digest_size=16)
+        for path in (__file__, classifier.__file__, classifier.TECH_TAGS_PATH):
+            try:
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+            except OSError:
+                digest.update(str(path).encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def key(record):
+        payload = json.dumps(record, default=str, ensure_ascii=False)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return default
+            return self._entries[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record(self, hits, misses):
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable enrichment cache {self.path}: {e}")
+            return
+        if data.get("fingerprint") != self._fingerprint:
+            logger.info("Enrichment rules changed; starting with an empty cache")
+            return
+        for key, value in data.get("entries", []):
+            self.put(key, tuple(value) if value is not None else None)
+        logger.info(f"Loaded {len(self._entries)} enrichment cache entries")
+
+    def _snapshot(self):
+        with self._lock:
+            return list(self._entries.items())
+
+    def save(self):
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "fingerprint": self._fingerprint,
+                        "entries": self._snapshot(),
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error(f"Error saving enrichment cache {self.path}: {e}")
+
+
+class Translator:
+    """Batched, cached DeepL client.
+
+    Texts are deduplicated by content hash and looked up in the ``translations``
+    table first. The rest are sent in batches of several ``text`` fields per
+    request, with at most ``concurrency`` requests in flight on one pooled
+    session. translate_jobs_async() runs all of that on a background thread so
+    inserts never wait on the translation API.
+    """
+
+    # DeepL accepts up to 50 texts and 128 KiB of request body per call
+    MAX_BATCH_SIZE = 50
+    MAX_BATCH_BYTES = 128 * 1024
+
+    def __init__(
+        self,
+        api_key,
+        api_url="https://api-free.deepl.com/v2/translate",
+        db=None,
+        target_lang="EN",
+        batch_size=MAX_BATCH_SIZE,
+        concurrency=4,
+        timeout=10,
+    ):
+        self.api_key = api_key
+        self.api_url = api_url
+        self.db = db
+        self.target_lang = target_lang
+        self.batch_size = min(max(batch_size, 1), self.MAX_BATCH_SIZE)
+        self.concurrency = max(concurrency, 1)
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=self.concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._requests = ThreadPoolExecutor(
+            self.concurrency, thread_name_prefix="deepl"
+        )
+        # One background thread keeps job translation off the insert path;
+        # its HTTP batches still fan out over the request pool above.
+        self._background = ThreadPoolExecutor(1, thread_name_prefix="translate")
+        self._pending = []
+        self._pending_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, db=None):
+        """Translator configured from DEEPL_* / TRANSLATION_* or None if disabled"""
+        enabled = os.getenv("TRANSLATION_ENABLED", "false").lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+        api_key = os.getenv("DEEPL_API_KEY")
+        if not enabled or not api_key:
+            return None
+        return cls(
+            api_key,
+            api_url=os.getenv(
+                "DEEPL_API_URL", "https://api-free.deepl.com/v2/translate"
+            ),
+            db=db,
+            target_lang=os.getenv("TRANSLATION_TARGET_LANG", "EN"),
+            batch_size=_env_int("TRANSLATION_BATCH_SIZE", cls.MAX_BATCH_SIZE),
+            concurrency=_env_int("TRANSLATION_CONCURRENCY", 4),
+        )
+
+    @staticmethod
+    def content_hash(text):
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def translate(self, texts, target_lang=None):
+        """Translate texts, returning None in place of any that failed"""
+        target_lang = target_lang or self.target_lang
+        hashes = [self.content_hash(text) if text else None for text in texts]
+        unique = {h: text for h, text in zip(hashes, texts) if h is not None}
+        if not unique:
+            return [None] * len(texts)
+
+        translated = self._cached(list(unique), target_lang)
+        missing = [(h, text) for h, text in unique.items() if h not in translated]
+        futures = [
+            (batch, self._requests.submit(self._request_batch, batch, target_lang))
+            for batch in self._batches(missing, target_lang)
+        ]
+        fresh = {}
+        for batch, future in futures:
+            for (h, _), text in zip(batch, future.result()):
+                if text is not None:
+                    fresh[h] = text
+        if fresh:
+            self._store(fresh, target_lang)
+            translated.update(fresh)
+        return [translated.get(h) for h in hashes]
+
+    def _batches(self, items, target_lang):
+        """Split items into batches whose url-encoded request body fits the
+        API's size limit. A text too large on its own is sent alone.
+        """
+        base = len(urlencode({"target_lang": target_lang}))
+        batch, size = [], base
+        for item in items:
+            # Each field adds "&text=<encoded text>" to the body
+            field_size = len(urlencode({"text": item[1]})) + 1
+            if batch and (
+                len(batch) >= self.batch_size
+                or size + field_size > self.MAX_BATCH_BYTES
+            ):
+                yield batch
+                batch, size = [], base
+            batch.append(item)
+            size += field_size
+        if batch:
+            yield batch
+
+    def _request_batch(self, batch, target_lang):
+        fields = [("text", text) for _, text in batch]
+        fields.append(("target_lang", target_lang))
+        try:
+            response = self.session.post(
+                self.api_url,
+                data=fields,
+                headers={"Authorization": f"DeepL-Auth-Key {self.api_key}"},
+                timeout=self.timeout,
+            )
+            if response.status_code != 200:
+                logger.error(
+                    f"Translation API error: {response.status_code} {response.text}"
+                )
+                return [None] * len(batch)
+            translations = response.json().get("translations") or []
+        except Exception as e:
+            logger.error(f"Error translating batch of {len(batch)} texts: {e}")
+            return [None] * len(batch)
+        if len(translations) != len(batch):
+            logger.error(
+                f"Translation API returned {len(translations)} results "
+                f"for {len(batch)} texts"
+            )
+            return [None] * len(batch)
+        return [t.get("text") or None for t in translations]
+
+    def _cached(self, hashes, target_lang):
+        if self.db is None:
+            return {}
+        try:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "SELECT content_hash, translated_text FROM translations "
+                        "WHERE target_lang = %s AND content_hash = ANY(%s)",
+                        (target_lang, hashes),
+                    )
+                    return dict(cur.fetchall())
+        except Exception as e:
+            logger.error(f"Error reading translation cache: {e}")
+            return {}
+
+    def _store(self, translated, target_lang):
+        if self.db is None:
+            return
+        try:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    execute_values(
+                        cur,
+                        "INSERT INTO translations "
+                        "(content_hash, target_lang, translated_text) VALUES %s "
+                        "ON CONFLICT (content_hash, target_lang) DO NOTHING",
+                        [(h, target_lang, text) for h, text in translated.items()],
+                    )
+                    conn.commit()
+        except Exception as e:
+            logger.error(f"Error writing translation cache: {e}")
+
+    def translate_jobs_async(self, jobs):
+        """Queue (id, title, description) tuples for background translation"""
+        future = self._background.submit(self._translate_jobs, jobs)
+        with self._pending_lock:
+            self._pending = [f for f in self._pending if not f.done()]
+            self._pending.append(future)
+
+    def _translate_jobs(self, jobs):
+        ids = [job[0] for job in jobs]
+        texts = self.translate([job[1] for job in jobs] + [job[2] for job in jobs])
+        rows = [
+            (job_id, title, description)
+            for job_id, title, description in zip(
+                ids, texts[: len(jobs)], texts[len(jobs) :]
+            )
+            if title is not None or description is not None
+        ]
+        if not rows or self.db is None:
+            return len(rows)
+        with self.db.get_connection() as conn:
+            with conn.cursor() as cur:
+                execute_values(
+                    cur,
+                    """
+                    UPDATE jobs SET
+                        title_translated = COALESCE(v.title, jobs.title_translated),
+                        description_translated = COALESCE(
+                            v.description, jobs.description_translated
+                        )
+                    FROM (VALUES %s) AS v(id, title, description)
+                    WHERE jobs.id = v.id
+                    """,
+                    rows,
+                )
+                conn.commit()
+        logger.info(f"Translated {len(rows)} jobs")
+        return len(rows)
+
+    def wait(self):
+        """Block until every queued job translation has finished"""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error translating jobs: {e}")
+
+    def close(self):
+        self.wait()
+        self._background.shutdown()
+        self._requests.shutdown()
+        self.session.close()
+
 
 class JobDatabase:
-    def __init__(self, connection_string):
+    def __init__(
+        self,
+        connection_string,
+        min_connections=None,
+        max_connections=None,
+        healthcheck_interval=None,
+        loader=None,
+        enrich_workers=None,
+        enrich_min_batch=None,
+        enrich_cache_size=None,
+        enrich_cache_path=None,
+        write_mode=None,
+        partitioned=None,
+        cleanup_batch_size=None,
+    ):
         self.connection_string = connection_string
+        self.min_connections = (
+            min_connections
+            if min_connections is not None
+            else _env_int("DB_POOL_MIN", 1)
+        )
+        self.max_connections = max(
+            self.min_connections,
+            max_connections
+            if max_connections is not None
+            else _env_int("DB_POOL_MAX", 5),
+            1,
+        )
+        # Connections idle for longer than this many seconds are pinged
+        # before being handed out again.
+        self.healthcheck_interval = (
+            healthcheck_interval
+            if healthcheck_interval is not None
+            else _env_int("DB_POOL_HEALTHCHECK_SECONDS", 30)
+        )
+        self._pool = ThreadedConnectionPool(
+            self.min_connections, self.max_connections, connection_string
+        )
+        # ThreadedConnectionPool raises instead of waiting when exhausted, so
+        # callers block on this semaphore until a connection is returned.
+        self._pool_slots = threading.BoundedSemaphore(self.max_connections)
+        self._last_used = {}
+        self.loader = (loader or os.getenv("DB_LOADER", LOADER_VALUES)).lower()
+        if self.loader not in (LOADER_COPY, LOADER_VALUES):
+            logger.error(
+                f"Invalid DB_LOADER value: {self.loader}. "
+                f"Using default {LOADER_VALUES}."
+            )
+            self.loader = LOADER_VALUES
+        self.write_mode = (
+            write_mode or os.getenv("DB_WRITE_MODE", WRITE_INSERT)
+        ).lower()
+        if self.write_mode not in (WRITE_INSERT, WRITE_UPSERT):
+            logger.error(
+                f"Invalid DB_WRITE_MODE value: {self.write_mode}. "
+                f"Using default {WRITE_INSERT}."
+            )
+            self.write_mode = WRITE_INSERT
+        # Whether jobs is partitioned by retention_date; create_tables
+        # migrates a plain table when asked to and detects an existing one.
+        self.partitioned = (
+            partitioned
+            if partitioned is not None
+            else os.getenv("JOBS_PARTITIONED", "false").lower() in ("1", "true", "yes")
+        )
+        # Rows removed per DELETE statement by cleanup_old_jobs
+        self.cleanup_batch_size = max(
+            cleanup_batch_size
+            if cleanup_batch_size is not None
+            else _env_int("CLEANUP_BATCH_SIZE", 5000),
+            1,
+        )
+        # Counts of each thread's last insert_jobs batch
+        self._write_counts = threading.local()
+        # Enrichment of batches with at least enrich_min_batch rows is sharded
+        # across enrich_workers processes; 0 or 1 workers keeps it serial.
+        self.enrich_workers = max(
+            enrich_workers
+            if enrich_workers is not None
+            else _env_int("ENRICH_WORKERS", 0),
+            0,
+        )
+        self.enrich_min_batch = max(
+            enrich_min_batch
+            if enrich_min_batch is not None
+            else _env_int("ENRICH_MIN_BATCH", 500),
+            1,
+        )
+        self._enrich_executor = None
+        self._enrich_lock = threading.Lock()
+        # Memoizes enrichment of identical postings; a size of 0 disables it
+        cache_size = (
+            enrich_cache_size
+            if enrich_cache_size is not None
+            else _env_int("ENRICH_CACHE_SIZE", 10000)
+        )
+        self.enrichment_cache = (
+            EnrichmentCache(
+                cache_size, enrich_cache_path or os.getenv("ENRICH_CACHE_PATH")
+            )
+            if cache_size > 0
+            else None
+        )
         self.create_tables()
+        self.translator = Translator.from_env(self)
 
+    def _is_healthy(self, conn):
+        if conn.closed:
+            return False
+        last_used = self._last_used.get(id(conn))
+        if last_used is not None and (
+            time.monotonic() - last_used < self.healthcheck_interval
+        ):
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _checkout(self):
+        # One retry per pooled slot is enough to cycle out every stale connection
+        for _ in range(self.max_connections + 1):
+            conn = self._pool.getconn()
+            if self._is_healthy(conn):
+                return conn
+            logger.warning("Discarding unhealthy database connection")
+            self._last_used.pop(id(conn), None)
+            self._pool.putconn(conn, close=True)
+        raise psycopg2.OperationalError("No healthy database connection available")
+
+    @contextmanager
     def get_connection(self):
-        return psycopg2.connect(self.connection_string)
+        """Borrow a pooled connection; commits on success, rolls back on error"""
+        self._pool_slots.acquire()
+        try:
+            conn = self._checkout()
+            try:
+                with conn:
+                    yield conn
+            finally:
+                self._last_used[id(conn)] = time.monotonic()
+                if conn.closed:
+                    self._last_used.pop(id(conn), None)
+                self._pool.putconn(conn, close=bool(conn.closed))
+        finally:
+            self._pool_slots.release()
+
+    @property
+    def last_write_counts(self):
+        return getattr(self._write_counts, "value", WriteCounts())
+
+    @last_write_counts.setter
+    def last_write_counts(self, counts):
+        self._write_counts.value = counts
+
+    @property
+    def last_write_outcomes(self):
+        """job id -> "inserted", "updated", "unchanged" or "skipped" for the
+        calling thread's last insert_jobs batch"""
+        return getattr(self._write_counts, "outcomes", {})
+
+    @last_write_outcomes.setter
+    def last_write_outcomes(self, outcomes):
+        self._write_counts.outcomes = outcomes
+
+    @property
+    def last_write_timings(self):
+        return getattr(self._write_counts, "timings", WriteTimings())
+
+    @last_write_timings.setter
+    def last_write_timings(self, timings):
+        self._write_counts.timings = timings
+
+    def close(self):
+        """Close every pooled connection and stop the enrichment workers"""
+        if self.translator is not None:
+            self.translator.close()
+        if self.enrichment_cache is not None:
+            self.enrichment_cache.save()
+        if self._enrich_executor is not None:
+            self._enrich_executor.shutdown()
+            self._enrich_executor = None
+        if not self._pool.closed:
+            self._pool.closeall()
+        self._last_used.clear()
 
     def create_tables(self):
-        """Create the jobs table if it doesn't exist"""
+        """Create the jobs table if it doesn't exist.
+
+        In partitioned mode a plain jobs table is migrated to the partitioned
+        schema, and today's partitions are created.
+        """
         create_table_query = """
         CREATE TABLE IF NOT EXISTS jobs (
             id VARCHAR(255) PRIMARY KEY,
@@ -79,17 +754,202 @@ class JobDatabase:
             ADD COLUMN IF NOT EXISTS city_normalized VARCHAR(100),
             ADD COLUMN IF NOT EXISTS country_normalized VARCHAR(100),
             ADD COLUMN IF NOT EXISTS position_tag VARCHAR(50),
-            ADD COLUMN IF NOT EXISTS company_profile VARCHAR(50);
+            ADD COLUMN IF NOT EXISTS company_profile VARCHAR(50),
+            ADD COLUMN IF NOT EXISTS title_translated TEXT,
+            ADD COLUMN IF NOT EXISTS description_translated TEXT,
+            ADD COLUMN IF NOT EXISTS content_hash CHAR(32);
+
+        ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS (
+                to_tsvector(
+                    'simple',
+                    coalesce(title, '') || ' ' || coalesce(tech_tags, '') || ' '
+                        || coalesce(description, '')
+                )
+                || array_to_tsvector(array_remove(ARRAY[
+                    'position_tag:' || position_tag,
+                    'seniority_level:' || seniority_level,
+                    'country_normalized:' || country_normalized
+                ], NULL))
+            ) STORED;
+
+        CREATE INDEX IF NOT EXISTS idx_jobs_search_vector
+            ON jobs USING GIN (search_vector);
+        CREATE INDEX IF NOT EXISTS idx_jobs_search_date
+            ON jobs ((COALESCE(date_posted, created_at::date)) DESC, id DESC);
+
+        CREATE TABLE IF NOT EXISTS translations (
+            content_hash CHAR(32) NOT NULL,
+            target_lang VARCHAR(10) NOT NULL,
+            translated_text TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (content_hash, target_lang)
+        );
+
+        CREATE TABLE IF NOT EXISTS config_runs (
+            query_id VARCHAR(255) PRIMARY KEY,
+            status VARCHAR(20) NOT NULL,
+            started_at TIMESTAMP,
+            finished_at TIMESTAMP,
+            jobs_found INTEGER,
+            jobs_new INTEGER,
+            jobs_inserted INTEGER,
+            last_error TEXT
+        );
+
+        ALTER TABLE config_runs
+            ADD COLUMN IF NOT EXISTS results_wanted INTEGER,
+            ADD COLUMN IF NOT EXISTS duration_seconds DOUBLE PRECISION,
+            ADD COLUMN IF NOT EXISTS seconds_per_result DOUBLE PRECISION;
+
+        CREATE TABLE IF NOT EXISTS query_stats (
+            id BIGSERIAL PRIMARY KEY,
+            query_id VARCHAR(255) NOT NULL,
+            site VARCHAR(50) NOT NULL,
+            fetched INTEGER NOT NULL,
+            duplicates INTEGER NOT NULL,
+            skipped INTEGER NOT NULL,
+            inserted INTEGER NOT NULL,
+            duration_seconds DOUBLE PRECISION,
+            recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_query_stats_query_id
+            ON query_stats (query_id, recorded_at);
         """
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute(create_table_query)
+                    cur.execute(
+                        "SELECT relkind FROM pg_class WHERE oid = 'jobs'::regclass"
+                    )
+                    if cur.fetchone()[0] == "p":
+                        self.partitioned = True
+                    elif self.partitioned:
+                        self._migrate_to_partitioned(cur)
+                        # Recreate the indexes on the partitioned table
+                        cur.execute(create_table_query)
+                    self._create_trigram_indexes(cur)
                     conn.commit()
             logger.info("Database tables created successfully")
         except Exception as e:
             logger.error(f"Error creating tables: {e}")
             raise
+        if self.partitioned:
+            self.ensure_partitions(_env_int("MAX_JOB_AGE_DAYS", 7))
+
+    def _create_trigram_indexes(self, cur):
+        """Trigram indexes for substring search on title and company.
+
+        pg_trgm is a contrib extension that not every server ships or lets
+        us create, so without it search just runs without these indexes.
+        """
+        cur.execute("SAVEPOINT trigram_indexes")
+        try:
+            cur.execute(
+                """
+                CREATE EXTENSION IF NOT EXISTS pg_trgm;
+                CREATE INDEX IF NOT EXISTS idx_jobs_title_trgm
+                    ON jobs USING GIN (title gin_trgm_ops);
+                CREATE INDEX IF NOT EXISTS idx_jobs_company_trgm
+                    ON jobs USING GIN (company gin_trgm_ops);
+                """
+            )
+            cur.execute("RELEASE SAVEPOINT trigram_indexes")
+        except psycopg2.Error as e:
+            cur.execute("ROLLBACK TO SAVEPOINT trigram_indexes")
+            logger.warning(f"Skipping trigram indexes, pg_trgm is unavailable: {e}")
+
+    def _migrate_to_partitioned(self, cur):
+        """Move a plain jobs table into a new one partitioned by retention_date"""
+        logger.info("Migrating jobs to a table partitioned by retention_date")
+        cur.execute(
+            "SELECT conname FROM pg_constraint "
+            "WHERE conrelid = 'jobs'::regclass AND contype = 'p'"
+        )
+        primary_key = cur.fetchone()
+        cur.execute(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = 'jobs' "
+            "AND is_generated = 'NEVER' ORDER BY ordinal_position"
+        )
+        columns = ", ".join(row[0] for row in cur.fetchall())
+        cur.execute("ALTER TABLE jobs RENAME TO jobs_unpartitioned")
+        if primary_key:
+            cur.execute(
+                f"ALTER TABLE jobs_unpartitioned RENAME CONSTRAINT {primary_key[0]} "
+                "TO jobs_unpartitioned_pkey"
+            )
+        # The partition key has to be part of the primary key; ids stay
+        # unique through insert_jobs' lookups, see PARTITION_PREFIX
+        cur.execute(
+            """
+            CREATE TABLE jobs (
+                LIKE jobs_unpartitioned INCLUDING DEFAULTS INCLUDING GENERATED,
+                retention_date DATE NOT NULL DEFAULT CURRENT_DATE,
+                PRIMARY KEY (id, retention_date)
+            ) PARTITION BY RANGE (retention_date)
+            """
+        )
+        cur.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF jobs DEFAULT")
+        cur.execute("SELECT CURRENT_DATE")
+        today = cur.fetchone()[0]
+        self._create_partitions(
+            cur,
+            today - timedelta(days=_env_int("MAX_JOB_AGE_DAYS", 7)),
+            today + timedelta(days=_env_int("JOBS_PARTITION_DAYS_AHEAD", 7)),
+        )
+        cur.execute(
+            f"""
+            INSERT INTO jobs ({columns}, retention_date)
+            SELECT {columns}, COALESCE(date_posted, created_at::date, CURRENT_DATE)
+            FROM jobs_unpartitioned
+            """
+        )
+        logger.info(f"Moved {cur.rowcount} jobs into the partitioned table")
+        cur.execute("DROP TABLE jobs_unpartitioned")
+
+    def _create_partitions(self, cur, first_day, last_day):
+        day = first_day
+        while day <= last_day:
+            name = f"{PARTITION_PREFIX}{day:%Y%m%d}"
+            # A day whose rows already landed in the default partition can't
+            # get its own partition any more; those rows age out from there.
+            cur.execute("SAVEPOINT create_partition")
+            try:
+                cur.execute(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF jobs "
+                    "FOR VALUES FROM (%s) TO (%s)",
+                    (day, day + timedelta(days=1)),
+                )
+                cur.execute("RELEASE SAVEPOINT create_partition")
+            except psycopg2.Error as e:
+                cur.execute("ROLLBACK TO SAVEPOINT create_partition")
+                logger.warning(f"Could not create partition {name}: {e}")
+            day += timedelta(days=1)
+
+    def ensure_partitions(self, lookback_days, days_ahead=None):
+        """Create the daily partitions from lookback_days ago to days_ahead
+        (JOBS_PARTITION_DAYS_AHEAD, default 7) days from now"""
+        days_ahead = (
+            days_ahead
+            if days_ahead is not None
+            else _env_int("JOBS_PARTITION_DAYS_AHEAD", 7)
+        )
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT CURRENT_DATE")
+                    today = cur.fetchone()[0]
+                    self._create_partitions(
+                        cur,
+                        today - timedelta(days=lookback_days),
+                        today + timedelta(days=days_ahead),
+                    )
+                    conn.commit()
+        except Exception as e:
+            logger.error(f"Error creating job partitions: {e}")
 
     def job_exists(self, job_id):
         """Check if a job already exists in the database"""
@@ -103,7 +963,156 @@ class JobDatabase:
             logger.error(f"Error checking if job exists: {e}")
             return False
 
-    def _normalize_str(self, value):
+    def existing_job_ids(self, job_ids):
+        """Return the subset of job_ids already stored, in a single query.
+
+        Errors are raised: on a partitioned table an empty answer would let
+        insert_jobs store a second row for a stored id.
+        """
+        ids = list({job_id for job_id in job_ids if job_id})
+        if not ids:
+            return set()
+        query = "SELECT id FROM jobs WHERE id = ANY(%s)"
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, (ids,))
+                    return {row[0] for row in cur.fetchall()}
+        except Exception as e:
+            logger.error(f"Error checking existing jobs: {e}")
+            raise
+
+    def search_jobs(self, query=None, filters=None, limit=20, after=None):
+        """Full-text search over job titles, tech tags and descriptions.
+
+        query takes web search syntax: words, "quoted phrases", `or` and
+        -exclusions. filters narrows the results by:
+            position_tag, seniority_level, country_normalized: a value or a
+                list of accepted values
+            posted_since, posted_until: dates, inclusive
+            title, company: case-insensitive substrings
+        Results are newest first. Returns a SearchPage; passing its `after`
+        back fetches the next page (keyset pagination, so deep pages cost
+        the same as the first).
+        """
+        where, params = self._search_conditions(query, filters, after)
+        columns = ", ".join(SEARCH_COLUMNS)
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    # Walking the date index is fastest while matches are
+                    # dense, but has to skip past every non-match of a
+                    # selective search; those fetch all matches and sort.
+                    selective = (
+                        query
+                        and self._estimate_rows(cur, where, params) <= SEARCH_SORT_ROWS
+                    )
+                    if selective:
+                        sql = f"""
+                        WITH matches AS MATERIALIZED (
+                            SELECT {columns}, {SEARCH_DATE} AS search_date
+                            FROM jobs
+                            WHERE {where}
+                        )
+                        SELECT * FROM matches
+                        ORDER BY search_date DESC, id DESC
+                        LIMIT %s
+                        """
+                    else:
+                        sql = f"""
+                        SELECT {columns}, {SEARCH_DATE}
+                        FROM jobs
+                        WHERE {where}
+                        ORDER BY {SEARCH_DATE} DESC, id DESC
+                        LIMIT %s
+                        """
+                    cur.execute(sql, [*params, limit])
+                    rows = cur.fetchall()
+        except Exception as e:
+            logger.error(f"Error searching jobs: {e}")
+            raise
+        jobs = [dict(zip(SEARCH_COLUMNS, row)) for row in rows]
+        next_after = (rows[-1][-1], rows[-1][0]) if len(rows) == limit else None
+        return SearchPage(jobs, next_after)
+
+    @staticmethod
+    def _estimate_rows(cur, where, params):
+        """The planner's estimate of how many jobs match `where`"""
+        cur.execute(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM jobs WHERE {where}", params)
+        return cur.fetchone()[0][0]["Plan"]["Plan Rows"]
+
+    @staticmethod
+    def _tsquery_lexeme(lexeme):
+        escaped = lexeme.replace("\\", "\\\\").replace("'", "\\'")
+        return f"'{escaped}'"
+
+    @classmethod
+    def _search_conditions(cls, query, filters, after):
+        """SQL conditions and parameters for search_jobs"""
+        conditions = []
+        params = []
+        facets = []
+        for name, value in (filters or {}).items():
+            if value is None:
+                continue
+            if name in SEARCH_FACETS:
+                values = (
+                    list(value) if isinstance(value, (list, tuple, set)) else [value]
+                )
+                conditions.append(f"{name} = ANY(%s)")
+                params.append(values)
+                facets.append(
+                    "("
+                    + " | ".join(cls._tsquery_lexeme(f"{name}:{v}") for v in values)
+                    + ")"
+                )
+            elif name == "posted_since":
+                conditions.append(f"{SEARCH_DATE} >= %s")
+                params.append(value)
+            elif name == "posted_until":
+                conditions.append(f"{SEARCH_DATE} <= %s")
+                params.append(value)
+            elif name in ("title", "company"):
+                pattern = (
+                    value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                )
+                conditions.append(f"{name} ILIKE %s")
+                params.append(f"%{pattern}%")
+            else:
+                raise ValueError(f"Unknown search filter: {name}")
+        if query:
+            text = "websearch_to_tsquery('simple', %s)"
+            if facets:
+                text = f"({text} && %s::tsquery)"
+            conditions.insert(0, f"search_vector @@ {text}")
+            params[:0] = [query, " & ".join(facets)] if facets else [query]
+        if after is not None:
+            conditions.append(f"({SEARCH_DATE}, id) < (%s, %s)")
+            params.extend(after)
+        return " AND ".join(conditions) or "true", params
+
+    def stored_retention_dates(self, job_ids):
+        """Return {id: retention_date} for the stored jobs among job_ids.
+
+        Upserts reuse a stored job's retention_date so that ON CONFLICT
+        (id, retention_date) finds it. Errors are raised, since an empty
+        answer would insert a duplicate id instead of updating the job.
+        """
+        ids = list({job_id for job_id in job_ids if job_id})
+        if not ids:
+            return {}
+        query = "SELECT id, retention_date FROM jobs WHERE id = ANY(%s)"
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, (ids,))
+                    return dict(cur.fetchall())
+        except Exception as e:
+            logger.error(f"Error checking stored retention dates: {e}")
+            raise
+
+    @staticmethod
+    def _normalize_str(value):
         if pd.isna(value):
             return None
         if isinstance(value, str):
@@ -117,303 +1126,21 @@ class JobDatabase:
         return str(value)
 
     def _translate_text(self, text, target_lang="EN"):
-        if not text:
-            return None
-        api_key = os.getenv("DEEPL_API_KEY")
-        if not api_key:
-            return None
-        enabled = os.getenv("TRANSLATION_ENABLED", "false").lower() in (
-            "1",
-            "true",
-            "yes",
-        )
-        if not enabled:
-            return None
-        api_url = os.getenv("DEEPL_API_URL", "https://api-free.deepl.com/v2/translate")
-        try:
-            response = requests.post(
-                api_url,
-                data={"auth_key": api_key, "text": text, "target_lang": target_lang},
-                timeout=10,
-            )
-            if response.status_code != 200:
-                logger.error(
-                    f"Translation API error: {response.status_code} {response.text}"
-                )
-                return None
-            data = response.json()
-            translations = data.get("translations")
-            if not translations:
-                return None
-            translated_text = translations[0].get("text")
-            if not translated_text:
-                return None
-            return translated_text
-        except Exception as e:
-            logger.error(f"Error translating text: {e}")
+        if not text or self.translator is None:
             return None
+        return self.translator.translate([text], target_lang)[0]
 
     def _infer_seniority_level(self, title, description):
-        text = f"{title or ''} {description or ''}".lower()
-        text = re.sub(r"[^a-z0-9+#]+", " ", text)
-
-        def _max_years_of_experience() -> int | None:
-            years = []
-            for m in re.finditer(r"\b(\d{1,2})\s*(?:\+)?\s*(?:years|yrs)\b", text):
-                years.append(int(m.group(1)))
-            for m in re.finditer(
-                r"\b(\d{1,2})\s*(?:-|–|to)\s*(\d{1,2})\s*(?:years|yrs)\b",
-                text,
-            ):
-                years.append(int(m.group(2)))
-            return max(years) if years else None
-
-        # Map to frontend enum values: entry, junior, mid, senior
-        entry_patterns = [
-            r"\b(intern|internship|apprentice|trainee)\b",
-            r"\b(new\s*grad|graduate|recent\s*graduate)\b",
-            r"\b(entry\s*level|entry\s*-\s*level)\b",
-        ]
-        junior_patterns = [
-            r"\b(junior|jr\b|jr\.)\b",
-            r"\b(associate)\b",
-            r"\b(engineer|developer)\s*(i|1)\b",
-            r"\b(level\s*(i|1))\b",
-            r"\b(l1)\b",
-        ]
-        senior_patterns = [
-            r"\b(senior|sr\b|sr\.)\b",
-            r"\b(staff|principal|lead|architect)\b",
-            r"\b(head\s+of)\b",
-            r"\b(director|vp|vice\s+president|chief)\b",
-            r"\b(engineering\s+manager|software\s+engineering\s+manager)\b",
-        ]
-        mid_patterns = [
-            r"\b(mid\s*level|mid\s*-\s*level|intermediate)\b",
-            r"\b(engineer|developer)\s*(ii|2|iii|3)\b",
-            r"\b(level\s*(ii|2|iii|3))\b",
-            r"\b(l2|l3)\b",
-        ]
-
-        if any(re.search(p, text) for p in entry_patterns):
-            return "entry"
-        if any(re.search(p, text) for p in junior_patterns):
-            return "junior"
-        if any(re.search(p, text) for p in senior_patterns):
-            return "senior"
-        if any(re.search(p, text) for p in mid_patterns):
-            return "mid"
-
-        years = _max_years_of_experience()
-        if years is not None:
-            if years <= 0:
-                return "entry"
-            if years <= 2:
-                return "junior"
-            if years <= 5:
-                return "mid"
-            return "senior"
-
-        return "mid"
+        return classify(title, description).seniority_level
 
     def _infer_role_family(self, title, description):
-        text = f"{title or ''} {description or ''}".lower()
-        text = re.sub(r"[^a-z0-9+#]+", " ", text)
-
-        product_patterns = [
-            r"\b(product\s+manager|technical\s+product\s+manager|product\s+owner)\b",
-            r"\b(group\s+product\s+manager|gpm)\b",
-        ]
-        cybersecurity_patterns = [
-            r"\b(cyber\s*security|cybersecurity|info\s*sec|infosec|information\s+security)\b",
-            r"\b(security\s+engineer|security\s+analyst|soc\s+analyst)\b",
-            r"\b(penetration\s+tester|pentest|ethical\s+hacker|red\s+team|blue\s+team)\b",
-            r"\b(application\s+security|appsec|vulnerability\s+management|incident\s+response)\b",
-        ]
-        data_scientist_patterns = [
-            r"\b(data\s+scientist)\b",
-            r"\b(machine\s+learning|ml\b|ml\s+engineer|ai\s+engineer|deep\s+learning)\b",
-            r"\b(nlp|computer\s+vision|cv\b|llm|genai|generative\s+ai)\b",
-            r"\b(applied\s+scientist|research\s+scientist)\b",
-        ]
-        data_engineering_patterns = [
-            r"\b(data\s+engineer|analytics\s+engineer|etl\b|elt\b)\b",
-            r"\b(data\s+pipeline|data\s+warehouse|data\s+platform)\b",
-            r"\b(dbt|airflow|spark|kafka|snowflake|bigquery|redshift)\b",
-            r"\b(bi\s+developer|business\s+intelligence)\b",
-            r"\b(data\s+analyst|analytics)\b",
-        ]
-        devops_patterns = [
-            r"\b(devops|site\s+reliability|sre\b|platform\s+engineer)\b",
-            r"\b(infrastructure\s+engineer|infra\b|ci\s*/\s*cd|cicd)\b",
-            r"\b(kubernetes|k8s|docker|terraform|ansible)\b",
-            r"\b(cloud\s+engineer|cloud\s+architect|aws|azure|gcp)\b",
-        ]
-        mobile_patterns = [
-            r"\b(mobile\s+developer|mobile\s+engineer)\b",
-            r"\b(ios\b|android\b|react\s+native|flutter)\b",
-            r"\b(swift|kotlin)\b",
-        ]
-        fullstack_patterns = [
-            r"\b(full\s*stack|full\s*-\s*stack|fullstack|mern|mean)\b",
-        ]
-        frontend_patterns = [
-            r"\b(front\s*end|front\s*-\s*end|frontend)\b",
-            r"\b(ui\s+engineer|ui\s+developer|web\s+ui)\b",
-            r"\b(react|next\s*js|angular|vue)\b",
-        ]
-        backend_patterns = [
-            r"\b(back\s*end|back\s*-\s*end|backend)\b",
-            r"\b(server\s*side|server\s*-\s*side)\b",
-            r"\b(api\s+engineer|api\s+developer|microservices)\b",
-        ]
-
-        if any(re.search(p, text) for p in product_patterns):
-            return "product"
-        if any(re.search(p, text) for p in cybersecurity_patterns):
-            return "security"
-        if any(re.search(p, text) for p in data_scientist_patterns):
-            return "data_scientist"
-        if any(re.search(p, text) for p in data_engineering_patterns):
-            return "data_engineer"
-        if any(re.search(p, text) for p in devops_patterns):
-            return "devops"
-        if any(re.search(p, text) for p in mobile_patterns):
-            return "mobile"
-        if any(re.search(p, text) for p in fullstack_patterns):
-            return "fullstack"
-        if any(re.search(p, text) for p in frontend_patterns):
-            return "frontend"
-        if any(re.search(p, text) for p in backend_patterns):
-            return "backend"
-
-        return None
+        return classify(title, description).role_family
 
     def _infer_position_tag(self, title, description):
-        title_text = (title or "").lower()
-        desc_text = (description or "").lower()
-        title_text = re.sub(r"[^a-z0-9+#]+", " ", title_text)
-        desc_text = re.sub(r"[^a-z0-9+#]+", " ", desc_text)
-        combined_text = f"{title_text} {desc_text}".strip()
-
-        generic_title_markers = [
-            r"\bsoftware\s+engineer\b",
-            r"\bsoftware\s+developer\b",
-            r"\bengineer\b",
-            r"\bdeveloper\b",
-        ]
-        specific_role_markers = [
-            r"\bfront\s*end\b",
-            r"\bfrontend\b",
-            r"\bback\s*end\b",
-            r"\bbackend\b",
-            r"\bfull\s*stack\b",
-            r"\bfullstack\b",
-            r"\bdevops\b",
-            r"\bsre\b",
-            r"\bmobile\b",
-            r"\bios\b",
-            r"\bandroid\b",
-            r"\bdata\s+engineer\b",
-            r"\bdata\s+scientist\b",
-            r"\bproduct\s+manager\b",
-            r"\bcybersecurity\b",
-            r"\bsecurity\s+engineer\b",
-        ]
-
-        is_generic_title = any(re.search(p, title_text) for p in generic_title_markers)
-        has_specific_title = any(
-            re.search(p, title_text) for p in specific_role_markers
-        )
-        use_text = (
-            desc_text
-            if (is_generic_title and not has_specific_title)
-            else combined_text
-        )
-
-        patterns_by_tag = {
-            "cybersecurity": [
-                r"\b(cyber\s*security|cybersecurity|info\s*sec|infosec|information\s+security)\b",
-                r"\b(security\s+engineer|security\s+analyst|soc\s+analyst)\b",
-                r"\b(penetration\s+tester|pentest|ethical\s+hacker|red\s+team|blue\s+team)\b",
-                r"\b(application\s+security|appsec|devsecops|incident\s+response)\b",
-                r"\b(vulnerability\s+management|threat\s+model(ing)?)\b",
-            ],
-            "product-manager": [
-                r"\b(product\s+manager|product\s+owner)\b",
-                r"\b(technical\s+product\s+manager|tpm)\b",
-                r"\b(group\s+product\s+manager|gpm)\b",
-            ],
-            "data-scientist": [
-                r"\b(data\s+scientist)\b",
-                r"\b(machine\s+learning|ml\b|ml\s+engineer|ai\s+engineer|deep\s+learning)\b",
-                r"\b(nlp|computer\s+vision|cv\b|llm|genai|generative\s+ai)\b",
-                r"\b(applied\s+scientist|research\s+scientist)\b",
-            ],
-            "data": [
-                r"\b(data\s+engineer|analytics\s+engineer|etl\b|elt\b)\b",
-                r"\b(data\s+pipeline|data\s+warehouse|data\s+platform)\b",
-                r"\b(dbt|airflow|spark|kafka|snowflake|bigquery|redshift)\b",
-                r"\b(bi\s+developer|business\s+intelligence|data\s+analyst|analytics)\b",
-            ],
-            "devops": [
-                r"\b(devops|site\s+reliability|sre\b|platform\s+engineer)\b",
-                r"\b(infrastructure\s+engineer|infra\b|ci\s*/\s*cd|cicd)\b",
-                r"\b(kubernetes|k8s|docker|terraform|ansible)\b",
-                r"\b(cloud\s+engineer|cloud\s+architect|aws|azure|gcp)\b",
-            ],
-            "mobile": [
-                r"\b(mobile\s+developer|mobile\s+engineer)\b",
-                r"\b(ios\b|android\b|react\s+native|flutter)\b",
-                r"\b(swift|kotlin)\b",
-            ],
-            "fullstack": [
-                r"\b(full\s*stack|full\s*-\s*stack|fullstack|mern|mean)\b",
-            ],
-            "frontend": [
-                r"\b(front\s*end|front\s*-\s*end|frontend)\b",
-                r"\b(ui\s+engineer|ui\s+developer|web\s+ui)\b",
-                r"\b(react|next\s*js|angular|vue)\b",
-            ],
-            "backend": [
-                r"\b(back\s*end|back\s*-\s*end|backend)\b",
-                r"\b(server\s*side|server\s*-\s*side)\b",
-                r"\b(api\s+engineer|api\s+developer|microservices)\b",
-                r"\b(django|flask|fastapi|spring\s+boot|rails|dotnet|\.net)\b",
-            ],
-        }
-
-        matched = {
-            tag
-            for tag, patterns in patterns_by_tag.items()
-            if any(re.search(p, use_text) for p in patterns)
-        }
-
-        if "cybersecurity" in matched:
-            return "cybersecurity"
-        if "product-manager" in matched:
-            return "product-manager"
-        if "data-scientist" in matched:
-            return "data-scientist"
-
-        if "fullstack" in matched or ("frontend" in matched and "backend" in matched):
-            return "fullstack"
-
-        if "devops" in matched:
-            return "devops"
-        if "mobile" in matched:
-            return "mobile"
-        if "data" in matched:
-            return "data"
-        if "frontend" in matched:
-            return "frontend"
-        if "backend" in matched:
-            return "backend"
-
-        return None
+        return classify(title, description).position_tag
 
+    @staticmethod
     def _infer_company_profile(
-        self,
         company_name,
         company_industry,
         company_num_employees,
@@ -482,81 +1209,12 @@ class JobDatabase:
             return "generic"
         return None
 
-    def _extract_tech_tags(self, title, description):
-        text = f"{title or ''} {description or ''}".lower()
-        tags = set()
-
-        patterns = {
-            "python": ["python"],
-            "java": [" java "],
-            "javascript": ["javascript", " js "],
-            "typescript": ["typescript", " ts "],
-            "c++": ["c++"],
-            "c#": ["c#"],
-            "go": [" golang", " go "],
-            "rust": ["rust"],
-            "ruby": ["ruby"],
-            "php": ["php"],
-            "scala": ["scala"],
-            "kotlin": ["kotlin"],
-            "swift": ["swift"],
-            "node.js": ["node.js", "nodejs"],
-            "react": [" react"],
-            "angular": ["angular"],
-            "vue": [" vue"],
-            "django": ["django"],
-            "flask": ["flask"],
-            "spring": ["spring boot", "spring framework"],
-            "rails": ["rails", "ruby on rails"],
-            "dotnet": [".net", "dotnet"],
-            "aws": ["aws"],
-            "azure": ["azure"],
-            "gcp": ["gcp", "google cloud"],
-            "docker": ["docker"],
-            "kubernetes": ["kubernetes", "k8s"],
-            "terraform": ["terraform"],
-            "ansible": ["ansible"],
-            "postgres": ["postgres", "postgresql"],
-            "mysql": ["mysql"],
-            "mongodb": ["mongodb"],
-            "redis": ["redis"],
-            "kafka": ["kafka"],
-            "spark": ["spark"],
-        }
-
-        for tag, needles in patterns.items():
-            if any(n in text for n in needles):
-                tags.add(tag)
-
-        if not tags:
-            return None, None
-
-        language_order = [
-            "python",
-            "javascript",
-            "typescript",
-            "java",
-            "c++",
-            "c#",
-            "go",
-            "rust",
-            "ruby",
-            "php",
-            "scala",
-            "kotlin",
-            "swift",
-        ]
-
-        primary_language = None
-        for lang in language_order:
-            if lang in tags:
-                primary_language = lang
-                break
-
-        tech_tags = ",".join(sorted(tags))
-        return primary_language, tech_tags
+    @staticmethod
+    def _extract_tech_tags(title, description):
+        return extract_tech_tags(title, description)
 
-    def _normalize_location_parts(self, location):
+    @staticmethod
+    def _normalize_location_parts(location):
         if not location:
             return None, None
         if isinstance(location, str):
@@ -568,116 +1226,360 @@ class JobDatabase:
             return city, country
         return None, None
 
-    def insert_jobs(self, jobs_df):
-        """Insert new jobs into the database, skipping duplicates"""
-        if jobs_df.empty:
-            logger.info("No jobs to insert")
-            return 0
+    @staticmethod
+    def _enrich_job(
+        source_title,
+        source_description,
+        location,
+        company_name,
+        company_industry,
+        company_num_employees,
+        company_description,
+        description,
+    ):
+        """Derived columns for one job, or None if it has no seniority/position.
 
-        # Convert DataFrame to list of tuples, handling NaN values
-        jobs_data = []
-        for _, row in jobs_df.iterrows():
-            # Convert date_posted to proper format
-            date_posted = None
-            raw_date = row.get("date_posted")
-            if pd.notna(raw_date):
-                try:
-                    date_posted = pd.to_datetime(raw_date).date()
-                except Exception:
-                    date_posted = None
+        Returns (seniority_level, primary_language, tech_tags, city_normalized,
+        country_normalized, position_tag, company_profile). Static so that it
+        can run in a worker process.
+        """
+        labels = classify(source_title, source_description)
+        if not labels.seniority_level or not labels.position_tag:
+            return None
 
-            title = row.get("title")
-            raw_description = row.get("description")
-            location = row.get("location")
+        primary_language, tech_tags = JobDatabase._extract_tech_tags(
+            source_title, source_description
+        )
+        city_norm, country_norm = JobDatabase._normalize_location_parts(location)
+        company_profile = JobDatabase._infer_company_profile(
+            company_name,
+            company_industry,
+            company_num_employees,
+            company_description,
+            description,
+        )
+        return (
+            labels.seniority_level,
+            primary_language,
+            tech_tags,
+            JobDatabase._normalize_str(city_norm),
+            JobDatabase._normalize_str(country_norm),
+            labels.position_tag,
+            company_profile,
+        )
+
+    def _enrich_records(self, records):
+        """Enrich records, computing each distinct one not yet cached once"""
+        cache = self.enrichment_cache
+        if cache is None:
+            return self._enrich_uncached(records)
+
+        keys = [cache.key(record) for record in records]
+        results = {}
+        missing = {}
+        for key, record in zip(keys, records):
+            if key in results or key in missing:
+                continue
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                missing[key] = record
+            else:
+                results[key] = value
+
+        computed = self._enrich_uncached(list(missing.values()))
+        for key, value in zip(missing, computed):
+            cache.put(key, value)
+            results[key] = value
+        cache.record(hits=len(records) - len(missing), misses=len(missing))
+        return [results[key] for key in keys]
+
+    def _enrich_uncached(self, records):
+        """Run _enrich_job over records, in a process pool for large batches.
+
+        Records are split into contiguous shards and results are collected with
+        Executor.map, so the output order always matches the input order.
+        """
+        workers = self.enrich_workers
+        if workers <= 1 or len(records) < self.enrich_min_batch:
+            return [self._enrich_job(*record) for record in records]
+
+        # A few shards per worker evens out the uneven cost of long descriptions
+        shard_size = -(-len(records) // (workers * 4))
+        shards = [
+            records[start : start + shard_size]
+            for start in range(0, len(records), shard_size)
+        ]
+        executor = None
+        try:
+            with self._enrich_lock:
+                if self._enrich_executor is None:
+                    # Forking would copy this process's pool connections and
+                    # locks held by writer or translation threads
+                    self._enrich_executor = ProcessPoolExecutor(
+                        max_workers=workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                executor = self._enrich_executor
+            results = []
+            for shard_result in executor.map(_enrich_batch, shards):
+                results.extend(shard_result)
+            return results
+        except Exception as e:
+            logger.warning(f"Parallel enrichment failed ({e}); enriching serially")
+            with self._enrich_lock:
+                if executor is not None and self._enrich_executor is executor:
+                    # Don't join a broken pool; its feeder thread may never finish
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    self._enrich_executor = None
+            return [self._enrich_job(*record) for record in records]
+
+    def _normalize_column(self, series):
+        """Column-wise equivalent of _normalize_str, returned as a list"""
+        values = pd.Series(series.to_numpy(dtype=object))
+        result = pd.Series([None] * len(values), dtype=object)
+        present = values.notna()
+        is_str = present & values.map(lambda v: isinstance(v, str))
+        if is_str.any():
+            cleaned = values[is_str].str.strip()
+            # Only short values can be one of the null markers, so avoid
+            # lower-casing whole descriptions.
+            short = cleaned[cleaned.str.len() <= 4]
+            empty = short[short.str.lower().isin(("", "nan", "none", "null"))]
+            cleaned[empty.index] = None
+            result[is_str] = cleaned
+        others = present & ~is_str
+        if others.any():
+            result[others] = values[others].map(str)
+        return result.tolist()
+
+    def _float_column(self, series):
+        values = pd.Series(series.to_numpy(dtype=object))
+        result = pd.Series([None] * len(values), dtype=object)
+        present = values.notna()
+        if present.any():
+            result[present] = values[present].astype(float).astype(object)
+        return result.tolist()
+
+    def _bool_column(self, series):
+        values = pd.Series(series.to_numpy(dtype=object))
+        result = pd.Series([None] * len(values), dtype=object)
+        present = values.notna()
+        if present.any():
+            result[present] = values[present].astype(bool).astype(object)
+        return result.tolist()
+
+    @staticmethod
+    def _to_date(value):
+        try:
+            return pd.to_datetime(value).date()
+        except Exception:
+            return None
 
-            title_value = self._normalize_str(title)
-            description_value = self._normalize_str(raw_description)
+    def _date_column(self, series):
+        values = pd.Series(series.to_numpy(dtype=object))
+        result = pd.Series([None] * len(values), dtype=object)
+        present = values.notna()
+        if present.any():
+            try:
+                dates = pd.to_datetime(
+                    values[present], errors="coerce", format="mixed"
+                ).dt.date
+            except Exception:
+                # Mixed timezones and similar cases can't be parsed as one column
+                dates = values[present].map(self._to_date)
+            result[present] = [None if pd.isna(v) else v for v in dates]
+        return result.tolist()
 
-            source_title = title_value or title
-            source_description = description_value or raw_description
+    def _prepare_job_rows(self, jobs_df):
+        """Build insert tuples (in JOB_COLUMNS order) column by column.
 
-            seniority_level = self._infer_seniority_level(
-                source_title, source_description
+        Every column is normalized in one pass instead of building a Series per
+        row with DataFrame.iterrows; only the enrichment runs per job.
+        """
+        row_count = len(jobs_df)
+
+        def column(name):
+            if name in jobs_df.columns:
+                return jobs_df[name]
+            return pd.Series([None] * row_count, dtype=object)
+
+        def raw_list(name):
+            return column(name).to_numpy(dtype=object).tolist()
+
+        def str_list(name):
+            # Mirrors str(row.get(name, "")), which keeps "nan"/"None" as text
+            if name not in jobs_df.columns:
+                return [""] * row_count
+            return [str(v) for v in raw_list(name)]
+
+        normalized = {
+            name: self._normalize_column(column(name))
+            for name in (
+                "title",
+                "description",
+                "company",
+                "location",
+                "job_type",
+                "salary_source",
+                "currency",
+                "job_level",
+                "job_function",
+                "listing_type",
+                "emails",
+                "company_industry",
+                "company_num_employees",
+                "company_url",
+                "company_logo",
+                "company_url_direct",
+                "company_description",
+                "skills",
             )
-            position_tag = self._infer_position_tag(source_title, source_description)
+        }
+        ids = raw_list("id")
+        raw_titles = raw_list("title")
+        raw_descriptions = raw_list("description")
+        locations = raw_list("location")
+        dates = self._date_column(column("date_posted"))
+        min_amounts = self._float_column(column("min_amount"))
+        max_amounts = self._float_column(column("max_amount"))
+        is_remote = self._bool_column(column("is_remote"))
+        id_strs = str_list("id")
+        sites = str_list("site")
+        job_urls = str_list("job_url")
+        job_urls_direct = str_list("job_url_direct")
+        title_strs = str_list("title")
+
+        records = []
+        for i in range(row_count):
+            description_value = normalized["description"][i]
+            records.append(
+                (
+                    normalized["title"][i] or raw_titles[i],
+                    description_value or raw_descriptions[i],
+                    locations[i],
+                    normalized["company"][i],
+                    normalized["company_industry"][i],
+                    normalized["company_num_employees"][i],
+                    normalized["company_description"][i],
+                    description_value,
+                )
+            )
+        enriched = self._enrich_records(records)
 
-            if not seniority_level or not position_tag:
+        jobs_data = []
+        for i in range(row_count):
+            if enriched[i] is None:
                 logger.info(
                     "Skipping job %s - missing seniority_level or position_tag",
-                    row.get("id"),
+                    ids[i],
                 )
                 continue
-
-            primary_language, tech_tags = self._extract_tech_tags(
-                source_title, source_description
-            )
-            city_norm, country_norm = self._normalize_location_parts(location)
-
-            company_name = self._normalize_str(row.get("company"))
-            company_industry = self._normalize_str(row.get("company_industry"))
-            company_num_employees = self._normalize_str(
-                row.get("company_num_employees")
-            )
-
-            company_description_value = self._normalize_str(
-                row.get("company_description")
-            )
-            company_profile = self._infer_company_profile(
-                company_name,
-                company_industry,
-                company_num_employees,
-                company_description_value,
-                description_value,
-            )
-
-            job_tuple = (
-                str(row.get("id", "")),
-                str(row.get("site", "")),
-                str(row.get("job_url", "")),
-                str(row.get("job_url_direct", "")),
-                str(row.get("title", "")),
-                company_name,
-                self._normalize_str(row.get("location")),
-                date_posted,
-                self._normalize_str(row.get("job_type")),
-                self._normalize_str(row.get("salary_source")),
-                float(row.get("min_amount"))
-                if pd.notna(row.get("min_amount"))
-                else None,
-                float(row.get("max_amount"))
-                if pd.notna(row.get("max_amount"))
-                else None,
-                self._normalize_str(row.get("currency")),
-                bool(row.get("is_remote")) if pd.notna(row.get("is_remote")) else None,
-                self._normalize_str(row.get("job_level")),
-                self._normalize_str(row.get("job_function")),
-                self._normalize_str(row.get("listing_type")),
-                self._normalize_str(row.get("emails")),
-                description_value,
-                self._normalize_str(row.get("company_industry")),
-                self._normalize_str(row.get("company_url")),
-                self._normalize_str(row.get("company_logo")),
-                self._normalize_str(row.get("company_url_direct")),
-                self._normalize_str(row.get("company_description")),
-                self._normalize_str(row.get("skills")),
+            (
                 seniority_level,
                 primary_language,
                 tech_tags,
-                self._normalize_str(city_norm),
-                self._normalize_str(country_norm),
+                city_norm,
+                country_norm,
+                position_tag,
+                company_profile,
+            ) = enriched[i]
+
+            row = (
+                id_strs[i],
+                sites[i],
+                job_urls[i],
+                job_urls_direct[i],
+                title_strs[i],
+                normalized["company"][i],
+                normalized["location"][i],
+                dates[i],
+                normalized["job_type"][i],
+                normalized["salary_source"][i],
+                min_amounts[i],
+                max_amounts[i],
+                normalized["currency"][i],
+                is_remote[i],
+                normalized["job_level"][i],
+                normalized["job_function"][i],
+                normalized["listing_type"][i],
+                normalized["emails"][i],
+                normalized["description"][i],
+                normalized["company_industry"][i],
+                normalized["company_url"][i],
+                normalized["company_logo"][i],
+                normalized["company_url_direct"][i],
+                normalized["company_description"][i],
+                normalized["skills"][i],
+                seniority_level,
+                primary_language,
+                tech_tags,
+                city_norm,
+                country_norm,
                 position_tag,
                 company_profile,
             )
-            jobs_data.append(job_tuple)
+            jobs_data.append(row + (self._content_hash(row),))
+        return jobs_data
+
+    @staticmethod
+    def _content_hash(row):
+        """Fingerprint of every column but the id, to skip no-op updates"""
+        digest = hashlib.blake2b(digest_size=16)
+        for value in row[1:]:
+            digest.update(b"\x00" if value is None else b"\x01" + str(value).encode())
+            digest.update(b"\x1f")
+        return digest.hexdigest()
 
-        # Filter out jobs that already exist or have no description
+    def insert_jobs(self, jobs_df):
+        """Insert new jobs into the database, skipping duplicates.
+
+        In upsert mode stored jobs are rewritten instead when their content
+        hash changed. Returns the number of inserted jobs; the inserted,
+        updated, unchanged and skipped counts of the batch are kept in
+        last_write_counts, each job's outcome in last_write_outcomes and the
+        time spent enriching and inserting in last_write_timings, for the
+        calling thread. If the stored ids can't be looked up the whole batch
+        fails, as a partitioned table relies on that lookup to keep ids
+        unique.
+        """
+        self.last_write_counts = WriteCounts()
+        self.last_write_outcomes = {}
+        self.last_write_timings = WriteTimings()
+        if jobs_df.empty:
+            logger.info("No jobs to insert")
+            return 0
+
+        started = time.perf_counter()
+        jobs_data = self._prepare_job_rows(jobs_df)
+        enrich_seconds = time.perf_counter() - started
+        upsert = self.write_mode == WRITE_UPSERT
+        # Jobs dropped by _prepare_job_rows or below stay "skipped"
+        outcomes = dict.fromkeys((str(v) for v in jobs_df["id"].tolist()), "skipped")
+        self.last_write_outcomes = outcomes
+
+        # Filter out jobs that already exist or have no description. Upserts
+        # keep existing jobs and let the content hash decide in the database.
+        existing_ids = (
+            set() if upsert else self.existing_job_ids(job[0] for job in jobs_data)
+        )
+        # Upserts only conflict when a job keeps its stored partition key
+        retention_dates = (
+            self.stored_retention_dates(job[0] for job in jobs_data)
+            if upsert and self.partitioned
+            else {}
+        )
+        seen_ids = set()
         new_jobs = []
         for job in jobs_data:
             job_id = job[0]
             description = job[18]  # description is at index 18 in the tuple
 
             # Skip if job already exists
-            if self.job_exists(job_id):
+            if job_id in existing_ids:
+                outcomes[job_id] = "unchanged"
+                continue
+            # One statement can't upsert the same id twice; the first wins
+            if job_id in seen_ids:
                 continue
 
             # Skip if description is empty, None, whitespace, or 'nan' (as string)
@@ -688,86 +1590,1005 @@ class JobDatabase:
                 logger.info(f"Skipping job {job_id} - no valid description provided")
                 continue
 
+            seen_ids.add(job_id)
             new_jobs.append(job)
+            outcomes[job_id] = "unchanged"
 
+        skipped = len(outcomes) - len(existing_ids) - len(new_jobs)
         if not new_jobs:
+            self.last_write_counts = WriteCounts(
+                unchanged=len(existing_ids), skipped=skipped
+            )
+            self.last_write_timings = WriteTimings(
+                enrich_seconds, time.perf_counter() - started - enrich_seconds
+            )
             logger.info("No new jobs to insert")
             return 0
 
-        job_columns = [
-            "id",
-            "site",
-            "job_url",
-            "job_url_direct",
-            "title",
-            "company",
-            "location",
-            "date_posted",
-            "job_type",
-            "salary_source",
-            "min_amount",
-            "max_amount",
-            "currency",
-            "is_remote",
-            "job_level",
-            "job_function",
-            "listing_type",
-            "emails",
-            "description",
-            "company_industry",
-            "company_url",
-            "company_logo",
-            "company_url_direct",
-            "company_description",
-            "skills",
-            "seniority_level",
-            "primary_language",
-            "tech_tags",
-            "city_normalized",
-            "country_normalized",
-            "position_tag",
-            "company_profile",
-        ]
-        column_count = len(job_columns)
+        if self.partitioned:
+            # date_posted is at index 7 in the tuple
+            today = date.today()
+            new_jobs = [
+                job + (retention_dates.get(job[0]) or job[7] or today,)
+                for job in new_jobs
+            ]
+
+        column_count = len(self._job_columns())
         for job in new_jobs:
             if len(job) != column_count:
                 raise ValueError(
                     f"Job tuple length {len(job)} does not match column count {column_count}"
                 )
 
+        written = None
+        if self.loader == LOADER_COPY:
+            try:
+                written = self._copy_jobs(new_jobs)
+            except psycopg2.Error as e:
+                logger.warning(
+                    f"COPY loader failed ({e}); falling back to execute_values"
+                )
+
+        if written is None:
+            try:
+                written = self._insert_values(new_jobs)
+            except Exception as e:
+                logger.error(f"Error inserting jobs: {e}")
+                raise
+
+        # written holds (id, inserted) for every row the statement changed
+        if upsert and self.partitioned:
+            written = [(job_id, job_id not in retention_dates) for job_id, _ in written]
+        inserted = sum(1 for _, is_new in written if is_new)
+        for job_id, is_new in written:
+            outcomes[job_id] = "inserted" if is_new else "updated"
+        counts = WriteCounts(
+            inserted=inserted,
+            updated=len(written) - inserted,
+            unchanged=len(existing_ids) + len(new_jobs) - len(written),
+            skipped=skipped,
+        )
+        self.last_write_counts = counts
+        self.last_write_timings = WriteTimings(
+            enrich_seconds, time.perf_counter() - started - enrich_seconds
+        )
+        if upsert:
+            logger.info(
+                f"Upserted {len(new_jobs)} jobs: {counts.inserted} inserted, "
+                f"{counts.updated} updated, {counts.unchanged} unchanged"
+            )
+        else:
+            logger.info(f"Successfully inserted {counts.inserted} new jobs")
+
+        if self.translator is not None and written:
+            changed_ids = {job_id for job_id, _ in written}
+            # title and description are at index 4 and 18 in the tuple
+            self.translator.translate_jobs_async(
+                [(job[0], job[4], job[18]) for job in new_jobs if job[0] in changed_ids]
+            )
+        return counts.inserted
+
+    def _job_columns(self):
+        """Columns of the rows insert_jobs writes"""
+        if self.partitioned:
+            return JOB_COLUMNS + ["retention_date"]
+        return JOB_COLUMNS
+
+    def _conflict_clause(self):
+        """ON CONFLICT/RETURNING tail shared by both loaders"""
+        key = "id, retention_date" if self.partitioned else "id"
+        if self.write_mode == WRITE_UPSERT:
+            updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in JOB_COLUMNS[1:])
+            # Partitioned tables can't return system columns such as xmax;
+            # insert_jobs tells inserts from updates by the stored ids instead
+            is_new = "true" if self.partitioned else "(xmax = 0)"
+            return f"""
+            ON CONFLICT ({key}) DO UPDATE
+                SET {updates}, updated_at = CURRENT_TIMESTAMP
+                WHERE jobs.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+            RETURNING id, {is_new}
+            """
+        return f"ON CONFLICT ({key}) DO NOTHING RETURNING id, true"
+
+    def _insert_values(self, rows):
         insert_query = f"""
-        INSERT INTO jobs ({", ".join(job_columns)})
+        INSERT INTO jobs ({", ".join(self._job_columns())})
         VALUES %s
-        ON CONFLICT (id) DO NOTHING
+        {self._conflict_clause()}
+        """
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                written = execute_values(cur, insert_query, rows, fetch=True)
+                conn.commit()
+        return written
+
+    @staticmethod
+    def _copy_value(value):
+        if value is None:
+            return "\\N"
+        if isinstance(value, bool):
+            return "t" if value else "f"
+        if isinstance(value, date):
+            return value.isoformat()
+        return (
+            str(value)
+            .replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+
+    def _copy_jobs(self, rows):
+        """Stream rows into a session-local staging table, then merge into jobs.
+
+        Returns (id, inserted) for every row the merge inserted or updated.
+        """
+        columns = ", ".join(self._job_columns())
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write("\t".join(self._copy_value(v) for v in row))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                # Temp tables are unlogged and private to the pooled session;
+                # ON COMMIT DELETE ROWS empties it after every merge.
+                cur.execute(
+                    """
+                    CREATE TEMP TABLE IF NOT EXISTS jobs_staging
+                        (LIKE jobs INCLUDING DEFAULTS)
+                        ON COMMIT DELETE ROWS
+                    """
+                )
+                cur.copy_expert(f"COPY jobs_staging ({columns}) FROM STDIN", buffer)
+                cur.execute(
+                    f"""
+                    INSERT INTO jobs ({columns})
+                    SELECT {columns} FROM jobs_staging
+                    {self._conflict_clause()}
+                    """
+                )
+                written = cur.fetchall()
+                conn.commit()
+        return written
+
+    def cleanup_old_jobs(self, max_age_days):
+        """Delete jobs posted, or stored when undated, over max_age_days ago.
+
+        Partitioned tables drop whole expired daily partitions and only
+        delete row by row from the default partition. Deletes run in
+        batches of cleanup_batch_size rows, each in its own transaction.
         """
+        try:
+            if self.partitioned:
+                deleted = self._drop_expired_partitions(max_age_days)
+                self.ensure_partitions(0)
+                deleted += self._delete_in_batches(
+                    DEFAULT_PARTITION,
+                    "retention_date < CURRENT_DATE - %s",
+                    (max_age_days,),
+                )
+            else:
+                deleted = self._delete_in_batches(
+                    "jobs",
+                    """
+                    (date_posted IS NOT NULL AND date_posted < (CURRENT_DATE - %s))
+                    OR (
+                        date_posted IS NULL
+                        AND created_at < NOW() - (%s * INTERVAL '1 day')
+                    )
+                    """,
+                    (max_age_days, max_age_days),
+                )
+            logger.info(f"Deleted {deleted} jobs older than {max_age_days} days")
+        except Exception as e:
+            logger.error(f"Error cleaning up old jobs: {e}")
+
+    def _drop_expired_partitions(self, max_age_days):
+        """Detach and drop the daily partitions older than max_age_days"""
+        query = """
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE pg_inherits.inhparent = 'jobs'::regclass
+        """
+        dropped = deleted = 0
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT CURRENT_DATE - %s", (max_age_days,))
+                cutoff = cur.fetchone()[0]
+                cur.execute(query)
+                for (name,) in cur.fetchall():
+                    if not name.startswith(PARTITION_PREFIX):
+                        continue
+                    try:
+                        day = datetime.strptime(
+                            name[len(PARTITION_PREFIX) :], "%Y%m%d"
+                        ).date()
+                    except ValueError:
+                        continue
+                    if day >= cutoff:
+                        continue
+                    cur.execute(f"SELECT count(*) FROM {name}")
+                    deleted += cur.fetchone()[0]
+                    cur.execute(f"ALTER TABLE jobs DETACH PARTITION {name}")
+                    cur.execute(f"DROP TABLE {name}")
+                    conn.commit()
+                    dropped += 1
+        logger.info(f"Dropped {dropped} expired job partitions")
+        return deleted
 
+    def _delete_in_batches(self, table, condition, params):
+        """DELETE rows matching condition, cleanup_batch_size rows at a time.
+
+        The matching ids are read in one scan up front and each batch deletes
+        by primary key, rather than every batch scanning the table again
+        (past the dead rows of the batches before it) to find its rows.
+        condition is checked again on delete, for rows updated since.
+        """
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(f"SELECT id FROM {table} WHERE {condition}", params)
+                ids = [row[0] for row in cur.fetchall()]
+                conn.commit()
+        query = f"DELETE FROM {table} WHERE id = ANY(%s) AND ({condition})"
+        deleted = 0
+        for start in range(0, len(ids), self.cleanup_batch_size):
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    batch = ids[start : start + self.cleanup_batch_size]
+                    cur.execute(query, (batch, *params))
+                    deleted += cur.rowcount
+                    conn.commit()
+        return deleted
+
+    def mark_config_started(self, query_id, results_wanted=None):
+        """Record in config_runs that a config started running"""
+        query = """
+        INSERT INTO config_runs (query_id, status, started_at, results_wanted)
+        VALUES (%s, 'running', CURRENT_TIMESTAMP, %s)
+        ON CONFLICT (query_id) DO UPDATE SET
+            status = 'running',
+            started_at = EXCLUDED.started_at,
+            finished_at = NULL,
+            results_wanted = EXCLUDED.results_wanted
+        """
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
-                    execute_values(cur, insert_query, new_jobs)
+                    cur.execute(query, (query_id, results_wanted))
                     conn.commit()
-            logger.info(f"Successfully inserted {len(new_jobs)} new jobs")
-            return len(new_jobs)
         except Exception as e:
-            logger.error(f"Error inserting jobs: {e}")
-            raise
+            logger.error(f"Error checkpointing start of {query_id}: {e}")
 
-    def cleanup_old_jobs(self, max_age_days):
-        delete_query = """
-        DELETE FROM jobs
-        WHERE
-            (date_posted IS NOT NULL AND date_posted < (CURRENT_DATE - %s))
-            OR (date_posted IS NULL AND created_at < NOW() - (%s * INTERVAL '1 day'))
+    def mark_config_finished(
+        self, query_id, found=None, new=None, inserted=None, error=None, queued=False
+    ):
+        """Record a config's outcome; error marks it failed instead of done.
+
+        queued marks a scrape whose results were handed to a JobWriter; it
+        only counts as done once mark_config_written confirms they were
+        stored, so --resume reruns it otherwise. Successful scrapes also fold
+        their duration into seconds_per_result, an exponentially weighted
+        average that budgeted runs plan with.
         """
+        query = """
+        UPDATE config_runs SET
+            status = %(status)s,
+            finished_at = CURRENT_TIMESTAMP,
+            duration_seconds = EXTRACT(EPOCH FROM CURRENT_TIMESTAMP - started_at),
+            seconds_per_result = CASE
+                WHEN %(status)s <> 'failed' AND results_wanted > 0 THEN COALESCE(
+                    %(weight)s * EXTRACT(EPOCH FROM CURRENT_TIMESTAMP - started_at)
+                        / results_wanted
+                    + (1 - %(weight)s) * seconds_per_result,
+                    EXTRACT(EPOCH FROM CURRENT_TIMESTAMP - started_at)
+                        / results_wanted
+                )
+                ELSE seconds_per_result
+            END,
+            jobs_found = %(found)s,
+            jobs_new = %(new)s,
+            jobs_inserted = %(inserted)s,
+            last_error = %(error)s
+        WHERE query_id = %(query_id)s
+        """
+        params = {
+            "status": "failed" if error else "queued" if queued else "done",
+            "weight": COST_ESTIMATE_WEIGHT,
+            "found": found,
+            "new": new,
+            "inserted": inserted,
+            "error": error,
+            "query_id": query_id,
+        }
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute(delete_query, (max_age_days, max_age_days))
-                    deleted = cur.rowcount
+                    cur.execute(query, params)
                     conn.commit()
-            logger.info(f"Deleted {deleted} jobs older than {max_age_days} days")
         except Exception as e:
-            logger.error(f"Error cleaning up old jobs: {e}")
+            logger.error(f"Error checkpointing end of {query_id}: {e}")
+
+    def mark_config_written(self, query_id, inserted=None, error=None):
+        """Record that a queued config's results were written, or failed to be.
+
+        Only configs still 'queued' are updated, so a config that has started
+        running again in the meantime keeps its new status.
+        """
+        query = """
+        UPDATE config_runs SET
+            status = %(status)s,
+            jobs_inserted = %(inserted)s,
+            last_error = %(error)s
+        WHERE query_id = %(query_id)s AND status = 'queued'
+        """
+        params = {
+            "status": "failed" if error else "done",
+            "inserted": inserted,
+            "error": error,
+            "query_id": query_id,
+        }
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, params)
+                    conn.commit()
+        except Exception as e:
+            logger.error(f"Error checkpointing writes of {query_id}: {e}")
+
+    def config_cost_estimates(self):
+        """query_id -> learned seconds_per_result for configs that have one"""
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "SELECT query_id, seconds_per_result FROM config_runs "
+                        "WHERE seconds_per_result IS NOT NULL"
+                    )
+                    return dict(cur.fetchall())
+        except Exception as e:
+            logger.error(f"Error reading config cost estimates: {e}")
+            return {}
+
+    def record_query_stats(self, stats):
+        """Store one config run's QueryStats rows in query_stats"""
+        query = """
+        INSERT INTO query_stats (
+            query_id, site, fetched, duplicates, skipped, inserted,
+            duration_seconds
+        ) VALUES %s
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    execute_values(cur, query, stats.rows())
+                    conn.commit()
+        except Exception as e:
+            logger.error(f"Error recording query stats for {stats.query_id}: {e}")
+
+    def query_yields(self, runs):
+        """Yield of each query over its last `runs` recorded runs.
+
+        Returns query_id -> QueryYield(runs, fetched, inserted,
+        hours_since_last_run), summed over sites.
+        """
+        query = """
+        SELECT query_id, count(*), sum(fetched), sum(inserted),
+            EXTRACT(EPOCH FROM CURRENT_TIMESTAMP - max(recorded_at)) / 3600
+        FROM (
+            SELECT query_id, recorded_at,
+                sum(fetched) AS fetched, sum(inserted) AS inserted,
+                row_number() OVER (
+                    PARTITION BY query_id ORDER BY recorded_at DESC
+                ) AS run
+            FROM query_stats
+            GROUP BY query_id, recorded_at
+        ) recent
+        WHERE run <= %s
+        GROUP BY query_id
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, (runs,))
+                    return {
+                        row[0]: QueryYield(
+                            int(row[1]), int(row[2]), int(row[3]), float(row[4])
+                        )
+                        for row in cur.fetchall()
+                    }
+        except Exception as e:
+            logger.error(f"Error reading query yields: {e}")
+            return {}
+
+    def recently_finished_configs(self, window_hours):
+        """query_ids that finished successfully within the last window_hours.
+
+        Configs whose results are still 'queued' for a writer, e.g. because
+        the run was killed before they were written, do not count.
+        """
+        query = """
+        SELECT query_id FROM config_runs
+        WHERE status = 'done'
+            AND finished_at >= CURRENT_TIMESTAMP - (%s * INTERVAL '1 hour')
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, (window_hours,))
+                    return {row[0] for row in cur.fetchall()}
+        except Exception as e:
+            logger.error(f"Error reading config checkpoints: {e}")
+            return set()
+
+
+def _enrich_batch(records):
+    """Process-pool entry point for JobDatabase._enrich_uncached"""
+    return [JobDatabase._enrich_job(*record) for record in records]
+
+
+class SearchPage(NamedTuple):
+    jobs: list
+    # Pass as search_jobs(after=...) for the next page; None on the last one
+    after: tuple | None
+
+
+class QueryYield(NamedTuple):
+    runs: int
+    fetched: int
+    inserted: int
+    hours_since_last_run: float
+
+
+class QueryStats:
+    """Per-site yield of one config run, recorded in the query_stats table.
+
+    fetched counts what the sites returned; every fetched job then ends up
+    in exactly one of duplicates (seen earlier in the run or already
+    stored unchanged), skipped (no description or no position_tag) or
+    inserted. Jobs rewritten by an upsert count as duplicates. The scrape
+    duration of the whole config is recorded against each of its sites.
+    Pages scraped and written at different times may be counted
+    incrementally, from the scrape and writer threads at once.
+    """
+
+    def __init__(self, query_id, sites):
+        self.query_id = query_id
+        self.duration_seconds = 0.0
+        self.sites = set(sites)
+        self.fetched = Counter()
+        self.duplicates = Counter()
+        self.skipped = Counter()
+        self.inserted = Counter()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _site_counts(jobs_df):
+        if jobs_df.empty or "site" not in jobs_df.columns:
+            return Counter()
+        return Counter(str(site) for site in jobs_df["site"].tolist())
+
+    def record_fetched(self, jobs_df):
+        """Count jobs_df, one more page of the config's results"""
+        with self._lock:
+            self.fetched.update(self._site_counts(jobs_df))
+
+    def record_repeats(self, jobs_df, fetched_df=None):
+        """Count jobs_df, the jobs left of fetched_df (default: everything
+        fetched) after dropping run-level repeats"""
+        fetched = (
+            self._site_counts(fetched_df) if fetched_df is not None else self.fetched
+        )
+        with self._lock:
+            self.duplicates.update(fetched - self._site_counts(jobs_df))
+
+    def record_writes(self, jobs_df, outcomes):
+        """Count the insert_jobs outcome of every job in jobs_df"""
+        if jobs_df.empty:
+            return
+        with self._lock:
+            for job_id, site in zip(jobs_df["id"].tolist(), jobs_df["site"].tolist()):
+                outcome = outcomes.get(str(job_id), "unchanged")
+                if outcome == "inserted":
+                    self.inserted[str(site)] += 1
+                elif outcome == "skipped":
+                    self.skipped[str(site)] += 1
+                else:
+                    self.duplicates[str(site)] += 1
+
+    def rows(self):
+        """One query_stats row per site the config searched or returned"""
+        return [
+            (
+                self.query_id,
+                site,
+                self.fetched[site],
+                self.duplicates[site],
+                self.skipped[site],
+                self.inserted[site],
+                self.duration_seconds,
+            )
+            for site in sorted(self.sites | set(self.fetched))
+        ]
+
+
+class JobIdRegistry:
+    """Ids of every job already seen in this run.
+
+    Overlapping configs return many of the same postings. filter_new() drops
+    those before they reach enrichment or the database and counts, per
+    config, how many of its results were new and how many were repeats.
+    """
+
+    def __init__(self):
+        self.counts = {}
+        self._ids = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def filter_new(self, query_id, jobs_df):
+        """Return the rows of jobs_df whose id wasn't seen earlier in the run"""
+        if jobs_df.empty or "id" not in jobs_df.columns:
+            return jobs_df
+        is_new = []
+        with self._lock:
+            for job_id in jobs_df["id"].tolist():
+                is_new.append(job_id not in self._ids)
+                self._ids.add(job_id)
+            new = sum(is_new)
+            previous_new, previous_repeat = self.counts.get(query_id, (0, 0))
+            self.counts[query_id] = (
+                previous_new + new,
+                previous_repeat + len(is_new) - new,
+            )
+        if new == len(is_new):
+            return jobs_df
+        return jobs_df[is_new].reset_index(drop=True)
+
+    def log_summary(self):
+        """Log new vs repeat counts per config, most redundant first"""
+
+        def repeat_share(item):
+            new, repeat = item[1]
+            return repeat / (new + repeat) if new + repeat else 0.0
+
+        logger.info(f"Saw {len(self._ids)} distinct jobs this run")
+        for query_id, (new, repeat) in sorted(
+            self.counts.items(), key=repeat_share, reverse=True
+        ):
+            share = repeat_share((query_id, (new, repeat)))
+            logger.info(f"{query_id}: {new} new, {repeat} repeat ({share:.0%} repeat)")
+
+
+class RunReport:
+    """Structured timings and counters of one run, per config and per site.
+
+    Each config records its scrape: the jobspy.metrics counters of every
+    site it searched (search pages, detail fetches, requests, bytes, retries,
+    429s, network and parse seconds) and the jobs found and kept. Writes
+    add the enrichment and insert seconds and the inserted jobs; a writer
+    batch holding several configs is split between them by row count.
+    write() saves everything as JSON and, optionally, the per-site totals as
+    a Prometheus textfile for the node_exporter textfile collector.
+    """
+
+    STAGES = ("scrape_seconds", "enrich_seconds", "insert_seconds")
+
+    def __init__(self, config_group):
+        self.config_group = config_group
+        self.started_at = datetime.now()
+        self._started = time.monotonic()
+        self._configs = {}
+        self._lock = threading.Lock()
+
+    def _config(self, query_id):
+        entry = self._configs.get(query_id)
+        if entry is None:
+            entry = self._configs[query_id] = {
+                **dict.fromkeys(self.STAGES, 0.0),
+                "jobs_found": 0,
+                "jobs_new": 0,
+                "jobs_inserted": 0,
+                "error": None,
+                "sites": {},
+            }
+        return entry
+
+    def record_scrape(self, query_id, metrics, seconds, found, new):
+        """Record one config's scrape; metrics is its ScrapeMetrics"""
+        with self._lock:
+            entry = self._config(query_id)
+            entry["scrape_seconds"] += seconds
+            entry["jobs_found"] += found
+            entry["jobs_new"] += new
+            for site, counters in metrics.sites().items():
+                totals = entry["sites"].setdefault(site, Counter())
+                totals.update(counters)
+
+    def record_error(self, query_id, error):
+        with self._lock:
+            self._config(query_id)["error"] = error
+
+    def record_write(self, query_id, timings, inserted):
+        """Add one config's share of a write; timings is a WriteTimings"""
+        with self._lock:
+            entry = self._config(query_id)
+            entry["enrich_seconds"] += timings.enrich_seconds
+            entry["insert_seconds"] += timings.insert_seconds
+            entry["jobs_inserted"] += inserted
+
+    def summary(self):
+        """The whole report as a JSON-serializable dict"""
+        with self._lock:
+            configs = {
+                query_id: {
+                    **entry,
+                    "sites": {
+                        site: dict(counters)
+                        for site, counters in sorted(entry["sites"].items())
+                    },
+                }
+                for query_id, entry in self._configs.items()
+            }
+        sites = {}
+        totals = Counter()
+        for entry in configs.values():
+            for site, counters in entry["sites"].items():
+                sites.setdefault(site, Counter()).update(counters)
+            totals.update(
+                {
+                    key: entry[key]
+                    for key in (*self.STAGES, "jobs_found", "jobs_new", "jobs_inserted")
+                }
+            )
+        for counters in sites.values():
+            totals.update(counters)
+        return {
+            "config_group": self.config_group,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "duration_seconds": time.monotonic() - self._started,
+            "configs_run": len(configs),
+            "configs_failed": sum(1 for e in configs.values() if e["error"]),
+            "totals": dict(totals),
+            "sites": {site: dict(sites[site]) for site in sorted(sites)},
+            "configs": configs,
+        }
+
+    def log_summary(self, summary=None):
+        """Log one line per site and one for the database stages"""
+        summary = summary or self.summary()
+        for site, counters in summary["sites"].items():
+            logger.info(
+                f"{site}: {counters['search_pages']:.0f} search pages, "
+                f"{counters['detail_fetches']:.0f} detail fetches, "
+                f"{counters['requests']:.0f} requests "
+                f"({counters['bytes_downloaded'] / 1e6:.1f} MB, "
+                f"{counters['network_seconds']:.1f}s), "
+                f"{counters['retries']:.0f} retries, "
+                f"{counters['rate_limited']:.0f} rate limited, "
+                f"{counters['parse_seconds']:.1f}s parsing"
+            )
+        totals = summary["totals"]
+        logger.info(
+            f"Run stages: {totals.get('scrape_seconds', 0):.1f}s scraping, "
+            f"{totals.get('enrich_seconds', 0):.1f}s enriching, "
+            f"{totals.get('insert_seconds', 0):.1f}s inserting"
+        )
+
+    @staticmethod
+    def _label(value):
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+        return value.replace("\n", "\\n")
+
+    def prometheus(self, summary=None):
+        """Per-site counters and run totals in the Prometheus text format"""
+        summary = summary or self.summary()
+        group = f'group="{self._label(summary["config_group"])}"'
+        totals = summary["totals"]
+        metrics = [
+            (
+                "jobspy_run_duration_seconds",
+                "Wall-clock duration of the run",
+                [(group, summary["duration_seconds"])],
+            ),
+            (
+                "jobspy_run_configs",
+                "Configs run, by outcome",
+                [
+                    (
+                        f'{group},status="ok"',
+                        summary["configs_run"] - summary["configs_failed"],
+                    ),
+                    (f'{group},status="error"', summary["configs_failed"]),
+                ],
+            ),
+            (
+                "jobspy_run_jobs",
+                "Jobs found, new to the run and inserted",
+                [
+                    (f'{group},stage="{stage}"', totals.get(f"jobs_{stage}", 0))
+                    for stage in ("found", "new", "inserted")
+                ],
+            ),
+            (
+                "jobspy_run_stage_seconds",
+                "Seconds spent per stage, summed over configs",
+                [
+                    (
+                        f'{group},stage="{stage.removesuffix("_seconds")}"',
+                        totals.get(stage, 0),
+                    )
+                    for stage in self.STAGES
+                ],
+            ),
+        ]
+        for name in COUNTERS:
+            metrics.append(
+                (
+                    f"jobspy_site_{name}",
+                    f"{name.replace('_', ' ').capitalize()} per site",
+                    [
+                        (f'{group},site="{self._label(site)}"', counters[name])
+                        for site, counters in summary["sites"].items()
+                    ],
+                )
+            )
+        lines = []
+        for name, help_text, samples in metrics:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.extend(f"{name}{{{labels}}} {value:g}" for labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+    def write(self, path, prometheus_path=None):
+        """Write the JSON report to path and the textfile to prometheus_path"""
+        summary = self.summary()
+        self.log_summary(summary)
+        outputs = [(path, json.dumps(summary, indent=2, default=str))]
+        if prometheus_path:
+            outputs.append((prometheus_path, self.prometheus(summary)))
+        for target, content in outputs:
+            if not target:
+                continue
+            # Write-then-rename so a collector never reads a partial file
+            tmp_path = f"{target}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(content)
+                os.replace(tmp_path, target)
+                logger.info(f"Wrote run report {target}")
+            except OSError as e:
+                logger.error(f"Error writing run report {target}: {e}")
+
+
+class JobWriter:
+    """Writer stage decoupling scraping from enrichment and inserts.
+
+    Scrape workers put() their DataFrames on a bounded queue and move on to
+    the next search. A single writer thread coalesces queued results from
+    several configs into batches of about batch_rows jobs, or whatever
+    arrived within flush_interval seconds, and runs insert_jobs on each.
+    put() blocks while the queue is full, so scraping slows to the speed of
+    the writer instead of buffering without bound. close() drains the queue
+    for up to drain_timeout seconds; after that the writer gets halt_timeout
+    seconds to finish the batch it is writing and drops the rest.
+    Write timings go to report, a RunReport, if given.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        db,
+        queue_size=None,
+        batch_rows=None,
+        flush_interval=None,
+        drain_timeout=None,
+        halt_timeout=None,
+        report=None,
+    ):
+        self.db = db
+        self.report = report
+        self.batch_rows = max(
+            batch_rows
+            if batch_rows is not None
+            else _env_int("WRITER_BATCH_ROWS", 1000),
+            1,
+        )
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else _env_int("WRITER_FLUSH_SECONDS", 2)
+        )
+        self.drain_timeout = (
+            drain_timeout
+            if drain_timeout is not None
+            else _env_int("WRITER_DRAIN_TIMEOUT", 600)
+        )
+        self.halt_timeout = (
+            halt_timeout
+            if halt_timeout is not None
+            else _env_int("WRITER_HALT_TIMEOUT", 120)
+        )
+        self.queued = 0
+        self.written = 0
+        self.inserted = 0
+        self.failed = 0
+        # put() writes synchronously on producer threads once the writer
+        # thread is gone, so every counter is updated under this lock
+        self._counts_lock = threading.Lock()
+        # Set by close() when draining timed out; the writer stops between
+        # batches and leaves the rest of the queue unwritten
+        self._halt = threading.Event()
+        # query_id -> error of configs whose earlier results failed to write
+        self._unwritten = {}
+        self._queue = queue.Queue(
+            max(
+                queue_size
+                if queue_size is not None
+                else _env_int("WRITER_QUEUE_SIZE", 8),
+                1,
+            )
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="job-writer", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, query_id, jobs_df, stats=None, final=True, checkpoint=False):
+        """Queue one config's results, blocking while the writer is behind.
+
+        stats, a QueryStats, gets the write outcomes of these jobs. It is
+        recorded once they are written, unless more of the config's results
+        follow (final=False). With checkpoint, the config's 'queued' entry in
+        config_runs is marked done once its final results are written, or
+        failed if any of its results could not be.
+        """
+        item = (query_id, jobs_df, stats, final, checkpoint)
+        if not self._thread.is_alive():
+            logger.error("Job writer is not running; inserting synchronously")
+            self._write([item])
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            logger.info(f"Writer queue full; waiting to queue {len(jobs_df)} jobs")
+            self._queue.put(item)
+        with self._counts_lock:
+            self.queued += len(jobs_df)
+
+    def _run(self):
+        stop = False
+        while not stop and not self._halt.is_set():
+            item = self._queue.get()
+            if item is self._STOP:
+                break
+            batch = [item]
+            rows = len(item[1])
+            deadline = time.monotonic() + self.flush_interval
+            while rows < self.batch_rows:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop = True
+                    break
+                batch.append(item)
+                rows += len(item[1])
+            if self._halt.is_set():
+                self._drop(batch)
+                break
+            self._write(batch)
+
+    def _write(self, batch):
+        query_ids = ", ".join(dict.fromkeys(item[0] for item in batch))
+        jobs = pd.concat([item[1] for item in batch], ignore_index=True)
+        try:
+            inserted = self.db.insert_jobs(jobs)
+        except Exception as e:
+            with self._counts_lock:
+                self.failed += len(jobs)
+            logger.error(f"Error writing {len(jobs)} jobs from {query_ids}: {e}")
+            self._fail_checkpoints(batch, f"Writing results failed: {e}")
+            return
+        with self._counts_lock:
+            self.written += len(jobs)
+            self.inserted += inserted
+        outcomes = self.db.last_write_outcomes
+        timings = self.db.last_write_timings
+        for query_id, jobs_df, stats, final, checkpoint in batch:
+            if stats is not None:
+                stats.record_writes(jobs_df, outcomes)
+                if final:
+                    self.db.record_query_stats(stats)
+            if final and checkpoint:
+                error = self._unwritten.pop(query_id, None)
+                self.db.mark_config_written(
+                    query_id,
+                    sum(stats.inserted.values()) if stats is not None else None,
+                    error,
+                )
+            if self.report is not None:
+                share = len(jobs_df) / len(jobs) if len(jobs) else 0.0
+                self.report.record_write(
+                    query_id,
+                    WriteTimings(*(seconds * share for seconds in timings)),
+                    sum(
+                        1
+                        for job_id in jobs_df["id"].tolist()
+                        if outcomes.get(str(job_id)) == "inserted"
+                    ),
+                )
+        logger.info(
+            f"Wrote batch of {len(jobs)} jobs from {len(batch)} results "
+            f"({query_ids}): {inserted} inserted"
+        )
+
+    def _fail_checkpoints(self, batch, error):
+        for query_id, _, _, final, checkpoint in batch:
+            if not checkpoint:
+                continue
+            if final:
+                self._unwritten.pop(query_id, None)
+                self.db.mark_config_written(query_id, error=error)
+            else:
+                # Reported when the config's final results are written
+                self._unwritten.setdefault(query_id, error)
+
+    def _drop(self, batch):
+        jobs = sum(len(item[1]) for item in batch)
+        with self._counts_lock:
+            self.failed += jobs
+        if jobs:
+            logger.error(f"Job writer stopped; dropped {jobs} unwritten jobs")
+
+    def close(self):
+        """Flush everything queued so far and stop the writer thread.
+
+        The writer gets drain_timeout seconds to empty the queue. After that
+        it is halted and the batch already being written gets halt_timeout
+        more seconds. A writer stuck past that is abandoned (it is a daemon
+        thread) and its batch is lost, so a hung insert_jobs can't hang
+        shutdown.
+        """
+        if self._thread.is_alive():
+            deadline = time.monotonic() + self.drain_timeout
+            try:
+                self._queue.put(self._STOP, timeout=self.drain_timeout)
+            except queue.Full:
+                pass
+            else:
+                self._thread.join(max(deadline - time.monotonic(), 0))
+        if self._thread.is_alive():
+            logger.error(
+                f"Job writer did not drain within {self.drain_timeout}s; "
+                "halting it after the batch being written"
+            )
+            self._halt.set()
+            self._thread.join(self.halt_timeout)
+        if self._thread.is_alive():
+            logger.error(
+                f"Job writer still busy {self.halt_timeout}s after halting; "
+                "abandoning its thread"
+            )
+        leftover = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not self._STOP:
+                leftover.append(item)
+        self._drop(leftover)
+        logger.info(
+            f"Job writer: {self.queued} jobs queued, {self.written} written, "
+            f"{self.inserted} inserted, {self.failed} failed"
+        )
 
 
 def infer_country_indeed(location):
@@ -817,8 +2638,24 @@ def infer_country_indeed(location):
     return "usa"
 
 
-def scrape_and_save(config, db):
-    """Scrape jobs for a single configuration and save to database"""
+def scrape_and_save(config, db, writer=None, registry=None, report=None, client=None):
+    """Scrape jobs for a single configuration and save to database.
+
+    With a JobIdRegistry, jobs already seen earlier in the run are dropped
+    first. With a JobWriter the results are queued for it instead of
+    inserted here, page by page as the sites return them, so inserts start
+    while slower sites are still paginating; if the scrape fails midway,
+    the pages already scraped are still written. Progress is checkpointed
+    in the config_runs table. The per-site yield of every successful run,
+    and of failed runs that queued pages, is kept in query_stats. With a
+    RunReport, the scrape's counters and timings are recorded in it. With a
+    JobSpy client, its warm sessions are used instead of new ones.
+    """
+    found = new = inserted_count = stats = jobs = None
+    queued = False
+    metrics = ScrapeMetrics() if report is not None else None
+    db.mark_config_started(config["query_id"], config.get("results_wanted", 100))
+    started = time.monotonic()
     try:
         logger.info(f"Starting scrape for query: {config['query_id']}")
 
@@ -832,14 +2669,10 @@ def scrape_and_save(config, db):
         # Enable full LinkedIn descriptions where applicable so jobs
         # aren't skipped just because the brief listing view omits them.
         site_name = config["site_name"]
-        has_linkedin = False
-        if isinstance(site_name, str):
-            has_linkedin = site_name.lower() == "linkedin"
-        else:
-            has_linkedin = any(s.lower() == "linkedin" for s in site_name)
+        has_linkedin = "linkedin" in _config_sites(config)
 
         # Scrape jobs
-        jobs = scrape_jobs(
+        search = dict(
             site_name=site_name,
             search_term=config["search_term"],
             location=location,
@@ -848,16 +2681,71 @@ def scrape_and_save(config, db):
             country_indeed=country_indeed,
             linkedin_fetch_description=has_linkedin,
             verbose=1,
+            metrics=metrics,
         )
-
-        logger.info(f"Found {len(jobs)} jobs for {config['query_id']}")
+        scrape, scrape_iter = (
+            (scrape_jobs, scrape_jobs_iter)
+            if client is None
+            else (client.scrape, client.scrape_iter)
+        )
+        pages = [scrape(**search)] if writer is None else scrape_iter(**search)
+        stats = QueryStats(config["query_id"], _config_sites(config))
+        fetched = kept = 0
+        # jobs holds the latest page with new jobs; earlier ones are queued
+        for page in pages:
+            stats.record_fetched(page)
+            fetched += len(page)
+            if registry is not None and not page.empty:
+                new_jobs = registry.filter_new(config["query_id"], page)
+                stats.record_repeats(new_jobs, page)
+                page = new_jobs
+            kept += len(page)
+            if page.empty:
+                continue
+            if jobs is not None:
+                writer.put(
+                    config["query_id"], jobs, stats, final=False, checkpoint=True
+                )
+            jobs = page
+        stats.duration_seconds = time.monotonic() - started
+
+        found, new = fetched, kept
+        logger.info(f"Found {found} jobs for {config['query_id']}")
+        if registry is not None and found:
+            logger.info(
+                f"{new} new, {found - new} already seen this run "
+                f"for {config['query_id']}"
+            )
+        if report is not None:
+            report.record_scrape(
+                config["query_id"], metrics, stats.duration_seconds, found, new
+            )
 
         # Save to database
-        if not jobs.empty:
+        queued = jobs is not None and writer is not None
+        if queued:
+            # Checkpointed as queued first; the writer marks the config done
+            # once these jobs are written
+            db.mark_config_finished(config["query_id"], found, new, queued=True)
+            writer.put(config["query_id"], jobs, stats, checkpoint=True)
+            logger.info(f"Queued {new} jobs for {config['query_id']}")
+        elif jobs is not None:
             inserted_count = db.insert_jobs(jobs)
+            stats.record_writes(jobs, db.last_write_outcomes)
+            db.record_query_stats(stats)
+            if report is not None:
+                report.record_write(
+                    config["query_id"], db.last_write_timings, inserted_count
+                )
             logger.info(f"Inserted {inserted_count} new jobs for {config['query_id']}")
         else:
-            logger.info(f"No jobs found for {config['query_id']}")
+            db.record_query_stats(stats)
+            if found:
+                logger.info(f"No new jobs for {config['query_id']}")
+            else:
+                logger.info(f"No jobs found for {config['query_id']}")
+        if not queued:
+            db.mark_config_finished(config["query_id"], found, new, inserted_count)
 
         # Add delay between scrapes to be respectful
         delay = config.get("delay", 2)
@@ -867,16 +2755,395 @@ def scrape_and_save(config, db):
 
     except Exception as e:
         logger.error(f"Error scraping {config['query_id']}: {e}")
+        db.mark_config_finished(
+            config["query_id"], found, new, inserted_count, error=str(e)
+        )
+        if report is not None:
+            if found is None:
+                # The scrape itself failed; keep what its requests recorded
+                report.record_scrape(
+                    config["query_id"], metrics, time.monotonic() - started, 0, 0
+                )
+            report.record_error(config["query_id"], str(e))
+        if writer is not None and jobs is not None and not queued:
+            # Earlier pages are queued already; the held one completes the
+            # config's stats once they are all written
+            stats.duration_seconds = time.monotonic() - started
+            writer.put(config["query_id"], jobs, stats)
         # Continue with other configs even if one fails
 
 
-def main(config_group="all"):
+def _config_sites(config):
+    site_name = config["site_name"]
+    if isinstance(site_name, str):
+        return {site_name.lower()}
+    return {s.lower() for s in site_name}
+
+
+def _parse_site_limits(value):
+    """Parse "linkedin=2,indeed=4" into {"linkedin": 2, "indeed": 4}"""
+    limits = {}
+    for item in (value or "").split(","):
+        if not item.strip():
+            continue
+        site, _, limit = item.partition("=")
+        try:
+            limits[site.strip().lower()] = max(int(limit), 1)
+        except ValueError:
+            logger.error(f"Invalid SCRAPE_SITE_LIMITS entry: {item.strip()}. Ignoring.")
+    return limits
+
+
+# Jobs returned per search request, used to estimate the cost of a plan.
+# LinkedIn's guest search pages hold 10 cards and every LinkedIn job costs
+# one more request for its full description.
+SITE_PAGE_SIZES = {
+    "linkedin": 10,
+    "indeed": 100,
+    "glassdoor": 30,
+    "zip_recruiter": 20,
+    "google": 10,
+    "naukri": 20,
+}
+DEFAULT_PAGE_SIZE = 10
+
+
+def _resolve_groups(config_group):
+    """Group names for "all", "a,b" or a list of names; unknown names raise"""
+    names = (
+        config_group
+        if isinstance(config_group, (list, tuple))
+        else [name.strip() for name in config_group.split(",") if name.strip()]
+    )
+    if "all" in names:
+        return list(CONFIG_GROUPS)
+    unknown = [name for name in names if name not in CONFIG_GROUPS]
+    if unknown or not names:
+        available = ", ".join(["all", *CONFIG_GROUPS])
+        logger.error(
+            f"Unknown config group: {', '.join(unknown) or config_group}. "
+            f"Available: {available}"
+        )
+        raise SystemExit(f"Unknown config group: {config_group}")
+    return list(dict.fromkeys(names))
+
+
+def _normalize_query(value):
+    return " ".join(str(value or "").lower().split())
+
+
+def plan_configs(config_group):
+    """Deduplicated list of configs to run for one or more groups.
+
+    Each (site, search term, location, hours_old) search runs once. A config
+    whose searches were all planned already is dropped; one that overlaps only
+    on some sites keeps just the remaining sites. Merged duplicates raise the
+    kept config's results_wanted to the largest requested.
+    """
+    plan = []
+    planned = {}
+    for name in _resolve_groups(config_group):
+        for config in CONFIG_GROUPS[name]:
+            sites = config["site_name"]
+            new_sites = []
+            for site in [sites] if isinstance(sites, str) else sites:
+                key = (
+                    site.lower(),
+                    _normalize_query(config["search_term"]),
+                    _normalize_query(config.get("location")),
+                    config.get("hours_old", 72),
+                )
+                if key in planned:
+                    kept = plan[planned[key]]
+                    kept["results_wanted"] = max(
+                        kept.get("results_wanted", 100),
+                        config.get("results_wanted", 100),
+                    )
+                else:
+                    planned[key] = len(plan)
+                    new_sites.append(site)
+            if new_sites:
+                planned_config = dict(config)
+                planned_config["site_name"] = (
+                    new_sites if not isinstance(sites, str) else new_sites[0]
+                )
+                plan.append(planned_config)
+    return plan
+
+
+def estimate_requests(configs):
+    """Rough number of HTTP requests needed to run configs"""
+    total = 0
+    for config in configs:
+        wanted = config.get("results_wanted", 100)
+        for site in _config_sites(config):
+            total += math.ceil(wanted / SITE_PAGE_SIZES.get(site, DEFAULT_PAGE_SIZE))
+            if site == "linkedin":
+                total += wanted
+    return total
+
+
+# Seconds per wanted result assumed for configs with no timing history yet:
+# a LinkedIn + Indeed query for 40 results takes about 30 seconds.
+DEFAULT_SECONDS_PER_RESULT = 0.75
+# Weight of the newest run in the learned seconds_per_result average
+COST_ESTIMATE_WEIGHT = 0.3
+# Share of a time budget that planned scraping may use; the rest covers
+# estimate error, the writer drain and cleanup
+BUDGET_SAFETY = 0.85
+MIN_RESULTS_WANTED = 10
+
+
+def allocate_budget(
+    configs, seconds_per_result, budget_seconds, workers=1, site_limits=None
+):
+    """Fit configs into budget_seconds by scaling down results_wanted.
+
+    A config's cost is its learned seconds_per_result (or the median of the
+    known ones, or DEFAULT_SECONDS_PER_RESULT) times results_wanted, plus its
+    fixed delay. Like in run_configs, every config holds one of `workers`
+    workers and one of site_limits[site] slots for each capped site it
+    searches, so the run takes at least the longest of these resources'
+    total cost over its capacity. When that would exceed BUDGET_SAFETY of
+    the budget, results_wanted shrinks by the same factor for all configs,
+    down to MIN_RESULTS_WANTED. Returns the adjusted configs and each one's
+    estimated duration in seconds, keyed by query_id.
+    """
+    known = [rate for rate in seconds_per_result.values() if rate and rate > 0]
+    default_rate = statistics.median(known) if known else DEFAULT_SECONDS_PER_RESULT
+
+    def rate(config):
+        return seconds_per_result.get(config["query_id"]) or default_rate
+
+    workers = max(workers, 1)
+    resources = [(configs, workers)]
+    for site, limit in (site_limits or {}).items():
+        using = [config for config in configs if site in _config_sites(config)]
+        if using:
+            resources.append((using, min(limit, workers)))
+
+    factor = 1.0
+    needed = 0.0
+    for using, capacity in resources:
+        fixed = sum(config.get("delay", 2) for config in using) / capacity
+        scalable = (
+            sum(rate(config) * config.get("results_wanted", 100) for config in using)
+            / capacity
+        )
+        needed = max(needed, fixed + scalable)
+        if scalable > 0:
+            usable = budget_seconds * BUDGET_SAFETY - fixed
+            factor = min(factor, max(usable, 0) / scalable)
+
+    planned = []
+    estimates = {}
+    for config in configs:
+        wanted = config.get("results_wanted", 100)
+        if factor < 1.0:
+            config = dict(config)
+            config["results_wanted"] = max(MIN_RESULTS_WANTED, int(wanted * factor))
+        planned.append(config)
+        estimates[config["query_id"]] = rate(config) * config.get(
+            "results_wanted", 100
+        ) + config.get("delay", 2)
+
+    logger.info(
+        f"Budget {budget_seconds / 60:.0f} min: configs need "
+        f"~{needed / 60:.0f} min on {workers} workers"
+        + (f" and site limits {site_limits}" if site_limits else "")
+        + (f"; scaling results_wanted by {factor:.2f}" if factor < 1.0 else "")
+    )
+    return planned, estimates
+
+
+def apply_yield_policy(
+    configs, yields, min_percent=None, runs=None, interval_hours=None
+):
+    """Spend less on queries that keep returning nothing new.
+
+    A query is low-yield once it has `runs` recorded runs (LOW_YIELD_RUNS,
+    default 3) that together inserted less than min_percent
+    (LOW_YIELD_PERCENT, default 5) of what they fetched. Low-yield queries
+    run at most every interval_hours (LOW_YIELD_INTERVAL_HOURS, default 72)
+    and with half their results_wanted. yields comes from
+    JobDatabase.query_yields(runs). Returns the configs to run.
+    """
+    min_percent = (
+        min_percent if min_percent is not None else _env_int("LOW_YIELD_PERCENT", 5)
+    )
+    runs = runs if runs is not None else _env_int("LOW_YIELD_RUNS", 3)
+    interval_hours = (
+        interval_hours
+        if interval_hours is not None
+        else _env_int("LOW_YIELD_INTERVAL_HOURS", 72)
+    )
+
+    planned = []
+    deferred = reduced = 0
+    for config in configs:
+        history = yields.get(config["query_id"])
+        if (
+            history is None
+            or history.runs < runs
+            or history.inserted * 100 >= history.fetched * min_percent
+        ):
+            planned.append(config)
+            continue
+        if history.hours_since_last_run < interval_hours:
+            deferred += 1
+            continue
+        config = dict(config)
+        config["results_wanted"] = max(
+            MIN_RESULTS_WANTED, config.get("results_wanted", 100) // 2
+        )
+        planned.append(config)
+        reduced += 1
+
+    logger.info(
+        f"Yield policy: deferred {deferred} and halved results_wanted for "
+        f"{reduced} queries inserting under {min_percent}% of what they fetch"
+    )
+    return planned
+
+
+def run_configs(
+    configs,
+    db,
+    workers=None,
+    site_limits=None,
+    writer=None,
+    registry=None,
+    deadline=None,
+    estimates=None,
+    report=None,
+    client=None,
+):
+    """Run scrape_and_save for every config, several at a time.
+
+    At most `workers` configs run at once (SCRAPE_WORKERS, default 1 which
+    keeps the old sequential order) and at most site_limits[site] of them
+    may touch the same site (SCRAPE_SITE_LIMITS, e.g. "linkedin=2"). A config
+    is only dispatched once all of its sites have capacity, so configs
+    waiting on a busy site don't hold a worker. Each config's failure stays
+    with that config. writer, registry, report and client are passed on to
+    scrape_and_save.
+
+    deadline is a time.monotonic() value: a config whose estimated duration
+    (estimates[query_id], seconds) would not finish by then is skipped when
+    its turn comes, and later configs that still fit run as usual. The rule
+    is the same with one worker or several. Skipped configs are left for
+    the next --resume run.
+    """
+    workers = max(workers if workers is not None else _env_int("SCRAPE_WORKERS", 1), 1)
+    estimates = estimates or {}
+
+    def fits(config):
+        if deadline is None:
+            return True
+        return time.monotonic() + estimates.get(config["query_id"], 0) <= deadline
+
+    def log_skipped(skipped):
+        if skipped:
+            logger.warning(
+                f"Time budget reached: skipped {len(skipped)} configurations "
+                f"({', '.join(c['query_id'] for c in skipped[:5])}"
+                f"{', ...' if len(skipped) > 5 else ''})"
+            )
+
+    if workers == 1:
+        skipped = []
+        for config in configs:
+            if not fits(config):
+                skipped.append(config)
+                continue
+            scrape_and_save(config, db, writer, registry, report, client)
+        log_skipped(skipped)
+        return
+
+    if site_limits is None:
+        site_limits = _parse_site_limits(os.getenv("SCRAPE_SITE_LIMITS"))
+    pending = list(configs)
+    in_flight = Counter()
+    running = 0
+    changed = threading.Condition()
+
+    def has_capacity(config):
+        return all(
+            in_flight[site] < site_limits[site]
+            for site in _config_sites(config)
+            if site in site_limits
+        )
+
+    def run(config):
+        nonlocal running
+        token = _log_query_id.set(config["query_id"])
+        try:
+            scrape_and_save(config, db, writer, registry, report, client)
+        except Exception as e:
+            logger.error(f"Error scraping {config['query_id']}: {e}")
+        finally:
+            _log_query_id.reset(token)
+            with changed:
+                running -= 1
+                in_flight.subtract(_config_sites(config))
+                changed.notify()
+
+    logger.info(
+        f"Running {len(pending)} configurations with {workers} workers"
+        + (f" and site limits {site_limits}" if site_limits else "")
+    )
+    skipped = []
+    with ThreadPoolExecutor(workers, thread_name_prefix="scrape") as executor:
+        with changed:
+            while pending:
+                for config in [c for c in pending if not fits(c)]:
+                    pending.remove(config)
+                    skipped.append(config)
+                if not pending:
+                    break
+                ready = (
+                    next((c for c in pending if has_capacity(c)), None)
+                    if running < workers
+                    else None
+                )
+                if ready is None:
+                    changed.wait()
+                    continue
+                pending.remove(ready)
+                running += 1
+                in_flight.update(_config_sites(ready))
+                executor.submit(run, ready)
+    log_skipped(skipped)
+
+
+def main(
+    config_group="all",
+    resume=False,
+    resume_window_hours=None,
+    budget_minutes=None,
+    yield_policy=None,
+):
     """Main function to run scraping configurations
 
     Args:
-        config_group: Which config group to run ('all', 'software_engineering', 'data_science', etc.)
+        config_group: Which config group(s) to run: 'all', a group name such as
+            'data_science', or several comma-separated names
+        resume: Skip configs that finished successfully within the last
+            resume_window_hours (RESUME_WINDOW_HOURS, default 20)
+        budget_minutes: Wall-clock budget for the whole run (RUN_BUDGET_MINUTES,
+            default unlimited); results_wanted is scaled to fit and no config
+            starts that is not expected to finish in time
+        yield_policy: Run low-yield queries less often and smaller, see
+            apply_yield_policy (LOW_YIELD_POLICY, default off)
+
+    When the run finishes, a RunReport is written to RUN_REPORT_PATH (default
+    run_report.json, empty to disable) and, if RUN_REPORT_PROMETHEUS_PATH is
+    set, as a Prometheus textfile.
     """
+    started = time.monotonic()
     logger.info(f"Starting job scraping workflow for group: {config_group}")
+    if budget_minutes is None:
+        budget_minutes = _env_int("RUN_BUDGET_MINUTES", 0) or None
 
     # Get database connection string
     db_url = os.getenv("DATABASE_URL")
@@ -884,41 +3151,154 @@ def main(config_group="all"):
         logger.error("DATABASE_URL environment variable not set")
         raise SystemExit("Missing DATABASE_URL secret")
 
-    # Initialize database
+    # Initialize database (one connection pool shared by every config)
     db = JobDatabase(db_url)
+    report = RunReport(config_group)
 
-    max_age_days_str = os.getenv("MAX_JOB_AGE_DAYS", "7")
     try:
-        max_age_days = int(max_age_days_str)
-    except ValueError:
-        logger.error(
-            f"Invalid MAX_JOB_AGE_DAYS value: {max_age_days_str}. Using default 7."
-        )
-        max_age_days = 7
+        max_age_days_str = os.getenv("MAX_JOB_AGE_DAYS", "7")
+        try:
+            max_age_days = int(max_age_days_str)
+        except ValueError:
+            logger.error(
+                f"Invalid MAX_JOB_AGE_DAYS value: {max_age_days_str}. Using default 7."
+            )
+            max_age_days = 7
+
+        db.cleanup_old_jobs(max_age_days)
+
+        # Build a deduplicated plan for the requested group(s)
+        configs = plan_configs(config_group)
+        merged = sum(
+            len(CONFIG_GROUPS[name]) for name in _resolve_groups(config_group)
+        ) - len(configs)
+        if resume:
+            window = (
+                resume_window_hours
+                if resume_window_hours is not None
+                else _env_int("RESUME_WINDOW_HOURS", 20)
+            )
+            finished = db.recently_finished_configs(window)
+            skipped = sum(1 for config in configs if config["query_id"] in finished)
+            configs = [c for c in configs if c["query_id"] not in finished]
+            logger.info(
+                f"Resuming: skipping {skipped} configs finished in the last "
+                f"{window} hours"
+            )
 
-    db.cleanup_old_jobs(max_age_days)
+        if yield_policy is None:
+            yield_policy = os.getenv("LOW_YIELD_POLICY", "false").lower() in (
+                "1",
+                "true",
+                "yes",
+            )
+        if yield_policy:
+            configs = apply_yield_policy(
+                configs, db.query_yields(_env_int("LOW_YIELD_RUNS", 3))
+            )
 
-    # Get the appropriate config group
-    if config_group not in CONFIG_GROUPS:
-        available = ", ".join(CONFIG_GROUPS.keys())
-        logger.error(
-            f"Unknown config group: {config_group}. Available: {available}"
+        logger.info(
+            f"Running {len(configs)} configurations for group '{config_group}' "
+            f"({merged} duplicate configs merged, "
+            f"~{estimate_requests(configs)} requests estimated)"
         )
-        raise SystemExit(f"Unknown config group: {config_group}")
 
-    configs = CONFIG_GROUPS[config_group]
-    logger.info(f"Running {len(configs)} configurations for group '{config_group}'")
+        workers = _env_int("SCRAPE_WORKERS", 1)
+        site_limits = _parse_site_limits(os.getenv("SCRAPE_SITE_LIMITS"))
+        deadline = estimates = None
+        if budget_minutes:
+            deadline = started + budget_minutes * 60
+            configs, estimates = allocate_budget(
+                configs,
+                db.config_cost_estimates(),
+                deadline - time.monotonic(),
+                workers=workers,
+                site_limits=site_limits,
+            )
 
-    # Run scraping configurations
-    for config in configs:
-        scrape_and_save(config, db)
-        # Could track total jobs here if needed
+        # Run scraping configurations, optionally handing results to a
+        # separate writer stage so the next search starts right away
+        pipeline = os.getenv("SCRAPE_PIPELINE", "false").lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+        writer = JobWriter(db, report=report) if pipeline else None
+        registry = JobIdRegistry()
+        # One client for the run, so configs reuse each site's session
+        client = JobSpy(
+            max_age=_env_int("SCRAPER_MAX_AGE_SECONDS", 900),
+            max_uses=_env_int("SCRAPER_MAX_USES", 50),
+        )
+        try:
+            run_configs(
+                configs,
+                db,
+                workers=workers,
+                site_limits=site_limits,
+                writer=writer,
+                registry=registry,
+                deadline=deadline,
+                estimates=estimates,
+                report=report,
+                client=client,
+            )
+        finally:
+            client.close()
+            if writer is not None:
+                writer.close()
+            registry.log_summary()
+    finally:
+        if db.enrichment_cache is not None:
+            cache = db.enrichment_cache
+            logger.info(
+                f"Enrichment cache: {cache.hits} hits, {cache.misses} misses, "
+                f"{len(cache)} entries"
+            )
+        db.close()
+        report.write(
+            os.getenv("RUN_REPORT_PATH", "run_report.json"),
+            os.getenv("RUN_REPORT_PROMETHEUS_PATH"),
+        )
 
     logger.info(f"Job scraping workflow completed for group: {config_group}")
 
 
 if __name__ == "__main__":
-    import sys
-
-    config_group = sys.argv[1] if len(sys.argv) > 1 else "all"
-    main(config_group)
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Scrape jobs into Postgres")
+    parser.add_argument(
+        "groups", nargs="*", default=["all"], help="config groups to run"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="skip configs that finished within the resume window",
+    )
+    parser.add_argument(
+        "--resume-window",
+        type=float,
+        default=None,
+        help="hours a finished config counts as done (RESUME_WINDOW_HOURS)",
+    )
+    parser.add_argument(
+        "--budget-minutes",
+        type=float,
+        default=None,
+        help="wall-clock budget for the run (RUN_BUDGET_MINUTES)",
+    )
+    parser.add_argument(
+        "--yield-policy",
+        action="store_true",
+        default=None,
+        help="run low-yield queries less often (LOW_YIELD_POLICY)",
+    )
+    args = parser.parse_args()
+    main(
+        ",".join(args.groups),
+        args.resume,
+        args.resume_window,
+        args.budget_minutes,
+        args.yield_policy,
+    )
@@ -0,0 +1,50 @@
+import pytest
+
+from main import BUDGET_SAFETY, allocate_budget
+
+
+def configs(count, sites=("linkedin", "indeed"), first=0):
+    return [
+        {
+            "query_id": f"q{first + i}",
+            "site_name": list(sites),
+            "results_wanted": 100,
+            "delay": 0,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize(
+    "site_limits, wanted",
+    [
+        (None, 100),
+        ({"glassdoor": 1}, 100),
+        ({"linkedin": 8}, 100),
+        ({"linkedin": 2}, 50),
+        ({"linkedin": 2, "indeed": 1}, 25),
+    ],
+)
+def test_budget_uses_the_parallelism_site_limits_allow(site_limits, wanted):
+    # Eight configs of 100 seconds each fit 200 seconds on four workers,
+    # but only 400 seconds when two of them may search LinkedIn at a time
+    rates = {f"q{i}": 1.0 for i in range(8)}
+    planned, estimates = allocate_budget(
+        configs(8), rates, 200 / BUDGET_SAFETY, workers=4, site_limits=site_limits
+    )
+    assert [c["results_wanted"] for c in planned] == [wanted] * 8
+    assert estimates["q0"] == pytest.approx(wanted)
+
+
+def test_site_limits_only_slow_the_configs_searching_that_site():
+    # Four Indeed and two LinkedIn configs: 150 seconds on four workers, and
+    # the single LinkedIn slot needs 200 seconds for its two
+    rates = {f"q{i}": 1.0 for i in range(6)}
+    planned, _ = allocate_budget(
+        configs(4, ("indeed",)) + configs(2, ("linkedin",), first=4),
+        rates,
+        200 / BUDGET_SAFETY,
+        workers=4,
+        site_limits={"linkedin": 1},
+    )
+    assert [c["results_wanted"] for c in planned] == [100] * 6
@@ -0,0 +1,137 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from jobspy.classifier import JobLabels, TechTagMatcher, classify, extract_tech_tags
+
+EXAMPLE_JOBS = Path(__file__).with_name("example.json")
+
+# (seniority_level, role_family, position_tag) produced by the original
+# per-pattern implementation in main.JobDatabase for every job in example.json
+EXPECTED_LABELS = {
+    "in-32dcaf7ef4e51523": ("senior", "product", "product-manager"),
+    "in-652001d42850023c": ("entry", None, None),
+    "in-b13df98b00d200ff": ("entry", "data_engineer", "cybersecurity"),
+    "in-ebf6084c639b7737": ("entry", None, None),
+    "in-da76732406d9c32a": ("junior", None, None),
+    "in-d9dcd367f29362d3": ("senior", None, None),
+    "in-d9ce27765e375c40": ("senior", "devops", "devops"),
+    "in-267561a62473c587": ("senior", None, None),
+    "in-bcf5b4756fa717b3": ("senior", None, None),
+    "in-eb721757f71a7e0d": ("senior", None, None),
+    "in-83a1ff065f0648e0": ("entry", "security", "cybersecurity"),
+    "in-0c170f4824be16e2": ("senior", "frontend", "frontend"),
+    "in-8431ecb0b393376e": ("entry", "data_engineer", "cybersecurity"),
+    "in-29691740a8edd415": ("entry", None, None),
+    "in-17acb705edf86df2": ("entry", None, None),
+    "in-d03517ccfe4f04f0": ("mid", None, None),
+    "in-bb8ac06e17e113f7": ("junior", "security", "cybersecurity"),
+    "in-54b3dfc7c6370e2c": ("senior", "security", "cybersecurity"),
+    "in-6e209a7d79039b7d": ("junior", "security", "cybersecurity"),
+    "in-5f467ce3c2456b77": ("junior", None, None),
+    "in-f31d811edf3f0f87": ("senior", "devops", "devops"),
+    "in-ab848100d9a8b178": ("junior", None, None),
+    "in-3abfe26f0c0c0988": ("junior", None, None),
+    "in-8609149956fdf8ee": ("senior", None, None),
+    "in-327ae7c034e122e0": ("senior", None, None),
+    "in-a995a4b5bcfda7ff": ("senior", "data_engineer", "devops"),
+    "in-c0bf6785cdc981c3": ("mid", "product", "product-manager"),
+    "in-e51a2087ba2fba0a": ("senior", "security", "cybersecurity"),
+    "in-ce8531b65fd2ce67": ("senior", "devops", "devops"),
+    "in-5464e2639d4156f0": ("entry", None, None),
+    "in-2f5900f7c4a79115": ("senior", None, None),
+    "in-c20562ef9ae32a4d": ("entry", None, None),
+    "in-6963ae0a0bee1b02": ("junior", None, None),
+    "in-d42ac608cd3bf9d6": ("senior", "security", "cybersecurity"),
+    "in-5f0967ae44053284": ("senior", "security", "cybersecurity"),
+    "in-b6c2d219f18e080d": ("senior", "devops", "devops"),
+    "in-a50558545cdbe4b6": ("mid", None, None),
+    "in-ef822a467652b289": ("mid", "data_scientist", "data-scientist"),
+    "in-7dc930e336c57749": ("junior", None, None),
+    "in-59eeec8a5ad7a7f4": ("senior", None, None),
+    "in-8e365d05d2cdad4a": ("mid", "product", "product-manager"),
+    "in-32439231f95f2692": ("senior", None, None),
+    "in-a2891980eb75d192": ("senior", "devops", "devops"),
+    "in-de9dcd3755c74a39": ("senior", "data_engineer", "cybersecurity"),
+    "in-76e4f0c1784eb68b": ("mid", None, None),
+    "in-2ce609e24a4c3a82": ("senior", "security", "cybersecurity"),
+    "in-b51ffb4a44b83114": ("mid", "security", "cybersecurity"),
+    "in-7300fb50ff00d230": ("senior", "devops", "fullstack"),
+    "in-7507b9ea73791e41": ("senior", None, None),
+    "in-7a2bddd17c8b868c": ("senior", None, None),
+}
+
+
+def test_classify_matches_golden_labels():
+    jobs = json.loads(EXAMPLE_JOBS.read_text())
+    assert {job["id"] for job in jobs} == set(EXPECTED_LABELS)
+    for job in jobs:
+        labels = classify(job["title"], job["description"])
+        assert labels == JobLabels(*EXPECTED_LABELS[job["id"]]), job["id"]
+
+
+def test_classify_precedence():
+    cases = [
+        # frontend + backend signals collapse into fullstack
+        (("Senior Frontend Engineer", "react and django"), "position_tag", "fullstack"),
+        # mobile wins over the overlapping frontend "react" match
+        (("Software Engineer", "we use react native"), "position_tag", "mobile"),
+        # generic titles are classified from the description only
+        (("Software Engineer", "payments team"), "position_tag", None),
+        (("Junior Staff Engineer", None), "seniority_level", "junior"),
+        (("Backend Developer", "7+ years of experience"), "seniority_level", "senior"),
+        # "engineer 3" hits the mid-level rule before years are considered
+        (("Engineer", "3-7 years of experience"), "seniority_level", "mid"),
+        ((None, None), "role_family", None),
+    ]
+    for (title, description), field, expected in cases:
+        assert getattr(classify(title, description), field) == expected, title
+
+
+def _naive_tech_tags(matcher, title, description):
+    text = f"{title or ''} {description or ''}".lower()
+    tags = {
+        tag
+        for tag, needles in matcher.tags.items()
+        if any(needle in text for needle in needles)
+    }
+    if not tags:
+        return None, None
+    language = next((lang for lang in matcher.language_order if lang in tags), None)
+    return language, ",".join(sorted(tags))
+
+
+@pytest.mark.parametrize("trie_min_needles", [1, 10_000])
+def test_tech_tags_match_substring_semantics(trie_min_needles):
+    matcher = TechTagMatcher.from_file()
+    scanner = TechTagMatcher(
+        matcher.tags, matcher.language_order, trie_min_needles=trie_min_needles
+    )
+    jobs = json.loads(EXAMPLE_JOBS.read_text())
+    cases = [(job["title"], job["description"]) for job in jobs] + [
+        # overlapping needles sharing a start: "rails" inside "ruby on rails"
+        ("Ruby on Rails Dev", None),
+        ("Postgresql DBA", "node.js / NodeJS, golang"),
+        (None, " go java ts js c++ c# .net"),
+        (None, None),
+    ]
+    for title, description in cases:
+        expected = _naive_tech_tags(matcher, title, description)
+        assert scanner.extract(title, description) == expected, title
+        assert extract_tech_tags(title, description) == expected, title
+
+
+@pytest.mark.parametrize("trie_min_needles", [1, 10_000])
+def test_tech_tags_dictionary_is_data_driven(trie_min_needles):
+    matcher = TechTagMatcher(
+        {"spring": ["spring boot"], "boot": ["spring"], "elixir": ["elixir"]},
+        ["elixir"],
+        trie_min_needles=trie_min_needles,
+    )
+    assert matcher.extract("Spring Boot / Elixir", None) == (
+        "elixir",
+        "boot,elixir,spring",
+    )
+    assert matcher.extract("Plumber", "spring") == (None, "boot")
+    assert TechTagMatcher({}, []).extract("python", None) == (None, None)
@@ -0,0 +1,151 @@
+import threading
+import time
+
+import pytest
+
+from conftest import SEARCH
+from jobspy import JobSpy, scrape_jobs
+from jobspy.model import JobPost, Scraper, Site
+
+
+class FakeSession:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class CountingScraper(Scraper):
+    """One job per search; fails, finds nothing or waits at a barrier on
+    request. Keeps every session it built in `sessions`."""
+
+    built = 0
+    fail = False
+    empty = False
+    release = None
+    sessions = None
+
+    def __init__(self, proxies=None, ca_cert=None, user_agent=None):
+        super().__init__(Site.INDEED)
+        type(self).built += 1
+        self.number = self.built
+        self.session = FakeSession()
+        if self.sessions is None:
+            type(self).sessions = []
+        self.sessions.append(self.session)
+
+    def scrape_pages(self, scraper_input):
+        if self.release is not None:
+            self.release.wait(5)
+        if self.fail:
+            raise RuntimeError("blocked")
+        if self.empty:
+            return
+        yield [
+            JobPost(
+                title="Engineer",
+                company_name="Acme",
+                job_url=f"https://example.com/{self.number}",
+                location=None,
+            )
+        ]
+
+    def scrape(self, scraper_input):
+        raise AssertionError("scrape_jobs should stream pages")
+
+
+@pytest.fixture
+def fake(fake_indeed):
+    return fake_indeed(CountingScraper)
+
+
+def search(client, **kwargs):
+    return client.scrape(site_name="indeed", country_indeed="germany", **kwargs)
+
+
+def test_client_reuses_scrapers(fake):
+    client = JobSpy()
+    for _ in range(3):
+        assert search(client)["job_url"].tolist() == ["https://example.com/1"]
+    assert fake.built == 1
+
+    scrape_jobs(site_name="indeed", country_indeed="germany")
+    scrape_jobs(site_name="indeed", country_indeed="germany")
+    assert fake.built == 3
+
+
+def test_scrapers_are_rebuilt_after_max_uses_and_max_age(fake):
+    client = JobSpy(max_uses=2)
+    for _ in range(5):
+        search(client)
+    assert fake.built == 3
+
+    client = JobSpy(max_age=0)
+    search(client)
+    search(client)
+    assert fake.built == 5
+
+
+def test_scrapers_are_rebuilt_after_failures(fake):
+    client = JobSpy()
+    fake.fail = True
+    with pytest.raises(RuntimeError, match="blocked"):
+        search(client)
+    fake.fail = False
+    fake.empty = True
+    assert search(client).empty
+    fake.empty = False
+    search(client)
+    search(client)
+    assert fake.built == 3
+
+
+def test_concurrent_calls_get_their_own_scrapers(fake):
+    client = JobSpy()
+    # Each call's scraper waits until the other call's is running too
+    fake.release = threading.Barrier(2)
+    threads = [threading.Thread(target=search, args=(client,)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert fake.built == 2
+
+    fake.release = None
+    search(client)
+    assert fake.built == 2
+
+
+def test_discarded_scrapers_close_their_sessions(fake):
+    client = JobSpy(max_uses=2)
+    search(client)
+    assert [s.closed for s in fake.sessions] == [False]
+    search(client)  # spent after two uses
+    assert [s.closed for s in fake.sessions] == [True]
+
+    fake.fail = True
+    with pytest.raises(RuntimeError, match="blocked"):
+        search(client)
+    assert [s.closed for s in fake.sessions] == [True, True]
+
+    fake.fail = False
+    search(client)
+    client.close()
+    assert all(s.closed for s in fake.sessions)
+
+    client = JobSpy(max_age=0.2)
+    search(client)
+    time.sleep(0.3)
+    search(client)  # the first scraper expired while idle
+    assert [s.closed for s in fake.sessions[-2:]] == [True, False]
+
+
+def test_reused_sites_find_every_job_again(boards):
+    client = JobSpy()
+    first = client.scrape(**SEARCH)
+    second = client.scrape(**SEARCH)
+
+    assert len(first) == 24
+    assert second.equals(first)
+    assert len(client._idle[Site.LINKEDIN]) == len(client._idle[Site.INDEED]) == 1
@@ -0,0 +1,90 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from jobspy.metrics import ScrapeMetrics, count
+from jobspy.util import create_session
+from main import RunReport, WriteTimings
+
+
+class StubSite(ThreadingHTTPServer):
+    """Answers every other request with a 429, the rest with 1000 bytes"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.hits = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.hits += 1
+        body = b"" if self.server.hits % 2 else b"x" * 1000
+        self.send_response(429 if self.server.hits % 2 else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    server = StubSite()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_sessions_count_requests_retries_and_429s(site):
+    metrics = ScrapeMetrics()
+    session = create_session(is_tls=False, has_retry=True, delay=0)
+    with metrics.recording("linkedin"):
+        count("search_pages")
+        assert session.get(site.url).status_code == 200
+    # Outside recording() nothing is counted
+    session.get(site.url)
+
+    counters = metrics.sites()["linkedin"]
+    assert counters["search_pages"] == 1
+    assert counters["requests"] == 1
+    assert counters["retries"] == 1
+    assert counters["rate_limited"] == 1
+    assert counters["bytes_downloaded"] == 1000
+    assert counters["network_seconds"] > 0
+
+
+def test_run_report_sums_configs_and_sites(tmp_path):
+    report = RunReport("data")
+    for query_id in ("a", "b"):
+        metrics = ScrapeMetrics()
+        with metrics.recording("indeed"):
+            count("search_pages", 2)
+            count("rate_limited")
+        report.record_scrape(query_id, metrics, 1.5, 10, 8)
+        report.record_write(query_id, WriteTimings(0.25, 0.5), 3)
+    report.record_error("b", "boom")
+
+    path = tmp_path / "report.json"
+    prom_path = tmp_path / "report.prom"
+    report.write(str(path), str(prom_path))
+
+    summary = json.loads(path.read_text())
+    assert summary["configs_run"] == 2
+    assert summary["configs_failed"] == 1
+    assert summary["sites"]["indeed"]["search_pages"] == 4
+    assert summary["totals"]["scrape_seconds"] == 3.0
+    assert summary["totals"]["jobs_inserted"] == 6
+    assert summary["configs"]["a"]["sites"]["indeed"]["rate_limited"] == 1
+    prom = prom_path.read_text()
+    assert 'jobspy_site_rate_limited{group="data",site="indeed"} 2' in prom
+    assert 'jobspy_run_stage_seconds{group="data",stage="insert"} 1' in prom
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+
+import pandas as pd
+
+import jobspy
+from conftest import SEARCH
+from jobspy import scrape_jobs, scrape_jobs_async
+from jobspy.metrics import ScrapeMetrics
+from jobspy.model import JobResponse, Scraper, Site
+
+
+def test_async_matches_scrape_jobs(boards):
+    metrics = ScrapeMetrics()
+    jobs = asyncio.run(scrape_jobs_async(**SEARCH, metrics=metrics))
+
+    assert (jobs["site"] == "linkedin").sum() == 12
+    assert (jobs["site"] == "indeed").sum() == 12
+    assert jobs["description"].str.startswith("Build things").sum() == 12
+    pd.testing.assert_frame_equal(jobs, scrape_jobs(**SEARCH))
+
+    counters = metrics.sites()
+    assert counters["linkedin"]["search_pages"] == 2
+    assert counters["linkedin"]["detail_fetches"] == 12
+    assert counters["indeed"]["search_pages"] == 3
+    assert counters["indeed"]["requests"] == 3
+
+
+def test_job_pages_fetched_concurrently_up_to_the_limit(boards):
+    search = {**SEARCH, "site_name": "linkedin", "results_wanted": 25}
+    jobs = asyncio.run(scrape_jobs_async(**search, max_concurrency=4))
+
+    assert len(jobs) == 25
+    assert boards.peak_in_flight == 4
+
+
+def test_timeout_keeps_the_pages_found(boards):
+    boards.hang_start = 10
+    search = {**SEARCH, "site_name": "linkedin", "results_wanted": 25}
+    started = time.perf_counter()
+    jobs = asyncio.run(scrape_jobs_async(**search, timeout=0.5))
+
+    assert len(jobs) == 10
+    assert time.perf_counter() - started < 2
+
+
+def test_request_timeout_ends_the_site(boards):
+    boards.hang_start = 10
+    search = {**SEARCH, "site_name": "linkedin", "results_wanted": 25}
+    jobs = asyncio.run(scrape_jobs_async(**search, request_timeout=0.3))
+
+    assert len(jobs) == 10
+
+
+def test_timed_out_requests_stop_and_free_their_slot(boards):
+    boards.detail_seconds = 1
+    search = {**SEARCH, "site_name": "linkedin", "results_wanted": 25}
+    started = time.perf_counter()
+    jobs = asyncio.run(
+        scrape_jobs_async(**search, max_concurrency=2, request_timeout=0.2)
+    )
+
+    # 25 job pages, two at a time, each given up on (not retried) after 0.2s
+    assert len(jobs) == 25
+    assert jobs["description"].isna().all()
+    assert time.perf_counter() - started < 6
+    # and no request thread outlives the call by more than its wake-up
+    for _ in range(50):
+        if not [t for t in threading.enumerate() if t.name.startswith("jobspy-")]:
+            break
+        time.sleep(0.02)
+    else:
+        raise AssertionError("request threads still running")
+
+
+def test_timeout_does_not_wait_for_blocking_scrapers(monkeypatch):
+    release = threading.Event()
+
+    class Blocking(Scraper):
+        def __init__(self, proxies=None, ca_cert=None, user_agent=None):
+            super().__init__(Site.GOOGLE)
+
+        def scrape(self, scraper_input):
+            release.wait(3)
+            return JobResponse(jobs=[])
+
+    monkeypatch.setitem(jobspy.SCRAPER_MAPPING, Site.GOOGLE, Blocking)
+    started = time.perf_counter()
+    try:
+        jobs = asyncio.run(scrape_jobs_async(site_name="google", timeout=0.3))
+        assert time.perf_counter() - started < 1
+        assert jobs.empty
+    finally:
+        release.set()
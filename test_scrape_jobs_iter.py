@@ -0,0 +1,106 @@
+import threading
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+import jobspy
+from jobspy import scrape_jobs, scrape_jobs_iter
+from jobspy.model import JobPost, Scraper, Site
+from jobspy.util import desired_order
+
+
+class FakeScraper(Scraper):
+    """Yields `pages` pages of three jobs; waits for `release` before each
+    page after the first, if set, and can fail instead of the second page.
+    Sets `closed` once it stops, if set."""
+
+    pages = 3
+    release = None
+    closed = None
+    fail = False
+    pages_started = 0
+
+    def __init__(self, proxies=None, ca_cert=None, user_agent=None):
+        super().__init__(Site.INDEED)
+
+    def scrape(self, scraper_input):
+        raise AssertionError("scrape_jobs should stream pages")
+
+    def scrape_pages(self, scraper_input):
+        try:
+            yield from self._pages()
+        finally:
+            if self.closed is not None:
+                self.closed.set()
+
+    def _pages(self):
+        for page in range(self.pages):
+            if page and self.release is not None:
+                self.release.wait(5)
+            if page and self.fail:
+                raise RuntimeError("blocked")
+            type(self).pages_started += 1
+            yield [
+                JobPost(
+                    id=f"in-{page}-{i}",
+                    title=f"Engineer {page}-{i}",
+                    company_name="Acme" if i else None,
+                    job_url=f"https://example.com/{page}-{i}",
+                    location=None,
+                    description="Build things",
+                    date_posted=date.today() - timedelta(days=i),
+                    is_remote=bool(i % 2),
+                )
+                for i in range(3)
+            ]
+
+
+@pytest.fixture
+def fake(fake_indeed):
+    return fake_indeed(FakeScraper)
+
+
+def test_iter_batches_match_scrape_jobs(fake):
+    batches = list(scrape_jobs_iter(site_name="indeed", country_indeed="germany"))
+    assert len(batches) == 3
+    assert all(list(batch.columns) == desired_order for batch in batches)
+
+    jobs = scrape_jobs(site_name="indeed", country_indeed="germany")
+    rows = [row for batch in batches for row in batch.to_dict("records")]
+    pd.testing.assert_frame_equal(jobs, jobspy._jobs_dataframe(rows))
+
+
+def test_iter_yields_before_site_finishes_and_stops_early(fake):
+    fake.pages = 10
+    fake.release = threading.Event()
+    fake.closed = threading.Event()
+    pages = scrape_jobs_iter(site_name="indeed", country_indeed="germany")
+    # The first page arrives while the scraper waits to fetch the second
+    first = next(pages)
+    assert len(first) == 3
+    pages.close()
+    fake.release.set()
+    assert fake.closed.wait(5)
+    # The page in flight when the caller stopped is the last one fetched
+    assert fake.pages_started == 2
+
+
+def test_iter_buffers_a_bounded_number_of_pages(fake):
+    fake.pages = 50
+    fake.closed = threading.Event()
+    pages = scrape_jobs_iter(site_name="indeed", country_indeed="germany")
+    next(pages)
+    # The scraper fills the buffer, then waits instead of running ahead
+    assert not fake.closed.wait(0.5)
+    assert fake.pages_started <= 4
+    pages.close()
+    assert fake.closed.wait(5)
+
+
+def test_iter_raises_site_errors(fake):
+    fake.fail = True
+    pages = scrape_jobs_iter(site_name="indeed", country_indeed="germany")
+    assert len(next(pages)) == 3
+    with pytest.raises(RuntimeError, match="blocked"):
+        next(pages)
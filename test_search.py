@@ -0,0 +1,85 @@
+import os
+from datetime import date, timedelta
+
+import pytest
+
+from main import JobDatabase
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("TEST_DATABASE_URL"), reason="TEST_DATABASE_URL not set"
+)
+
+# A token no real posting contains, so the tests only see their own rows
+MARKER = "zqxsearchtest"
+
+
+@pytest.fixture
+def db():
+    db = JobDatabase(os.environ["TEST_DATABASE_URL"])
+    today = date.today()
+    rows = [
+        (
+            f"test-search-{i}",
+            f"Backend Engineer {i}",
+            "Acme_Corp" if i % 2 else "Globex",
+            f"Build APIs with {'python' if i % 3 else 'java'} {MARKER}",
+            "backend" if i < 6 else "frontend",
+            "senior" if i % 2 else "mid",
+            "Germany" if i < 4 else "Netherlands",
+            today - timedelta(days=i % 4),
+        )
+        for i in range(10)
+    ]
+    with db.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM jobs WHERE id LIKE 'test-search-%'")
+            cur.executemany(
+                "INSERT INTO jobs (id, title, company, description, position_tag, "
+                "seniority_level, country_normalized, date_posted) "
+                "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)",
+                rows,
+            )
+            conn.commit()
+    yield db
+    with db.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM jobs WHERE id LIKE 'test-search-%'")
+            conn.commit()
+    db.close()
+
+
+def test_search_pages_newest_first_without_gaps(db):
+    seen = []
+    after = None
+    while True:
+        page = db.search_jobs(MARKER, limit=3, after=after)
+        seen.extend(page.jobs)
+        if page.after is None:
+            break
+        after = page.after
+
+    assert sorted(job["id"] for job in seen) == sorted(
+        f"test-search-{i}" for i in range(10)
+    )
+    keys = [(job["date_posted"], job["id"]) for job in seen]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_search_filters(db):
+    page = db.search_jobs(
+        f"{MARKER} python -java",
+        {
+            "position_tag": "backend",
+            "seniority_level": ["senior"],
+            "country_normalized": "Germany",
+            "posted_since": date.today() - timedelta(days=2),
+        },
+    )
+    assert [job["id"] for job in page.jobs] == ["test-search-1"]
+
+    page = db.search_jobs(MARKER, {"company": "acme_"}, limit=50)
+    assert {job["company"] for job in page.jobs} == {"Acme_Corp"}
+    assert len(page.jobs) == 5
+
+    with pytest.raises(ValueError):
+        db.search_jobs(MARKER, {"salary": 100})
@@ -0,0 +1,181 @@
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import pytest
+
+from main import JobDatabase, Translator
+
+
+class StubDeepL(ThreadingHTTPServer):
+    """Minimal DeepL /v2/translate: upper-cases every ``text`` field"""
+
+    daemon_threads = True
+
+    def __init__(self, delay=0.0, status=200):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.delay = delay
+        self.status = status
+        self.requests = []
+        self.body_sizes = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/v2/translate"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+            server.body_sizes.append(len(body))
+            form = parse_qs(body)
+            server.requests.append((self.headers["Authorization"], form))
+            time.sleep(server.delay)
+            payload = {
+                "translations": [
+                    {"detected_source_language": "DE", "text": text.upper()}
+                    for text in form["text"]
+                ]
+            }
+            data = json.dumps(payload).encode()
+            self.send_response(server.status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(**kwargs):
+        server = StubDeepL(**kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_translate_batches_and_dedupes(stub):
+    server = stub()
+    translator = Translator("key", api_url=server.url, batch_size=3)
+    try:
+        texts = ["eins", "zwei", "eins", None, "drei", "vier", "", "zwei"]
+        result = translator.translate(texts, "EN")
+    finally:
+        translator.close()
+
+    assert result == ["EINS", "ZWEI", "EINS", None, "DREI", "VIER", None, "ZWEI"]
+    sent = [form["text"] for _, form in server.requests]
+    assert sorted(len(batch) for batch in sent) == [1, 3]
+    assert sorted(text for batch in sent for text in batch) == [
+        "drei",
+        "eins",
+        "vier",
+        "zwei",
+    ]
+    assert all(auth == "DeepL-Auth-Key key" for auth, _ in server.requests)
+    assert all(form["target_lang"] == ["EN"] for _, form in server.requests)
+
+
+def test_translate_caps_batches_by_encoded_body_size(stub):
+    server = stub()
+    translator = Translator("key", api_url=server.url)
+    # 15k characters each, but every "ü" url-encodes to 6 bytes
+    texts = [f"{i} " + "ü" * 15_000 for i in range(3)] + ["kurz", "klein"]
+    try:
+        result = translator.translate(texts)
+    finally:
+        translator.close()
+
+    assert result == [text.upper() for text in texts]
+    assert len(server.requests) == 3
+    assert max(server.body_sizes) <= Translator.MAX_BATCH_BYTES
+
+
+def test_translate_bounds_concurrency(stub):
+    server = stub(delay=0.05)
+    translator = Translator("key", api_url=server.url, batch_size=1, concurrency=2)
+    try:
+        result = translator.translate([f"text {i}" for i in range(8)])
+    finally:
+        translator.close()
+
+    assert result == [f"TEXT {i}" for i in range(8)]
+    assert len(server.requests) == 8
+    assert server.max_in_flight == 2
+
+
+def test_translate_api_error_returns_none(stub):
+    server = stub(status=456)
+    translator = Translator("key", api_url=server.url)
+    try:
+        assert translator.translate(["hallo", "welt"]) == [None, None]
+    finally:
+        translator.close()
+
+
+@pytest.mark.skipif(
+    not os.getenv("TEST_DATABASE_URL"), reason="TEST_DATABASE_URL not set"
+)
+def test_translate_jobs_uses_postgres_cache(stub, monkeypatch):
+    server = stub()
+    monkeypatch.setenv("TRANSLATION_ENABLED", "true")
+    monkeypatch.setenv("DEEPL_API_KEY", "key")
+    monkeypatch.setenv("DEEPL_API_URL", server.url)
+    db = JobDatabase(os.environ["TEST_DATABASE_URL"])
+    texts = ["Entwickler", "Beschreibung"]
+    try:
+        with db.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM jobs WHERE id = 'test-translation'")
+                cur.execute(
+                    "DELETE FROM translations WHERE content_hash = ANY(%s)",
+                    ([Translator.content_hash(t) for t in texts],),
+                )
+                cur.execute(
+                    "INSERT INTO jobs (id, title, description) "
+                    "VALUES ('test-translation', 'Entwickler', 'Beschreibung')"
+                )
+                conn.commit()
+
+        db.translator.translate_jobs_async(
+            [("test-translation", "Entwickler", "Beschreibung")]
+        )
+        db.translator.wait()
+        assert db._translate_text("Entwickler") == "ENTWICKLER"
+        assert len(server.requests) == 1
+
+        with db.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT title_translated, description_translated FROM jobs "
+                    "WHERE id = 'test-translation'"
+                )
+                assert cur.fetchone() == ("ENTWICKLER", "BESCHREIBUNG")
+                cur.execute("DELETE FROM jobs WHERE id = 'test-translation'")
+                conn.commit()
+    finally:
+        db.close()